@@ -1,17 +1,154 @@
 import requests
 import json
+import time
 import logging
-from typing import Dict, Any, Optional, Union
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+from typing import Dict, Any, Optional
+from urllib.parse import urlsplit
+from requests.adapters import HTTPAdapter
+from api.api_response import ApiResponse, StreamingListResponse
+from api.cassette import Cassette, CassetteAdapter, CassetteMiss, CassetteNormalizer, PASSTHROUGH
+from api.retry import RetryPolicy, HedgePolicy, IDEMPOTENT_METHODS
+from api.latency import LatencyRecorder, latency_recorder, connect_timer, instrument_adapter
+from api.schemas import SchemaRegistry
+from api.rate_limit import RateLimiter
+from api.response_cache import ResponseCache, StaleCacheError, OFF as CACHE_OFF
+from config.config import Config
 from utils.logger import api_logger
+from utils.tracing import Tracer, tracer as default_tracer
 
 class ApiClient:
     """Base API client for making HTTP requests."""
     
-    def __init__(self, base_url: str):
+    def __init__(self, base_url: str, api_mode: str = PASSTHROUGH, cassette: Optional[Cassette] = None,
+                 normalizer: Optional[CassetteNormalizer] = None, latency: Optional[LatencyRecorder] = None,
+                 schemas: Optional[SchemaRegistry] = None, rate_limiter: Optional[RateLimiter] = None,
+                 tracer: Optional[Tracer] = None, response_cache: Optional[ResponseCache] = None):
         self.base_url = base_url
+        self.api_mode = api_mode
+        self.cassette = cassette
         self.session = requests.Session()
         self.logger = logging.getLogger(__name__)
+        self.warmed_connections = 0
+        self._warmup_requests = 0
+        self.timeouts = {path: Config.get_timeout(path) for path in Config.API_ENDPOINTS.values()}
+        self.retry_policy = RetryPolicy(
+            max_attempts=Config.API_RETRY_ATTEMPTS,
+            base_delay=Config.API_RETRY_BASE_DELAY,
+            max_delay=Config.API_RETRY_MAX_DELAY
+        )
+        self.hedge_policy = HedgePolicy(
+            percentile=Config.API_HEDGE_PERCENTILE,
+            min_samples=Config.API_HEDGE_MIN_SAMPLES
+        ) if Config.API_HEDGE_ENABLED else None
+        self._hedge_executor: Optional[ThreadPoolExecutor] = None
+        self.latency = latency if latency is not None else latency_recorder
+        self.schemas = schemas if schemas is not None else SchemaRegistry(
+            mode=Config.API_SCHEMA_MODE,
+            sample_rate=Config.API_SCHEMA_SAMPLE_RATE
+        )
+        # Replayed cassettes never reach the server, so they are not rate limited
+        if rate_limiter is None and api_mode == PASSTHROUGH:
+            rate_limiter = RateLimiter.for_host(
+                base_url, Config.API_RATE_LIMITS, Config.API_RATE_LIMIT_DIR, burst=Config.API_RATE_LIMIT_BURST
+            )
+        self.rate_limiter = rate_limiter
+        self.tracer = tracer if tracer is not None else default_tracer
+        if response_cache is None and Config.API_CACHE_MODE != CACHE_OFF:
+            response_cache = ResponseCache(
+                mode=Config.API_CACHE_MODE,
+                max_entries=Config.API_CACHE_MAX_ENTRIES,
+                endpoints=Config.API_CACHE_ENDPOINTS,
+                verify_rate=Config.API_CACHE_VERIFY_RATE
+            )
+        self.response_cache = response_cache
         self._setup_logging()
+        
+        if not Config.API_KEEP_ALIVE:
+            self.session.headers["Connection"] = "close"
+        
+        pool_settings = {
+            "pool_connections": Config.API_POOL_CONNECTIONS,
+            "pool_maxsize": Config.API_POOL_MAXSIZE,
+            "pool_block": Config.API_POOL_BLOCK,
+            "max_retries": Config.API_ADAPTER_MAX_RETRIES
+        }
+        if api_mode != PASSTHROUGH:
+            if cassette is None:
+                raise ValueError(f"api_mode '{api_mode}' requires a cassette")
+            self.adapter = CassetteAdapter(cassette, normalizer, **pool_settings)
+        else:
+            self.adapter = HTTPAdapter(**pool_settings)
+        instrument_adapter(self.adapter)
+        self.session.mount("http://", self.adapter)
+        self.session.mount("https://", self.adapter)
+    
+    def close(self) -> None:
+        """Close the session and flush any cassette being recorded."""
+        if self._hedge_executor is not None:
+            self._hedge_executor.shutdown(wait=True)
+            self._hedge_executor = None
+        self.session.close()
+        if self.rate_limiter is not None:
+            self.rate_limiter.close()
+        if self.cassette is not None:
+            self.cassette.close()
+    
+    def warmup(self, connections: int) -> int:
+        """Open up to ``connections`` pooled connections to the API host ahead of the first request.
+        
+        Sends HEAD requests to ``base_url`` whose streamed responses are held open,
+        so each one needs a connection of its own; reading them to the end then
+        returns every connection to the pool.
+        
+        Returns:
+            Number of connections opened
+        """
+        if self.api_mode != PASSTHROUGH or connections <= 0:
+            return 0
+        pool = self._connection_pool()
+        opened_before = pool.num_connections
+        held = []
+        try:
+            for _ in range(min(connections, Config.API_POOL_MAXSIZE)):
+                held.append(self.session.head(self.base_url, stream=True, timeout=Config.get_timeout("")))
+        except requests.exceptions.RequestException as e:
+            self.logger.warning(f"Connection warmup to {urlsplit(self.base_url).netloc} stopped early: {e}")
+        for response in held:
+            response.content
+        opened = pool.num_connections - opened_before
+        self.warmed_connections += opened
+        self._warmup_requests += len(held)
+        return opened
+    
+    def _connection_pool(self):
+        """The urllib3 pool requests will send to ``base_url`` through."""
+        # requests >= 2.32 keys pools by the TLS settings (including REQUESTS_CA_BUNDLE),
+        # so a pool looked up by URL alone is not the one requests sends through
+        if hasattr(self.adapter, "get_connection_with_tls_context"):
+            settings = self.session.merge_environment_settings(self.base_url, {}, None, None, None)
+            return self.adapter.get_connection_with_tls_context(
+                requests.Request("GET", self.base_url).prepare(),
+                verify=settings["verify"], proxies=settings["proxies"], cert=settings["cert"]
+            )
+        return self.adapter.get_connection(self.base_url)
+    
+    def connection_stats(self) -> Dict[str, int]:
+        """Report requests sent versus new connections (TCP/TLS handshakes) opened."""
+        pools = self.adapter.poolmanager.pools
+        requests_sent = handshakes = 0
+        for key in pools.keys():
+            pool = pools.get(key)
+            if pool is not None:
+                requests_sent += pool.num_requests
+                handshakes += pool.num_connections
+        requests_sent -= self._warmup_requests
+        return {
+            "requests": requests_sent,
+            "new_connections": handshakes,
+            "warmed_connections": self.warmed_connections,
+            "reused": max(0, requests_sent - (handshakes - self.warmed_connections))
+        }
     
     def _setup_logging(self):
         formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
@@ -21,153 +158,281 @@ class ApiClient:
         self.logger.addHandler(console_handler)
         self.logger.setLevel(logging.INFO)
     
-    def _process_response(self, response: requests.Response) -> requests.Response:
+    def _process_response(self, response: ApiResponse) -> ApiResponse:
         """Extract responseCode from the response if available."""
         try:
             data = response.json()
             if "responseCode" in data:
                 response.response_code = data["responseCode"]
                 self.logger.info(f"Response contains responseCode: {response.response_code}")
-        except (ValueError, KeyError, AttributeError):
+        except (ValueError, KeyError, TypeError):
             # If cannot parse JSON or no responseCode, don't set response_code
             pass
         
         return response
     
-    def get(self, endpoint: str, params: Optional[Dict[str, Any]] = None) -> requests.Response:
+    def _request(self, method: str, endpoint: str, params: Optional[Dict[str, Any]] = None,
+                 data: Optional[Dict[str, Any]] = None, json_data: Optional[Dict[str, Any]] = None) -> ApiResponse:
+        """Send a request, decoding the body once for logging and the caller."""
         url = f"{self.base_url}/{endpoint.lstrip('/')}"
         
-        api_logger.log_request(
-            method="GET",
+        correlation_id = api_logger.log_request(
+            method=method,
             url=url,
-            params=params
+            params=params,
+            data=data,
+            json_data=json_data
         )
         
         try:
-            response = self.session.get(url, params=params)
+            response = ApiResponse.from_response(
+                self._send(method, endpoint, url, correlation_id, params=params, data=data, json=json_data)
+            )
             
             try:
-                response_json = response.json()
                 api_logger.log_response(
                     status_code=response.status_code,
                     url=url,
-                    headers=dict(response.headers),
-                    response_json=response_json
+                    headers=response.headers,
+                    response_json=response.json(),
+                    correlation_id=correlation_id,
+                    elapsed_ms=response.elapsed.total_seconds() * 1000
                 )
             except ValueError:
                 api_logger.log_response(
                     status_code=response.status_code,
                     url=url,
-                    headers=dict(response.headers),
-                    response_text=response.text
+                    headers=response.headers,
+                    response_text=response.text,
+                    correlation_id=correlation_id,
+                    elapsed_ms=response.elapsed.total_seconds() * 1000
                 )
             
             response = self._process_response(response)
+            if response.is_json:
+                response.schema_errors = self.schemas.validate(endpoint, response.json())
             return response
         except Exception as e:
-            api_logger.log_error(e, url)
+            api_logger.log_error(e, url, correlation_id)
             raise
     
-    def post(self, endpoint: str, data: Optional[Dict[str, Any]] = None, json_data: Optional[Dict[str, Any]] = None) -> requests.Response:
-        url = f"{self.base_url}/{endpoint.lstrip('/')}"
-        
-        api_logger.log_request(
-            method="POST",
-            url=url,
-            data=data,
-            json_data=json_data
-        )
+    def _send(self, method: str, endpoint: str, url: str, correlation_id: Optional[str], **kwargs) -> requests.Response:
+        """Send with the endpoint's timeouts, retrying and hedging idempotent calls."""
+        kwargs["timeout"] = self.timeouts.get(endpoint.lstrip("/")) or Config.get_timeout(endpoint)
+        if method not in IDEMPOTENT_METHODS:
+            return self._timed_request(method, endpoint, url, **kwargs)
         
-        try:
-            response = self.session.post(url, data=data, json=json_data)
-            
+        attempt = 0
+        while True:
             try:
-                response_json = response.json()
-                api_logger.log_response(
-                    status_code=response.status_code,
-                    url=url,
-                    headers=dict(response.headers),
-                    response_json=response_json
-                )
-            except ValueError:
-                api_logger.log_response(
-                    status_code=response.status_code,
-                    url=url,
-                    headers=dict(response.headers),
-                    response_text=response.text
-                )
+                response = self._send_hedged(method, endpoint, url, correlation_id, **kwargs)
+                if response.status_code not in self.retry_policy.status_forcelist:
+                    return response
+                reason = f"HTTP {response.status_code}"
+                if not self.retry_policy.should_retry(attempt):
+                    return response
+            except CassetteMiss:
+                raise
+            except (requests.exceptions.ConnectionError, requests.exceptions.Timeout) as e:
+                if not self.retry_policy.should_retry(attempt):
+                    raise
+                reason = f"{type(e).__name__}: {e}"
             
-            response = self._process_response(response)
-            return response
-        except Exception as e:
-            api_logger.log_error(e, url)
-            raise
+            delay = self.retry_policy.backoff(attempt)
+            attempt += 1
+            api_logger.log_event("retry", url, correlation_id, attempt=attempt, reason=reason, delay_ms=round(delay * 1000, 3))
+            time.sleep(delay)
     
-    def put(self, endpoint: str, data: Optional[Dict[str, Any]] = None, json_data: Optional[Dict[str, Any]] = None) -> requests.Response:
-        url = f"{self.base_url}/{endpoint.lstrip('/')}"
-        
-        api_logger.log_request(
-            method="PUT",
-            url=url,
-            data=data,
-            json_data=json_data
+    def _send_hedged(self, method: str, endpoint: str, url: str, correlation_id: Optional[str], **kwargs) -> requests.Response:
+        """Send once, plus a duplicate if the first outlives the endpoint's recent p95 latency."""
+        hedge_delay = self.hedge_policy.delay(endpoint) if self.hedge_policy is not None else None
+        start = time.perf_counter()
+        if hedge_delay is None:
+            response = self._timed_request(method, endpoint, url, **kwargs)
+        else:
+            if self._hedge_executor is None:
+                self._hedge_executor = ThreadPoolExecutor(max_workers=Config.API_POOL_MAXSIZE, thread_name_prefix="api-hedge")
+            futures = [self._hedge_executor.submit(self._timed_request, method, endpoint, url, **kwargs)]
+            done, _ = wait(futures, timeout=hedge_delay)
+            if not done:
+                api_logger.log_event("hedge", url, correlation_id, delay_ms=round(hedge_delay * 1000, 3))
+                futures.append(self._hedge_executor.submit(self._timed_request, method, endpoint, url, **kwargs))
+            response = self._first_result(futures)
+        if self.hedge_policy is not None:
+            self.hedge_policy.observe(endpoint, time.perf_counter() - start)
+        return response
+    
+    def _timed_request(self, method: str, endpoint: str, url: str, **kwargs) -> requests.Response:
+        """Send one request and record its connect, time-to-first-byte and download phases."""
+        self._throttle(endpoint)
+        connect_timer.seconds = 0.0
+        start = time.perf_counter()
+        response = self.session.request(method, url, stream=True, **kwargs)
+        headers_received = time.perf_counter()
+        response.content
+        end = time.perf_counter()
+        connect = connect_timer.seconds
+        self.latency.record(
+            endpoint.lstrip("/"), method,
+            connect=connect,
+            ttfb=headers_received - start - connect,
+            download=end - headers_received,
+            total=end - start
         )
+        if self.tracer.enabled:
+            self.tracer.complete(
+                f"{method} {endpoint.lstrip('/')}", "api", start, end,
+                endpoint=endpoint.lstrip("/"), method=method, status=response.status_code,
+                bytes_out=len(response.request.body or b""), bytes_in=len(response.content),
+                ttfb_ms=round((headers_received - start) * 1000, 3), **self.tracer.context
+            )
+        return response
+    
+    def _throttle(self, endpoint: str) -> None:
+        """Wait for the rate limiter, if any, tracing the time spent waiting."""
+        if self.rate_limiter is None:
+            return
+        waited = self.rate_limiter.acquire(endpoint)
+        if waited and self.tracer.enabled:
+            now = time.perf_counter()
+            self.tracer.complete("throttle", "api", now - waited, now, endpoint=endpoint.lstrip("/"), **self.tracer.context)
+    
+    @staticmethod
+    def _first_result(futures) -> requests.Response:
+        """Return the first successful result, or raise the last error if all fail."""
+        pending = set(futures)
+        error = None
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                if future.exception() is None:
+                    return future.result()
+                error = future.exception()
+        raise error
+    
+    def stream(self, endpoint: str, key: str, params: Optional[Dict[str, Any]] = None) -> StreamingListResponse:
+        """GET a list endpoint and parse the items of ``key`` as the body arrives.
         
-        try:
-            response = self.session.put(url, data=data, json=json_data)
-            
-            try:
-                response_json = response.json()
-                api_logger.log_response(
-                    status_code=response.status_code,
-                    url=url,
-                    headers=dict(response.headers),
-                    response_json=response_json
-                )
-            except ValueError:
-                api_logger.log_response(
-                    status_code=response.status_code,
-                    url=url,
-                    headers=dict(response.headers),
-                    response_text=response.text
-                )
+        Streamed requests are not retried or hedged, since a partly consumed
+        body cannot be replayed. The log gets the envelope, the first
+        ``API_STREAM_PREVIEW_ITEMS`` items and the item and byte counts; the
+        envelope and preview are schema checked once the body is complete.
+        
+        Args:
+            endpoint: API endpoint
+            key: Top-level field holding the list, e.g. "products"
+            params: Query parameters
             
-            response = self._process_response(response)
-            return response
-        except Exception as e:
-            api_logger.log_error(e, url)
-            raise
-    
-    def delete(self, endpoint: str, data: Optional[Dict[str, Any]] = None) -> requests.Response:
+        Returns:
+            StreamingListResponse to iterate
+        """
         url = f"{self.base_url}/{endpoint.lstrip('/')}"
+        correlation_id = api_logger.log_request(method="GET", url=url, params=params)
         
-        api_logger.log_request(
-            method="DELETE",
-            url=url,
-            data=data
-        )
-        
+        self._throttle(endpoint)
+        connect_timer.seconds = 0.0
+        start = time.perf_counter()
         try:
-            response = self.session.delete(url, data=data)
-            
-            try:
-                response_json = response.json()
-                api_logger.log_response(
-                    status_code=response.status_code,
-                    url=url,
-                    headers=dict(response.headers),
-                    response_json=response_json
+            response = self.session.request(
+                "GET", url, params=params, stream=True,
+                timeout=self.timeouts.get(endpoint.lstrip("/")) or Config.get_timeout(endpoint)
+            )
+        except Exception as e:
+            api_logger.log_error(e, url, correlation_id)
+            raise
+        headers_received = time.perf_counter()
+        connect = connect_timer.seconds
+        
+        def finish(streamed: StreamingListResponse) -> None:
+            end = time.perf_counter()
+            parsed = streamed.stream
+            api_logger.log_response(
+                status_code=streamed.status_code,
+                url=url,
+                headers=streamed.headers,
+                response_json=dict(streamed.envelope, **{key: streamed.preview}, streamed={
+                    "items": parsed.items, "bytes": parsed.bytes_read, "complete": parsed.complete
+                }),
+                correlation_id=correlation_id,
+                elapsed_ms=(end - start) * 1000
+            )
+            if self.tracer.enabled:
+                self.tracer.complete(
+                    f"GET {endpoint.lstrip('/')} (streamed)", "api", start, end,
+                    endpoint=endpoint.lstrip("/"), method="GET", status=streamed.status_code,
+                    bytes_in=parsed.bytes_read, items=parsed.items, complete=parsed.complete,
+                    ttfb_ms=round((headers_received - start) * 1000, 3), **self.tracer.context
                 )
-            except ValueError:
-                api_logger.log_response(
-                    status_code=response.status_code,
-                    url=url,
-                    headers=dict(response.headers),
-                    response_text=response.text
+            if not parsed.complete:
+                return
+            self.latency.record(
+                endpoint.lstrip("/"), "GET",
+                connect=connect,
+                ttfb=headers_received - start - connect,
+                download=end - headers_received,
+                total=end - start
+            )
+            try:
+                self.schemas.validate(endpoint, dict(streamed.envelope, **{key: streamed.preview}))
+            except Exception as e:
+                api_logger.log_error(e, url, correlation_id)
+                raise
+        
+        return StreamingListResponse(
+            response, key,
+            chunk_size=Config.API_STREAM_CHUNK_SIZE,
+            preview_items=Config.API_STREAM_PREVIEW_ITEMS,
+            on_close=finish
+        )
+    
+    def _cached_get(self, endpoint: str, params: Optional[Dict[str, Any]]) -> ApiResponse:
+        """GET through the response cache, re-fetching sampled hits in strict mode."""
+        cache = self.response_cache
+        key = cache.key(endpoint, params)
+        email = (params or {}).get("email")
+        cached = cache.get(key)
+        if cached is not None and not cache.should_verify():
+            api_logger.log_event("cache_hit", f"{self.base_url}/{endpoint.lstrip('/')}", params=params)
+            return cached
+        # Taken before sending, so a write racing this request keeps its response out of the cache
+        generation = cache.generation(email)
+        response = self._request("GET", endpoint, params=params)
+        if cached is not None:
+            stale = response.status_code != cached.status_code or response.content != cached.content
+            cache.verified(stale)
+            if stale:
+                cache.put(key, email, response, generation)
+                raise StaleCacheError(
+                    f"Cached {endpoint} response for {params} is stale: "
+                    f"cached {cached.text[:200]!r}, server returned {response.text[:200]!r}"
                 )
-            
-            response = self._process_response(response)
-            return response
-        except Exception as e:
-            api_logger.log_error(e, url)
-            raise
\ No newline at end of file
+        elif response.status_code == 200:
+            cache.put(key, email, response, generation)
+        return response
+    
+    def _write(self, method: str, endpoint: str, data: Optional[Dict[str, Any]] = None,
+               json_data: Optional[Dict[str, Any]] = None) -> ApiResponse:
+        """Send a write, invalidating cached responses for the email it touches."""
+        email = self.response_cache.invalidates(endpoint, data or json_data) if self.response_cache is not None else None
+        if email is None:
+            return self._request(method, endpoint, data=data, json_data=json_data)
+        self.response_cache.invalidate(email)
+        try:
+            return self._request(method, endpoint, data=data, json_data=json_data)
+        finally:
+            # Also after: a GET sent while the write was in flight may have cached the old state
+            self.response_cache.invalidate(email)
+    
+    def get(self, endpoint: str, params: Optional[Dict[str, Any]] = None) -> ApiResponse:
+        if self.response_cache is not None and self.response_cache.caches(endpoint):
+            return self._cached_get(endpoint, params)
+        return self._request("GET", endpoint, params=params)
+    
+    def post(self, endpoint: str, data: Optional[Dict[str, Any]] = None, json_data: Optional[Dict[str, Any]] = None) -> ApiResponse:
+        return self._write("POST", endpoint, data=data, json_data=json_data)
+    
+    def put(self, endpoint: str, data: Optional[Dict[str, Any]] = None, json_data: Optional[Dict[str, Any]] = None) -> ApiResponse:
+        return self._write("PUT", endpoint, data=data, json_data=json_data)
+    
+    def delete(self, endpoint: str, data: Optional[Dict[str, Any]] = None) -> ApiResponse:
+        return self._write("DELETE", endpoint, data=data)
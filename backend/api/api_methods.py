@@ -1,8 +1,38 @@
 """API methods for Automation Exercise."""
-from typing import Dict, Any, Optional
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from http import HTTPStatus
+from typing import Dict, Any, Callable, List, Optional, Sequence, Tuple
 import requests
 from api.api_client import ApiClient
+from api.api_response import StreamingListResponse
 from api.api_endpoints import ApiEndpoints
+from config.config import Config
+
+class BatchResult:
+    """Outcome of one item of a bulk call: its response, or the error raised while sending it.
+    
+    Args:
+        item: Input item, e.g. the user data or (email, password) pair
+        expected_code: responseCode that counts as success
+        response: Response from API, if one was received
+        error: Exception raised instead of a response
+    """
+    
+    def __init__(self, item: Any, expected_code: int, response: Optional[requests.Response] = None,
+                 error: Optional[Exception] = None):
+        self.item = item
+        self.expected_code = expected_code
+        self.response = response
+        self.error = error
+    
+    @property
+    def ok(self) -> bool:
+        return self.error is None and self.response.response_code == self.expected_code
+    
+    def __repr__(self) -> str:
+        outcome = repr(self.error) if self.error is not None else f"responseCode={self.response.response_code}"
+        return f"BatchResult({self.item!r}, {outcome})"
 
 class ApiMethods:
     """API methods class."""
@@ -14,6 +44,18 @@ class ApiMethods:
             api_client: API client instance
         """
         self.api_client = api_client
+        # email -> password of every account created through this instance and not yet deleted
+        self.created_accounts: Dict[str, str] = {}
+        self._accounts_lock = threading.Lock()
+    
+    def tracked_accounts(self) -> Dict[str, str]:
+        """Return a snapshot of accounts created through this instance and not yet deleted.
+        
+        Returns:
+            Mapping of email to password
+        """
+        with self._accounts_lock:
+            return dict(self.created_accounts)
     
     def get_all_products(self) -> requests.Response:
         """Get all products list.
@@ -31,6 +73,22 @@ class ApiMethods:
         """
         return self.api_client.get(ApiEndpoints.BRANDS_LIST)
     
+    def stream_products(self) -> StreamingListResponse:
+        """Get all products, parsed one product at a time as the body arrives.
+        
+        Returns:
+            Streaming response yielding product dicts
+        """
+        return self.api_client.stream(ApiEndpoints.PRODUCTS_LIST, "products")
+    
+    def stream_brands(self) -> StreamingListResponse:
+        """Get all brands, parsed one brand at a time as the body arrives.
+        
+        Returns:
+            Streaming response yielding brand dicts
+        """
+        return self.api_client.stream(ApiEndpoints.BRANDS_LIST, "brands")
+    
     def search_product(self, search_term: str) -> requests.Response:
         """Search for products.
         
@@ -63,7 +121,11 @@ class ApiMethods:
         Returns:
             Response from API
         """
-        return self.api_client.post(ApiEndpoints.CREATE_ACCOUNT, data=user_data)
+        response = self.api_client.post(ApiEndpoints.CREATE_ACCOUNT, data=user_data)
+        if response.response_code == HTTPStatus.CREATED:
+            with self._accounts_lock:
+                self.created_accounts[user_data["email"]] = user_data["password"]
+        return response
     
     def delete_account(self, email: str, password: str) -> requests.Response:
         """Delete user account.
@@ -75,7 +137,11 @@ class ApiMethods:
         Returns:
             Response from API
         """
-        return self.api_client.delete(ApiEndpoints.DELETE_ACCOUNT, data={"email": email, "password": password})
+        response = self.api_client.delete(ApiEndpoints.DELETE_ACCOUNT, data={"email": email, "password": password})
+        if response.response_code == HTTPStatus.OK:
+            with self._accounts_lock:
+                self.created_accounts.pop(email, None)
+        return response
     
     def update_account(self, user_data: Dict[str, Any]) -> requests.Response:
         """Update user account.
@@ -91,6 +157,9 @@ class ApiMethods:
     def get_user_detail(self, email: str) -> requests.Response:
         """Get user detail by email.
         
+        Served from the client's response cache, if enabled, until an account
+        write for the same email.
+        
         Args:
             email: Email address
             
@@ -98,3 +167,68 @@ class ApiMethods:
             Response from API
         """
         return self.api_client.get(ApiEndpoints.GET_USER_DETAIL, params={"email": email})
+    
+    def _batch(self, call: Callable[[Any], requests.Response], items: Sequence[Any], expected_code: int,
+               max_workers: Optional[int]) -> List[BatchResult]:
+        """Run ``call`` for every item on a bounded pool; results come back in input order."""
+        def run(item: Any) -> BatchResult:
+            try:
+                return BatchResult(item, expected_code, response=call(item))
+            except Exception as e:
+                return BatchResult(item, expected_code, error=e)
+        
+        items = list(items)
+        if not items:
+            return []
+        # Never more threads than pooled connections, so batch threads do not queue for one
+        workers = max(1, min(max_workers or Config.API_BATCH_WORKERS, Config.API_POOL_MAXSIZE, len(items)))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="api-batch") as executor:
+            return list(executor.map(run, items))
+    
+    def create_accounts(self, users: Sequence[Dict[str, Any]], max_workers: Optional[int] = None) -> List[BatchResult]:
+        """Create user accounts concurrently.
+        
+        Args:
+            users: User data for each account
+            max_workers: Concurrent requests (default: Config.API_BATCH_WORKERS), at most Config.API_POOL_MAXSIZE
+            
+        Returns:
+            One BatchResult per user, in input order
+        """
+        return self._batch(self.create_account, users, HTTPStatus.CREATED, max_workers)
+    
+    def delete_accounts(self, credentials: Sequence[Tuple[str, str]], max_workers: Optional[int] = None) -> List[BatchResult]:
+        """Delete user accounts concurrently.
+        
+        Args:
+            credentials: (email, password) pairs
+            max_workers: Concurrent requests (default: Config.API_BATCH_WORKERS), at most Config.API_POOL_MAXSIZE
+            
+        Returns:
+            One BatchResult per pair, in input order
+        """
+        return self._batch(lambda pair: self.delete_account(*pair), credentials, HTTPStatus.OK, max_workers)
+    
+    def get_user_details(self, emails: Sequence[str], max_workers: Optional[int] = None) -> List[BatchResult]:
+        """Get user details concurrently.
+        
+        Args:
+            emails: Email addresses
+            max_workers: Concurrent requests (default: Config.API_BATCH_WORKERS), at most Config.API_POOL_MAXSIZE
+            
+        Returns:
+            One BatchResult per email, in input order
+        """
+        return self._batch(self.get_user_detail, emails, HTTPStatus.OK, max_workers)
+    
+    def verify_logins(self, pairs: Sequence[Tuple[str, str]], max_workers: Optional[int] = None) -> List[BatchResult]:
+        """Verify login credentials concurrently.
+        
+        Args:
+            pairs: (email, password) pairs
+            max_workers: Concurrent requests (default: Config.API_BATCH_WORKERS), at most Config.API_POOL_MAXSIZE
+            
+        Returns:
+            One BatchResult per pair, in input order
+        """
+        return self._batch(lambda pair: self.verify_login(*pair), pairs, HTTPStatus.OK, max_workers)
@@ -0,0 +1,115 @@
+import requests
+from typing import Dict, Any, Callable, Iterator, List, Optional, Sequence
+from api.json_stream import JsonListStream
+
+_UNSET = object()
+
+
+class ApiResponse(requests.Response):
+    """requests.Response whose JSON body is decoded once and cached.
+
+    Built from an existing response by ``from_response`` so it remains a drop-in
+    ``requests.Response``; ``json()`` returns the same cached object on every
+    call, so callers must not mutate it.
+    """
+
+    response_code: Optional[int] = None
+    # Set by ApiClient when the body was checked against its endpoint schema
+    schema_errors: Sequence[str] = ()
+
+    @classmethod
+    def from_response(cls, response: requests.Response) -> "ApiResponse":
+        api_response = cls.__new__(cls)
+        api_response.__dict__.update(response.__dict__)
+        api_response._json = _UNSET
+        api_response._json_error = None
+        return api_response
+
+    def json(self, **kwargs) -> Any:
+        if kwargs:
+            return super().json(**kwargs)
+        if self._json is _UNSET and self._json_error is None:
+            try:
+                self._json = super().json()
+            except ValueError as e:
+                self._json_error = e
+        if self._json_error is not None:
+            raise self._json_error
+        return self._json
+
+    @property
+    def is_json(self) -> bool:
+        try:
+            self.json()
+        except ValueError:
+            return False
+        return True
+
+    @property
+    def message(self) -> Optional[str]:
+        """The ``message`` field of the body, if any."""
+        try:
+            data = self.json()
+        except ValueError:
+            return None
+        return data.get("message") if isinstance(data, dict) else None
+
+
+class StreamingListResponse:
+    """A list endpoint response whose items are parsed while the body is still arriving.
+
+    Iterate it once to get the items of ``key``. Top-level fields such as
+    ``responseCode`` are in ``envelope``; ``response_code`` reads only as far
+    as the start of the list. Only the first ``preview_items`` items are kept
+    (for the log); nothing else holds on to the body. The connection is
+    released when the items are exhausted or on ``close()``, so use it as a
+    context manager when stopping early.
+    """
+
+    def __init__(self, response: requests.Response, key: str, chunk_size: int, preview_items: int,
+                 on_close: Callable[["StreamingListResponse"], None]):
+        self.response = response
+        self.status_code = response.status_code
+        self.headers = response.headers
+        self.url = response.url
+        self.key = key
+        self.stream = JsonListStream(response.iter_content(chunk_size), key, response.encoding or "utf-8")
+        self.preview: List[Any] = []
+        self.preview_items = preview_items
+        self.closed = False
+        self._on_close = on_close
+
+    @property
+    def envelope(self) -> Dict[str, Any]:
+        return self.stream.envelope
+
+    @property
+    def response_code(self) -> Optional[int]:
+        return self.stream.header().get("responseCode")
+
+    @property
+    def complete(self) -> bool:
+        """True once the whole body has been read and parsed."""
+        return self.stream.complete
+
+    def __iter__(self) -> Iterator[Any]:
+        try:
+            for item in self.stream:
+                if len(self.preview) < self.preview_items:
+                    self.preview.append(item)
+                yield item
+        finally:
+            self.close()
+
+    def close(self) -> None:
+        if self.closed:
+            return
+        self.closed = True
+        self.response.close()
+        self._on_close(self)
+
+    def __enter__(self) -> "StreamingListResponse":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
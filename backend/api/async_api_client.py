@@ -0,0 +1,139 @@
+import json
+import logging
+from typing import Dict, Any, Optional, TYPE_CHECKING
+
+from config.config import Config
+from utils.logger import api_logger
+
+if TYPE_CHECKING:
+    import aiohttp
+
+
+class AsyncApiResponse:
+    """Fully read response returned by AsyncApiClient.
+
+    Mirrors the parts of ``requests.Response`` the tests rely on so the same
+    assertions work against both clients.
+    """
+
+    response_code: Optional[int] = None
+
+    def __init__(self, status_code: int, url: str, headers: Dict[str, str], text: str):
+        self.status_code = status_code
+        self.url = url
+        self.headers = headers
+        self.text = text
+
+    def json(self) -> Any:
+        return json.loads(self.text)
+
+
+class AsyncApiClient:
+    """Asyncio API client for making concurrent HTTP requests."""
+
+    def __init__(self, base_url: str, limit: int = 100):
+        self.base_url = base_url
+        self.limit = limit
+        self.session: Optional["aiohttp.ClientSession"] = None
+        # Endpoint path -> aiohttp.ClientTimeout, built with the session
+        self.timeouts: Dict[str, "aiohttp.ClientTimeout"] = {}
+        self.logger = logging.getLogger(__name__)
+
+    async def __aenter__(self) -> "AsyncApiClient":
+        await self.open()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.close()
+
+    async def open(self) -> None:
+        """Create the underlying session; must run inside the event loop."""
+        if self.session is None:
+            # aiohttp is imported here so sync-only sessions never pay for it
+            import aiohttp
+            # Same (connect, read) timeouts as ApiClient; sock_read bounds each wait for data
+            self.timeouts = {
+                path: aiohttp.ClientTimeout(sock_connect=connect, sock_read=read)
+                for path, (connect, read) in ((path, Config.get_timeout(path)) for path in Config.API_ENDPOINTS.values())
+            }
+            connector = aiohttp.TCPConnector(limit=self.limit)
+            self.session = aiohttp.ClientSession(
+                connector=connector,
+                timeout=aiohttp.ClientTimeout(sock_connect=Config.DEFAULT_CONNECT_TIMEOUT, sock_read=Config.DEFAULT_TIMEOUT)
+            )
+
+    async def close(self) -> None:
+        if self.session is not None:
+            await self.session.close()
+            self.session = None
+
+    def _process_response(self, response: AsyncApiResponse) -> AsyncApiResponse:
+        """Extract responseCode from the response if available."""
+        try:
+            data = response.json()
+            if "responseCode" in data:
+                response.response_code = data["responseCode"]
+                self.logger.info(f"Response contains responseCode: {response.response_code}")
+        except (ValueError, KeyError, TypeError):
+            # If cannot parse JSON or no responseCode, don't set response_code
+            pass
+
+        return response
+
+    async def _request(self, method: str, endpoint: str, params: Optional[Dict[str, Any]] = None,
+                       data: Optional[Dict[str, Any]] = None,
+                       json_data: Optional[Dict[str, Any]] = None) -> AsyncApiResponse:
+        url = f"{self.base_url}/{endpoint.lstrip('/')}"
+
+        correlation_id = api_logger.log_request(
+            method=method,
+            url=url,
+            params=params,
+            data=data,
+            json_data=json_data
+        )
+
+        await self.open()
+        try:
+            timeout = self.timeouts.get(endpoint.lstrip("/"), self.session.timeout)
+            async with self.session.request(method, url, params=params, data=data, json=json_data, timeout=timeout) as raw:
+                response = AsyncApiResponse(
+                    status_code=raw.status,
+                    url=url,
+                    headers=dict(raw.headers),
+                    text=await raw.text()
+                )
+
+            try:
+                api_logger.log_response(
+                    status_code=response.status_code,
+                    url=url,
+                    headers=response.headers,
+                    response_json=response.json(),
+                    correlation_id=correlation_id
+                )
+            except ValueError:
+                api_logger.log_response(
+                    status_code=response.status_code,
+                    url=url,
+                    headers=response.headers,
+                    response_text=response.text,
+                    correlation_id=correlation_id
+                )
+
+            return self._process_response(response)
+        except Exception as e:
+            api_logger.log_error(e, url, correlation_id)
+            raise
+
+    async def get(self, endpoint: str, params: Optional[Dict[str, Any]] = None) -> AsyncApiResponse:
+        return await self._request("GET", endpoint, params=params)
+
+    async def post(self, endpoint: str, data: Optional[Dict[str, Any]] = None, json_data: Optional[Dict[str, Any]] = None) -> AsyncApiResponse:
+        return await self._request("POST", endpoint, data=data, json_data=json_data)
+
+    async def put(self, endpoint: str, data: Optional[Dict[str, Any]] = None, json_data: Optional[Dict[str, Any]] = None) -> AsyncApiResponse:
+        return await self._request("PUT", endpoint, data=data, json_data=json_data)
+
+    async def delete(self, endpoint: str, data: Optional[Dict[str, Any]] = None) -> AsyncApiResponse:
+        return await self._request("DELETE", endpoint, data=data)
@@ -0,0 +1,116 @@
+"""Async API methods for Automation Exercise."""
+from http import HTTPStatus
+from typing import Dict, Any
+from api.async_api_client import AsyncApiClient, AsyncApiResponse
+from api.api_endpoints import ApiEndpoints
+
+class AsyncApiMethods:
+    """Async API methods class mirroring ApiMethods."""
+
+    def __init__(self, api_client: AsyncApiClient):
+        """Initialize async API methods.
+
+        Args:
+            api_client: Async API client instance
+        """
+        self.api_client = api_client
+        # email -> password of every account created through this instance and not yet deleted
+        self.created_accounts: Dict[str, str] = {}
+
+    def tracked_accounts(self) -> Dict[str, str]:
+        """Return a snapshot of accounts created through this instance and not yet deleted.
+
+        Returns:
+            Mapping of email to password
+        """
+        return dict(self.created_accounts)
+
+    async def get_all_products(self) -> AsyncApiResponse:
+        """Get all products list.
+
+        Returns:
+            Response from API
+        """
+        return await self.api_client.get(ApiEndpoints.PRODUCTS_LIST)
+
+    async def get_all_brands(self) -> AsyncApiResponse:
+        """Get all brands list.
+
+        Returns:
+            Response from API
+        """
+        return await self.api_client.get(ApiEndpoints.BRANDS_LIST)
+
+    async def search_product(self, search_term: str) -> AsyncApiResponse:
+        """Search for products.
+
+        Args:
+            search_term: Search term
+
+        Returns:
+            Response from API
+        """
+        return await self.api_client.post(ApiEndpoints.SEARCH_PRODUCT, data={"search_product": search_term})
+
+    async def verify_login(self, email: str, password: str) -> AsyncApiResponse:
+        """Verify login credentials.
+
+        Args:
+            email: Email address
+            password: Password
+
+        Returns:
+            Response from API
+        """
+        return await self.api_client.post(ApiEndpoints.VERIFY_LOGIN, data={"email": email, "password": password})
+
+    async def create_account(self, user_data: Dict[str, Any]) -> AsyncApiResponse:
+        """Create user account.
+
+        Args:
+            user_data: User data
+
+        Returns:
+            Response from API
+        """
+        response = await self.api_client.post(ApiEndpoints.CREATE_ACCOUNT, data=user_data)
+        if response.response_code == HTTPStatus.CREATED:
+            self.created_accounts[user_data["email"]] = user_data["password"]
+        return response
+
+    async def delete_account(self, email: str, password: str) -> AsyncApiResponse:
+        """Delete user account.
+
+        Args:
+            email: Email address
+            password: Password
+
+        Returns:
+            Response from API
+        """
+        response = await self.api_client.delete(ApiEndpoints.DELETE_ACCOUNT, data={"email": email, "password": password})
+        if response.response_code == HTTPStatus.OK:
+            self.created_accounts.pop(email, None)
+        return response
+
+    async def update_account(self, user_data: Dict[str, Any]) -> AsyncApiResponse:
+        """Update user account.
+
+        Args:
+            user_data: User data
+
+        Returns:
+            Response from API
+        """
+        return await self.api_client.put(ApiEndpoints.UPDATE_ACCOUNT, data=user_data)
+
+    async def get_user_detail(self, email: str) -> AsyncApiResponse:
+        """Get user detail by email.
+
+        Args:
+            email: Email address
+
+        Returns:
+            Response from API
+        """
+        return await self.api_client.get(ApiEndpoints.GET_USER_DETAIL, params={"email": email})
@@ -0,0 +1,339 @@
+"""Record/replay support for ApiClient.
+
+A cassette is two files:
+
+* ``<name>.cassette`` - one compact JSON record per request/response pair.
+* ``<name>.idx``      - fixed-width binary index sorted by request key, mapping
+  each key to the offset and length of its record in the cassette file.
+
+Replay memory-maps both files on first use and binary-searches the index, so
+opening a large cassette costs nothing until a request is actually served.
+"""
+import os
+import glob
+import json
+import mmap
+import struct
+import hashlib
+import threading
+from contextlib import contextmanager
+from typing import Dict, Any, Optional, List, Iterable, Iterator, Tuple
+from urllib.parse import urlsplit, parse_qs
+
+import requests
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+
+RECORD = "record"
+REPLAY = "replay"
+PASSTHROUGH = "passthrough"
+API_MODES = (RECORD, REPLAY, PASSTHROUGH)
+
+# Cassettes recorded by xdist workers are named "<name>-gw<N>"
+WORKER_SUFFIX = "-gw"
+
+# sha1 digest, per-key sequence number, record offset, record length
+_INDEX_ENTRY = struct.Struct(">20sIQI")
+
+# Field identifying the account a request's other fields belong to
+ENTITY_FIELD = "email"
+
+# getUserDetailByEmail renames a few request fields in its response
+RESPONSE_FIELD_ALIASES = {
+    "birth_day": "birth_date",
+    "first_name": "firstname",
+    "last_name": "lastname",
+}
+
+
+class CassetteMiss(requests.exceptions.ConnectionError):
+    """Raised in replay mode when no recorded response matches a request."""
+
+
+class CassetteNormalizer:
+    """Builds the replay key for a request.
+
+    Values of ``ignore_fields`` are masked so that requests carrying Faker
+    generated data (e.g. from ``TestData.get_dynamic_user()``) still match a
+    recording made on a previous run.
+    """
+
+    def __init__(self, ignore_fields: Iterable[str] = ("email",)):
+        self.ignore_fields = frozenset(ignore_fields)
+
+    def __call__(self, method: str, endpoint: str, params: Dict[str, str]) -> str:
+        normalized = {
+            field: "*" if field in self.ignore_fields else value
+            for field, value in params.items()
+        }
+        return json.dumps([method.upper(), endpoint, normalized], sort_keys=True, separators=(",", ":"))
+
+
+def request_params(request: requests.PreparedRequest) -> Tuple[str, Dict[str, str]]:
+    """Return the endpoint path and merged query/body parameters of a request."""
+    parts = urlsplit(request.url)
+    params = {k: v[-1] for k, v in parse_qs(parts.query, keep_blank_values=True).items()}
+
+    body = request.body
+    if isinstance(body, bytes):
+        body = body.decode("utf-8", errors="replace")
+    if body:
+        content_type = request.headers.get("Content-Type", "")
+        if "json" in content_type:
+            try:
+                params.update({k: v if isinstance(v, str) else json.dumps(v) for k, v in json.loads(body).items()})
+            except (ValueError, AttributeError):
+                params["__body__"] = body
+        else:
+            params.update({k: v[-1] for k, v in parse_qs(body, keep_blank_values=True).items()})
+
+    return parts.path.rstrip("/").rsplit("/", 1)[-1], params
+
+
+def recording_indexes(directory: str, name: str) -> List[str]:
+    """Index files of cassette ``name``: its own, then those recorded by xdist workers."""
+    indexes = [os.path.join(directory, f"{name}.idx")]
+    indexes += sorted(glob.glob(os.path.join(glob.escape(directory), f"{glob.escape(name + WORKER_SUFFIX)}*.idx")))
+    return [path for path in indexes if os.path.exists(path)]
+
+
+def clear_recordings(directory: str, name: str) -> None:
+    """Delete cassette ``name`` and every per-worker cassette recorded under it.
+
+    Replay reads all of them, so files left by an earlier recording (e.g. a
+    ``-n 4`` run before a serial one) would otherwise answer with stale responses.
+    """
+    for extension in (".idx", ".cassette"):
+        workers = os.path.join(glob.escape(directory), f"{glob.escape(name + WORKER_SUFFIX)}*{extension}")
+        for path in [os.path.join(directory, f"{name}{extension}")] + glob.glob(workers):
+            if os.path.exists(path):
+                os.remove(path)
+
+
+def _rewrite_values(node: Any, replacements: Dict[str, Dict[str, str]]) -> Any:
+    """Swap recorded values of ignored fields for the values sent on this run."""
+    if isinstance(node, dict):
+        rewritten = {}
+        for key, value in node.items():
+            field = RESPONSE_FIELD_ALIASES.get(key, key)
+            if field in replacements and isinstance(value, (str, int)) and str(value) in replacements[field]:
+                value = type(value)(replacements[field][str(value)])
+            else:
+                value = _rewrite_values(value, replacements)
+            rewritten[key] = value
+        return rewritten
+    if isinstance(node, list):
+        return [_rewrite_values(item, replacements) for item in node]
+    return node
+
+
+class _IndexFile:
+    """Memory-mapped view of one cassette's index and record files."""
+
+    def __init__(self, index_path: str):
+        self.index_path = index_path
+        self.data_path = index_path[:-len(".idx")] + ".cassette"
+        self._index: Optional[mmap.mmap] = None
+        self._data: Optional[mmap.mmap] = None
+        self._count = 0
+
+    def _open(self) -> None:
+        if self._index is not None:
+            return
+        with open(self.index_path, "rb") as f:
+            self._index = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) if os.path.getsize(self.index_path) else b""
+        with open(self.data_path, "rb") as f:
+            self._data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) if os.path.getsize(self.data_path) else b""
+        self._count = len(self._index) // _INDEX_ENTRY.size
+
+    def find(self, digest: bytes, seq: int) -> Optional[Dict[str, Any]]:
+        self._open()
+        target = (digest, seq)
+        lo, hi = 0, self._count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            entry_digest, entry_seq, _, _ = _INDEX_ENTRY.unpack_from(self._index, mid * _INDEX_ENTRY.size)
+            if (entry_digest, entry_seq) < target:
+                lo = mid + 1
+            else:
+                hi = mid
+        if lo == self._count:
+            return None
+        entry_digest, entry_seq, offset, length = _INDEX_ENTRY.unpack_from(self._index, lo * _INDEX_ENTRY.size)
+        if (entry_digest, entry_seq) != target:
+            return None
+        return json.loads(self._data[offset:offset + length])
+
+    def close(self) -> None:
+        for mapped in (self._index, self._data):
+            if isinstance(mapped, mmap.mmap):
+                mapped.close()
+        self._index = self._data = None
+
+
+class Cassette:
+    """On-disk store of recorded request/response pairs."""
+
+    def __init__(self, directory: str, name: str = "api", mode: str = REPLAY):
+        if mode not in (RECORD, REPLAY):
+            raise ValueError(f"Cassette mode must be '{RECORD}' or '{REPLAY}', got '{mode}'")
+        self.directory = directory
+        self.name = name
+        self.mode = mode
+        self._scope = ""
+        # field -> {recorded value: value sent on this run}, kept across scopes:
+        # pooled accounts are created in a session scope and read in a test's
+        self.replacements: Dict[str, Dict[str, str]] = {}
+        # email -> request fields last sent for that account, as recorded and on this run
+        self._recorded_entities: Dict[str, Dict[str, str]] = {}
+        self._current_entities: Dict[str, Dict[str, str]] = {}
+        self._seq: Dict[bytes, int] = {}
+        self._entries: List[Tuple[bytes, int, int, int]] = []
+        self._writer = None
+        self._index_files: Optional[List[_IndexFile]] = None
+        self._lock = threading.Lock()
+
+        if mode == RECORD:
+            os.makedirs(directory, exist_ok=True)
+            if WORKER_SUFFIX not in name:
+                # Worker cassettes are cleared by the xdist controller before workers start
+                clear_recordings(directory, name)
+            self._writer = open(os.path.join(directory, f"{name}.cassette"), "wb")
+
+    @property
+    def scope(self) -> str:
+        """Replay keys are namespaced by scope, normally the running test's nodeid."""
+        return self._scope
+
+    @scope.setter
+    def scope(self, value: str) -> None:
+        self._scope = value
+
+    @contextmanager
+    def in_scope(self, value: str) -> Iterator[None]:
+        """Switch to scope ``value`` for the block, then back to the current one."""
+        previous = self._scope
+        self._scope = value
+        try:
+            yield
+        finally:
+            self._scope = previous
+
+    def remember_values(self, fields: Iterable[str], recorded: Dict[str, str],
+                        current: Dict[str, str]) -> Dict[str, Dict[str, str]]:
+        """Map the recorded values of ``fields`` to this run's; return a snapshot of all mappings so far.
+
+        Requests made concurrently with identical masked keys (e.g. a batch of
+        createAccount calls) may be served each other's records, so values are
+        also paired through the account they belong to: once recorded email A is
+        matched to this run's email X, every field last sent for A maps to the
+        value last sent for X.
+        """
+        fields = list(fields)
+        with self._lock:
+            recorded_email, current_email = recorded.get(ENTITY_FIELD), current.get(ENTITY_FIELD)
+            if recorded_email is not None and current_email is not None:
+                self._recorded_entities.setdefault(recorded_email, {}).update(recorded)
+                self._current_entities.setdefault(current_email, {}).update(current)
+                recorded, current = self._recorded_entities[recorded_email], self._current_entities[current_email]
+            for field in fields:
+                if recorded.get(field) is not None and current.get(field) is not None:
+                    # Identity mappings are kept too so a later request overrides an earlier one
+                    self.replacements.setdefault(field, {})[recorded[field]] = current[field]
+            return {field: dict(mapping) for field, mapping in self.replacements.items()}
+
+    def _digest(self, key: str) -> bytes:
+        return hashlib.sha1(f"{self._scope}\n{key}".encode("utf-8")).digest()
+
+    def _next_seq(self, digest: bytes) -> int:
+        seq = self._seq.get(digest, 0)
+        self._seq[digest] = seq + 1
+        return seq
+
+    def record(self, key: str, params: Dict[str, str], response: requests.Response) -> None:
+        digest = self._digest(key)
+        record = {
+            "params": params,
+            "status": response.status_code,
+            "reason": response.reason,
+            "headers": dict(response.headers),
+            "body": response.content.decode("utf-8", errors="replace"),
+        }
+        line = json.dumps(record, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+        with self._lock:
+            offset = self._writer.tell()
+            self._writer.write(line + b"\n")
+            self._entries.append((digest, self._next_seq(digest), offset, len(line)))
+
+    def lookup(self, key: str) -> Optional[Dict[str, Any]]:
+        digest = self._digest(key)
+        with self._lock:
+            if self._index_files is None:
+                self._index_files = [_IndexFile(path) for path in recording_indexes(self.directory, self.name)]
+            seq = self._next_seq(digest)
+        for index_file in self._index_files:
+            record = index_file.find(digest, seq)
+            if record is not None:
+                return record
+        return None
+
+    def close(self) -> None:
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+            self._entries.sort()
+            with open(os.path.join(self.directory, f"{self.name}.idx"), "wb") as f:
+                for entry in self._entries:
+                    f.write(_INDEX_ENTRY.pack(*entry))
+        for index_file in self._index_files or []:
+            index_file.close()
+
+
+class CassetteAdapter(HTTPAdapter):
+    """Transport adapter that records to or replays from a Cassette."""
+
+    def __init__(self, cassette: Cassette, normalizer: Optional[CassetteNormalizer] = None, **kwargs):
+        super().__init__(**kwargs)
+        self.cassette = cassette
+        self.normalizer = normalizer or CassetteNormalizer()
+
+    def send(self, request: requests.PreparedRequest, **kwargs) -> requests.Response:
+        endpoint, params = request_params(request)
+        key = self.normalizer(request.method, endpoint, params)
+
+        if self.cassette.mode == RECORD:
+            response = super().send(request, **kwargs)
+            self.cassette.record(key, params, response)
+            return response
+
+        record = self.cassette.lookup(key)
+        if record is None:
+            raise CassetteMiss(f"No recorded response for {request.method} {endpoint} in scope '{self.cassette.scope}'", request=request)
+        return self._build_response(request, params, record)
+
+    def _build_response(self, request: requests.PreparedRequest, params: Dict[str, str],
+                        record: Dict[str, Any]) -> requests.Response:
+        body = record["body"]
+        # Responses may echo values sent by earlier requests, in this scope or a
+        # session one (e.g. getUserDetailByEmail of a pooled account), so mappings accumulate.
+        replacements = self.cassette.remember_values(self.normalizer.ignore_fields, record["params"], params)
+        if any(recorded != current for mapping in replacements.values() for recorded, current in mapping.items()):
+            try:
+                body = json.dumps(_rewrite_values(json.loads(body), replacements))
+            except ValueError:
+                pass
+
+        response = requests.Response()
+        response.status_code = record["status"]
+        response.reason = record["reason"]
+        response.headers = CaseInsensitiveDict(record["headers"])
+        response.headers.pop("Content-Encoding", None)
+        response.headers.pop("Transfer-Encoding", None)
+        response.headers["Content-Length"] = str(len(body.encode("utf-8")))
+        response._content = body.encode("utf-8")
+        # Replayed bodies are already in memory; iter_content serves them in slices
+        response._content_consumed = True
+        response.encoding = "utf-8"
+        response.url = request.url
+        response.request = request
+        return response
@@ -0,0 +1,135 @@
+"""Incremental parsing of list envelopes such as productsList and brandsList.
+
+``JsonListStream`` reads a body shaped like ``{"responseCode": 200,
+"products": [...]}`` from an iterable of byte chunks and yields the items of
+one top-level list as soon as each item is complete. The other top-level
+fields are collected into ``envelope``. Text is dropped from the buffer once
+parsed, so memory is bounded by the chunk size and the largest single item
+rather than by the size of the body.
+"""
+import re
+import json
+import codecs
+from typing import Dict, Any, Iterable, Iterator, Optional
+
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+_DECODER = json.JSONDecoder()
+
+# Yielded internally when the list opens, so the envelope before it can be read on its own
+_LIST_START = object()
+
+
+class JsonListStream:
+    """Items of the top-level list ``key``, parsed from ``chunks`` as they arrive.
+
+    Args:
+        chunks: Body bytes, in pieces of any size
+        key: Top-level field holding the list
+        encoding: Body encoding
+    """
+
+    def __init__(self, chunks: Iterable[bytes], key: str, encoding: str = "utf-8"):
+        self.key = key
+        self.envelope: Dict[str, Any] = {}
+        self.items = 0
+        self.bytes_read = 0
+        self.complete = False
+        self._chunks = iter(chunks)
+        self._decoder = codecs.getincrementaldecoder(encoding)()
+        self._buffer = ""
+        self._pos = 0
+        self._eof = False
+        self._events = self._parse()
+        self._header_read = False
+
+    def header(self) -> Dict[str, Any]:
+        """Read up to the start of the list (or the end of the body) and return the fields seen so far."""
+        if not self._header_read:
+            self._header_read = True
+            next(self._events, None)
+        return self.envelope
+
+    def __iter__(self) -> Iterator[Any]:
+        self.header()
+        return self._events
+
+    def _fill(self) -> bool:
+        """Append the next chunk to the buffer, dropping parsed text; False at the end of the body."""
+        if self._eof:
+            return False
+        self._buffer = self._buffer[self._pos:]
+        self._pos = 0
+        for chunk in self._chunks:
+            if chunk:
+                self.bytes_read += len(chunk)
+                self._buffer += self._decoder.decode(chunk)
+                return True
+        self._buffer += self._decoder.decode(b"", final=True)
+        self._eof = True
+        return False
+
+    def _peek(self) -> Optional[str]:
+        """Skip whitespace and return the next character, or None at the end of the body."""
+        while True:
+            self._pos = _WHITESPACE.match(self._buffer, self._pos).end()
+            if self._pos < len(self._buffer):
+                return self._buffer[self._pos]
+            if not self._fill():
+                return None
+
+    def _expect(self, allowed: str) -> str:
+        char = self._peek()
+        if char is None or char not in allowed:
+            raise json.JSONDecodeError(f"Expecting one of {allowed!r}", self._buffer, self._pos)
+        self._pos += 1
+        return char
+
+    def _value(self) -> Any:
+        """Decode the complete JSON value at the current position, reading more input as needed."""
+        if self._peek() is None:
+            raise json.JSONDecodeError("Expecting value", self._buffer, self._pos)
+        while True:
+            try:
+                value, end = _DECODER.raw_decode(self._buffer, self._pos)
+            except json.JSONDecodeError:
+                if not self._fill():
+                    raise
+                continue
+            # A number ending exactly at the end of the buffer may continue in the next chunk
+            if end == len(self._buffer) and self._buffer[self._pos] not in '{["' and self._fill():
+                continue
+            self._pos = end
+            return value
+
+    def _parse(self) -> Iterator[Any]:
+        self._expect("{")
+        if self._peek() == "}":
+            self._pos += 1
+        else:
+            while True:
+                name = self._value()
+                if not isinstance(name, str):
+                    raise json.JSONDecodeError("Expecting property name", self._buffer, self._pos)
+                self._expect(":")
+                if name == self.key and self._peek() == "[":
+                    self._pos += 1
+                    yield _LIST_START
+                    yield from self._list()
+                else:
+                    self.envelope[name] = self._value()
+                if self._expect(",}") == "}":
+                    break
+        if self._peek() is not None:
+            raise json.JSONDecodeError("Extra data", self._buffer, self._pos)
+        self.complete = True
+
+    def _list(self) -> Iterator[Any]:
+        if self._peek() == "]":
+            self._pos += 1
+            return
+        while True:
+            item = self._value()
+            self.items += 1
+            yield item
+            if self._expect(",]") == "]":
+                return
@@ -0,0 +1,188 @@
+"""Per-endpoint latency histograms for ApiClient.
+
+``LatencyHistogram`` is a sparse log-linear (HDR-style) histogram over
+microseconds: values below 32 us get exact buckets, larger values get 16
+buckets per power of two, so every recorded value is within ~6% of its
+bucket and an hour-long range needs fewer than 500 buckets.
+"""
+import threading
+from time import perf_counter
+from typing import Dict, Any, Optional, Tuple
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+
+PHASES = ("connect", "ttfb", "download", "total")
+
+_SUB_BITS = 5
+
+
+def _bucket(value: int) -> int:
+    bits = value.bit_length()
+    if bits <= _SUB_BITS:
+        return value
+    shift = bits - _SUB_BITS
+    return (shift << (_SUB_BITS - 1)) + (value >> shift)
+
+
+def _bucket_bounds(index: int) -> Tuple[int, int]:
+    if index < (1 << _SUB_BITS):
+        return index, index
+    shift = (index >> (_SUB_BITS - 1)) - 1
+    mantissa = index - (shift << (_SUB_BITS - 1))
+    return mantissa << shift, ((mantissa + 1) << shift) - 1
+
+
+class LatencyHistogram:
+    """Bounded-memory histogram of durations."""
+
+    __slots__ = ("counts", "count", "total_us", "min_us", "max_us")
+
+    def __init__(self):
+        self.counts: Dict[int, int] = {}
+        self.count = 0
+        self.total_us = 0
+        self.min_us: Optional[int] = None
+        self.max_us = 0
+
+    def record(self, seconds: float) -> None:
+        value = max(0, int(seconds * 1_000_000))
+        index = _bucket(value)
+        self.counts[index] = self.counts.get(index, 0) + 1
+        self.count += 1
+        self.total_us += value
+        self.max_us = max(self.max_us, value)
+        self.min_us = value if self.min_us is None else min(self.min_us, value)
+
+    def percentile(self, percent: float) -> float:
+        """Return the ``percent`` percentile in milliseconds (bucket midpoint, capped at max)."""
+        if not self.count:
+            return 0.0
+        target = max(1, round(self.count * percent / 100))
+        seen = 0
+        for index in sorted(self.counts):
+            seen += self.counts[index]
+            if seen >= target:
+                low, high = _bucket_bounds(index)
+                return min((low + high) / 2, self.max_us) / 1000
+        return self.max_us / 1000
+
+    @property
+    def max_ms(self) -> float:
+        return self.max_us / 1000
+
+    @property
+    def mean_ms(self) -> float:
+        return self.total_us / self.count / 1000 if self.count else 0.0
+
+    def merge(self, other: "LatencyHistogram") -> None:
+        for index, count in other.counts.items():
+            self.counts[index] = self.counts.get(index, 0) + count
+        self.count += other.count
+        self.total_us += other.total_us
+        self.max_us = max(self.max_us, other.max_us)
+        if other.min_us is not None:
+            self.min_us = other.min_us if self.min_us is None else min(self.min_us, other.min_us)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "counts": {str(index): count for index, count in self.counts.items()},
+            "count": self.count,
+            "total_us": self.total_us,
+            "min_us": self.min_us,
+            "max_us": self.max_us
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "LatencyHistogram":
+        histogram = cls()
+        histogram.counts = {int(index): count for index, count in data["counts"].items()}
+        histogram.count = data["count"]
+        histogram.total_us = data["total_us"]
+        histogram.min_us = data["min_us"]
+        histogram.max_us = data["max_us"]
+        return histogram
+
+
+class LatencyRecorder:
+    """Thread-safe histograms keyed by (endpoint, method, phase)."""
+
+    def __init__(self):
+        self.histograms: Dict[Tuple[str, str, str], LatencyHistogram] = {}
+        self._lock = threading.Lock()
+
+    def record(self, endpoint: str, method: str, **phases: float) -> None:
+        with self._lock:
+            for phase, seconds in phases.items():
+                key = (endpoint, method, phase)
+                histogram = self.histograms.get(key)
+                if histogram is None:
+                    histogram = self.histograms[key] = LatencyHistogram()
+                histogram.record(seconds)
+
+    def get(self, endpoint: str, method: str, phase: str = "total") -> Optional[LatencyHistogram]:
+        return self.histograms.get((endpoint, method, phase))
+
+    def endpoints(self):
+        """Sorted (endpoint, method) pairs that have recorded requests."""
+        return sorted({(endpoint, method) for endpoint, method, _ in self.histograms})
+
+    def merge(self, other: "LatencyRecorder") -> None:
+        with self._lock:
+            for key, histogram in other.histograms.items():
+                self.histograms.setdefault(key, LatencyHistogram()).merge(histogram)
+
+    def clear(self) -> None:
+        with self._lock:
+            self.histograms.clear()
+
+    def to_dict(self) -> Dict[str, Any]:
+        with self._lock:
+            return {"|".join(key): histogram.to_dict() for key, histogram in self.histograms.items()}
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "LatencyRecorder":
+        recorder = cls()
+        for key, histogram in data.items():
+            recorder.histograms[tuple(key.split("|"))] = LatencyHistogram.from_dict(histogram)
+        return recorder
+
+
+# Time spent opening connections (DNS, TCP connect, TLS handshake) on this thread
+connect_timer = threading.local()
+
+
+class _TimedConnectMixin:
+    def connect(self):
+        start = perf_counter()
+        try:
+            super().connect()
+        finally:
+            connect_timer.seconds = getattr(connect_timer, "seconds", 0.0) + perf_counter() - start
+
+
+class TimedHTTPConnection(_TimedConnectMixin, HTTPConnection):
+    pass
+
+
+class TimedHTTPSConnection(_TimedConnectMixin, HTTPSConnection):
+    pass
+
+
+class TimedHTTPConnectionPool(HTTPConnectionPool):
+    ConnectionCls = TimedHTTPConnection
+
+
+class TimedHTTPSConnectionPool(HTTPSConnectionPool):
+    ConnectionCls = TimedHTTPSConnection
+
+
+def instrument_adapter(adapter) -> None:
+    """Make a requests HTTPAdapter's pools time connection setup into ``connect_timer``."""
+    adapter.poolmanager.pool_classes_by_scheme = {
+        "http": TimedHTTPConnectionPool,
+        "https": TimedHTTPSConnectionPool
+    }
+
+
+# Session-wide recorder shared by every ApiClient and read by the latency report plugin
+latency_recorder = LatencyRecorder()
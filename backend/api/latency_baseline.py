@@ -0,0 +1,138 @@
+"""Stored per-endpoint latency baselines and the significance test used to gate against them.
+
+A baseline file holds, per (endpoint, method), the total-latency histogram
+of a blessed run plus its percentiles for display, along with the suite
+wall time and the API target it ran against. ``compare`` runs a one-sided
+Mann-Whitney U test per endpoint directly on the two histograms (values in
+the same bucket count as ties) and flags a regression only when the shift
+is both significant after a Bonferroni correction over the compared
+endpoints and at least ``min_effect`` slower at the median. That way a
+large sample cannot fail the gate over a shift too small to matter, and a
+small one cannot fail it on noise.
+"""
+import json
+import math
+import time
+import platform
+from typing import Dict, Any, List, Optional, Tuple
+from api.latency import LatencyHistogram, LatencyRecorder
+
+BASELINE_VERSION = 1
+
+# Endpoints with fewer requests than this on either side are reported but not tested
+MIN_SAMPLES = 8
+
+class BaselineError(ValueError):
+    """The baseline file is missing, unreadable or of another version."""
+
+
+def build_baseline(recorder: LatencyRecorder, suite_seconds: float, target: str) -> Dict[str, Any]:
+    endpoints = {}
+    for endpoint, method in recorder.endpoints():
+        histogram = recorder.get(endpoint, method)
+        if histogram is None:
+            continue
+        endpoints[f"{endpoint} {method}"] = {
+            "count": histogram.count,
+            "p50_ms": histogram.percentile(50),
+            "p90_ms": histogram.percentile(90),
+            "p99_ms": histogram.percentile(99),
+            "histogram": histogram.to_dict()
+        }
+    return {
+        "version": BASELINE_VERSION,
+        "created": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        "target": target,
+        "python": platform.python_version(),
+        "suite_seconds": round(suite_seconds, 3),
+        "endpoints": endpoints
+    }
+
+def save_baseline(path: str, baseline: Dict[str, Any]) -> None:
+    with open(path, "w") as f:
+        json.dump(baseline, f, indent=2, sort_keys=True)
+
+def load_baseline(path: str) -> Dict[str, Any]:
+    try:
+        with open(path) as f:
+            baseline = json.load(f)
+    except (OSError, ValueError) as e:
+        raise BaselineError(f"Cannot read latency baseline {path}: {e}")
+    if baseline.get("version") != BASELINE_VERSION:
+        raise BaselineError(
+            f"Latency baseline {path} is version {baseline.get('version')}, expected {BASELINE_VERSION}; save a new one"
+        )
+    return baseline
+
+def mann_whitney_greater(baseline: LatencyHistogram, current: LatencyHistogram) -> Tuple[float, float]:
+    """One-sided Mann-Whitney U test that ``current`` tends to be slower than ``baseline``.
+
+    Returns:
+        (probability of superiority U / (n1 * n2), p-value from the tie-corrected normal approximation)
+    """
+    n1, n2 = baseline.count, current.count
+    if not n1 or not n2:
+        return 0.5, 1.0
+    u = 0.0
+    below = 0
+    tie_term = 0
+    for index in sorted(set(baseline.counts) | set(current.counts)):
+        a = baseline.counts.get(index, 0)
+        b = current.counts.get(index, 0)
+        u += b * (below + a / 2)
+        below += a
+        tied = a + b
+        tie_term += tied ** 3 - tied
+    n = n1 + n2
+    variance = n1 * n2 / 12 * ((n + 1) - tie_term / (n * (n - 1))) if n > 1 else 0.0
+    if variance <= 0:
+        return u / (n1 * n2), 1.0
+    z = (u - n1 * n2 / 2 - 0.5) / math.sqrt(variance)
+    return u / (n1 * n2), 0.5 * math.erfc(z / math.sqrt(2))
+
+
+class EndpointDiff:
+    """Comparison of one (endpoint, method) between the baseline and this run."""
+
+    def __init__(self, key: str, baseline: Optional[Dict[str, Any]], current: Optional[LatencyHistogram]):
+        self.endpoint, self.method = key.rsplit(" ", 1)
+        self.baseline = baseline
+        self.current = current
+        self.superiority: Optional[float] = None
+        self.p_value: Optional[float] = None
+        self.regressed = False
+
+    @property
+    def baseline_p50(self) -> Optional[float]:
+        return self.baseline["p50_ms"] if self.baseline else None
+
+    @property
+    def current_p50(self) -> Optional[float]:
+        return self.current.percentile(50) if self.current else None
+
+    @property
+    def ratio(self) -> Optional[float]:
+        if not self.baseline_p50 or self.current_p50 is None:
+            return None
+        return self.current_p50 / self.baseline_p50
+
+
+def compare(baseline: Dict[str, Any], recorder: LatencyRecorder, alpha: float = 0.01,
+            min_effect: float = 0.1) -> List[EndpointDiff]:
+    """Test every endpoint of ``baseline`` and of ``recorder``; flag significant, material slowdowns."""
+    keys = set(baseline["endpoints"]) | {f"{endpoint} {method}" for endpoint, method in recorder.endpoints()}
+    diffs = []
+    for key in sorted(keys):
+        endpoint, method = key.rsplit(" ", 1)
+        diffs.append(EndpointDiff(key, baseline["endpoints"].get(key), recorder.get(endpoint, method)))
+    testable = [
+        diff for diff in diffs
+        if diff.baseline and diff.current and diff.baseline["count"] >= MIN_SAMPLES and diff.current.count >= MIN_SAMPLES
+    ]
+    corrected_alpha = alpha / max(1, len(testable))
+    for diff in testable:
+        diff.superiority, diff.p_value = mann_whitney_greater(
+            LatencyHistogram.from_dict(diff.baseline["histogram"]), diff.current
+        )
+        diff.regressed = diff.p_value < corrected_alpha and (diff.ratio or 0) >= 1 + min_effect
+    return diffs
@@ -0,0 +1,138 @@
+"""Client-side token-bucket rate limiting shared by every process on a host.
+
+Limits are requests per second keyed by endpoint, with ``"*"`` for a budget
+shared by all endpoints. The buckets live in a small memory-mapped file named
+after the API host and the limits, so every xdist worker on a node draws
+from the same budget. Each request takes an flock on the file, refills its
+buckets for the time elapsed since their last update and takes a token. An
+empty bucket lends the token anyway (its count goes negative) and the caller
+sleeps until the bucket would have refilled: the lock is held only for the
+arithmetic, and waiting callers are served in arrival order.
+"""
+import os
+import mmap
+import time
+import struct
+import hashlib
+import threading
+from contextlib import contextmanager
+from typing import Dict, Iterator, Optional
+from urllib.parse import urlsplit
+
+try:
+    import fcntl
+except ImportError:  # Windows: buckets are shared between threads only
+    fcntl = None
+
+GLOBAL = "*"
+
+# One slot per bucket: tokens, time of last update (epoch seconds)
+_SLOT = struct.Struct("dd")
+
+
+class RateLimiter:
+    """Token buckets for the global and per-endpoint limits, with wait-time accounting.
+
+    Args:
+        limits: Endpoint (or "*" for all endpoints) -> requests per second
+        path: File holding the bucket state; None keeps it in this process
+        burst: Seconds of requests a full bucket holds (at least one request)
+    """
+
+    def __init__(self, limits: Dict[str, float], path: Optional[str] = None, burst: float = 1.0):
+        self.limits = {endpoint.lstrip("/"): rate for endpoint, rate in limits.items() if rate > 0}
+        self.path = path
+        self.burst = burst
+        self._slots = {endpoint: index for index, endpoint in enumerate(sorted(self.limits))}
+        self._lock = threading.Lock()
+        self._stats_lock = threading.Lock()
+        # endpoint -> {"requests", "throttled", "wait_s", "max_wait_s"}
+        self.wait_stats: Dict[str, Dict[str, float]] = {}
+        size = max(1, len(self._slots)) * _SLOT.size
+        self._file = None
+        if path is None:
+            self._map = mmap.mmap(-1, size)
+        else:
+            os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+            fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o644)
+            self._file = os.fdopen(fd, "r+b")
+            with self._file_lock():
+                if os.fstat(fd).st_size < size:
+                    os.ftruncate(fd, size)
+            self._map = mmap.mmap(fd, size)
+
+    @classmethod
+    def for_host(cls, base_url: str, limits: Dict[str, float], directory: str, burst: float = 1.0) -> Optional["RateLimiter"]:
+        """Limiter whose state file is shared by every client of ``base_url``'s host; None without limits."""
+        if not any(rate > 0 for rate in limits.values()):
+            return None
+        spec = ",".join(f"{endpoint}={rate}" for endpoint, rate in sorted(limits.items()))
+        key = hashlib.sha1(f"{urlsplit(base_url).netloc}|{spec}|{burst}".encode("utf-8")).hexdigest()[:12]
+        return cls(limits, os.path.join(directory, f"api_rate_limit_{key}.bin"), burst)
+
+    @contextmanager
+    def _file_lock(self) -> Iterator[None]:
+        if self._file is None or fcntl is None:
+            yield
+            return
+        fcntl.flock(self._file, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(self._file, fcntl.LOCK_UN)
+
+    def _take(self, endpoint: str, now: float) -> float:
+        """Take a token from ``endpoint``'s bucket; return the seconds until it is covered."""
+        offset = self._slots[endpoint] * _SLOT.size
+        rate = self.limits[endpoint]
+        tokens, updated = _SLOT.unpack_from(self._map, offset)
+        tokens = min(max(1.0, rate * self.burst), tokens + max(0.0, now - updated) * rate) - 1
+        _SLOT.pack_into(self._map, offset, tokens, now)
+        return -tokens / rate if tokens < 0 else 0.0
+
+    def reserve(self, endpoint: str) -> float:
+        """Take a token for one request to ``endpoint`` and return how long to wait before sending it."""
+        endpoint = endpoint.lstrip("/")
+        buckets = [name for name in (GLOBAL, endpoint) if name in self._slots]
+        if not buckets:
+            return 0.0
+        with self._lock, self._file_lock():
+            now = time.time()
+            return max(self._take(name, now) for name in buckets)
+
+    def acquire(self, endpoint: str) -> float:
+        """Wait until a request to ``endpoint`` is within the limits.
+
+        Returns:
+            Seconds spent waiting
+        """
+        wait = self.reserve(endpoint)
+        if wait > 0:
+            time.sleep(wait)
+        endpoint = endpoint.lstrip("/")
+        with self._stats_lock:
+            stats = self.wait_stats.setdefault(endpoint, {"requests": 0, "throttled": 0, "wait_s": 0.0, "max_wait_s": 0.0})
+            stats["requests"] += 1
+            if wait > 0:
+                stats["throttled"] += 1
+                stats["wait_s"] += wait
+                stats["max_wait_s"] = max(stats["max_wait_s"], wait)
+        return wait
+
+    def stats(self) -> Dict[str, Dict[str, float]]:
+        with self._stats_lock:
+            return {endpoint: dict(stats) for endpoint, stats in self.wait_stats.items()}
+
+    def close(self) -> None:
+        self._map.close()
+        if self._file is not None:
+            self._file.close()
+
+def merge_wait_stats(totals: Dict[str, Dict[str, float]], other: Dict[str, Dict[str, float]]) -> Dict[str, Dict[str, float]]:
+    """Add one worker's wait stats into ``totals`` (in place) and return it."""
+    for endpoint, stats in other.items():
+        merged = totals.setdefault(endpoint, {"requests": 0, "throttled": 0, "wait_s": 0.0, "max_wait_s": 0.0})
+        for key in ("requests", "throttled", "wait_s"):
+            merged[key] += stats[key]
+        merged["max_wait_s"] = max(merged["max_wait_s"], stats["max_wait_s"])
+    return totals
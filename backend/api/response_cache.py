@@ -0,0 +1,157 @@
+"""Bounded LRU cache of GET responses, invalidated by account writes.
+
+Entries are keyed by (endpoint, query parameters) and tagged with the
+``email`` parameter, if any. A createAccount, updateAccount or deleteAccount
+call carrying an email drops every entry tagged with it, both before the
+write is sent and after it returns, and bumps the email's generation so a
+GET that was already in flight when the write started cannot store its
+(possibly stale) response afterwards.
+
+The cache is per ApiClient, so per xdist worker: writes made by another
+process are not seen. ``strict`` mode guards against that by re-fetching a
+sample of hits and raising StaleCacheError when the server disagrees.
+"""
+import random
+import threading
+from collections import OrderedDict
+from typing import Dict, Any, Iterable, Optional, Tuple
+from api.api_endpoints import ApiEndpoints
+
+ON = "on"
+STRICT = "strict"
+OFF = "off"
+CACHE_MODES = (ON, STRICT, OFF)
+
+# Writes that invalidate the cached responses of the email they carry
+INVALIDATING_ENDPOINTS = frozenset([
+    ApiEndpoints.CREATE_ACCOUNT, ApiEndpoints.UPDATE_ACCOUNT, ApiEndpoints.DELETE_ACCOUNT
+])
+
+CacheKey = Tuple[str, Tuple[Tuple[str, str], ...]]
+
+class StaleCacheError(AssertionError):
+    """A verified cache hit no longer matched the server's response."""
+
+
+class ResponseCache:
+    """Thread-safe LRU of GET responses with per-email invalidation.
+
+    Args:
+        mode: ``on`` serves hits, ``strict`` also re-fetches a sample of them, ``off`` disables the cache
+        max_entries: Entries kept before the least recently used is evicted
+        endpoints: Cached GET endpoints; ``"*"`` caches every GET
+        verify_rate: Fraction of hits re-fetched and compared in strict mode
+    """
+
+    def __init__(self, mode: str = ON, max_entries: int = 256, endpoints: Iterable[str] = (ApiEndpoints.GET_USER_DETAIL,),
+                 verify_rate: float = 0.1):
+        if mode not in CACHE_MODES:
+            raise ValueError(f"Unknown cache mode '{mode}', expected one of {CACHE_MODES}")
+        self.mode = mode
+        self.max_entries = max_entries
+        self.endpoints = frozenset(endpoint.lstrip("/") for endpoint in endpoints)
+        self.verify_rate = verify_rate
+        self.entries: "OrderedDict[CacheKey, Tuple[Optional[str], Any]]" = OrderedDict()
+        self.counts = {"hits": 0, "misses": 0, "evictions": 0, "invalidations": 0, "verified": 0, "stale": 0}
+        self._by_email: Dict[str, set] = {}
+        self._generations: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return self.mode != OFF
+
+    def caches(self, endpoint: str) -> bool:
+        return self.enabled and ("*" in self.endpoints or endpoint.lstrip("/") in self.endpoints)
+
+    @staticmethod
+    def key(endpoint: str, params: Optional[Dict[str, Any]]) -> CacheKey:
+        return endpoint.lstrip("/"), tuple(sorted((str(name), str(value)) for name, value in (params or {}).items()))
+
+    def generation(self, email: Optional[str]) -> int:
+        """Token to pass to ``put``; it changes whenever ``email`` is invalidated."""
+        with self._lock:
+            return self._generations.get(email, 0)
+
+    def get(self, key: CacheKey) -> Optional[Any]:
+        """Return the cached response for ``key``, counting the hit or miss."""
+        with self._lock:
+            entry = self.entries.get(key)
+            if entry is None:
+                self.counts["misses"] += 1
+                return None
+            self.entries.move_to_end(key)
+            self.counts["hits"] += 1
+            return entry[1]
+
+    def put(self, key: CacheKey, email: Optional[str], response: Any, generation: int) -> bool:
+        """Store ``response`` unless ``email`` was invalidated since ``generation`` was taken.
+
+        Returns:
+            Whether the response was stored
+        """
+        with self._lock:
+            if self._generations.get(email, 0) != generation:
+                return False
+            self._discard(key)
+            self.entries[key] = (email, response)
+            if email is not None:
+                self._by_email.setdefault(email, set()).add(key)
+            while len(self.entries) > self.max_entries:
+                self._discard(next(iter(self.entries)))
+                self.counts["evictions"] += 1
+            return True
+
+    def _discard(self, key: CacheKey) -> None:
+        entry = self.entries.pop(key, None)
+        if entry is None or entry[0] is None:
+            return
+        keys = self._by_email.get(entry[0])
+        if keys is not None:
+            keys.discard(key)
+            if not keys:
+                del self._by_email[entry[0]]
+
+    def invalidates(self, endpoint: str, body: Optional[Dict[str, Any]]) -> Optional[str]:
+        """Email whose entries a write to ``endpoint`` with ``body`` invalidates, if any."""
+        if not self.enabled or not body or endpoint.lstrip("/") not in INVALIDATING_ENDPOINTS:
+            return None
+        return body.get("email")
+
+    def invalidate(self, email: str) -> int:
+        """Drop every entry tagged with ``email``.
+
+        Returns:
+            Number of entries dropped
+        """
+        with self._lock:
+            self._generations[email] = self._generations.get(email, 0) + 1
+            keys = list(self._by_email.get(email, ()))
+            for key in keys:
+                self._discard(key)
+            self.counts["invalidations"] += len(keys)
+            return len(keys)
+
+    def should_verify(self) -> bool:
+        return self.mode == STRICT and random.random() < self.verify_rate
+
+    def verified(self, stale: bool) -> None:
+        with self._lock:
+            self.counts["verified"] += 1
+            if stale:
+                self.counts["stale"] += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self.entries.clear()
+            self._by_email.clear()
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return dict(self.counts, entries=len(self.entries))
+
+def merge_cache_stats(totals: Dict[str, int], other: Dict[str, int]) -> Dict[str, int]:
+    """Add one worker's cache stats into ``totals`` (in place) and return it."""
+    for key, count in other.items():
+        totals[key] = totals.get(key, 0) + count
+    return totals
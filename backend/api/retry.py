@@ -0,0 +1,63 @@
+"""Retry and request hedging policies for ApiClient."""
+import random
+import threading
+from collections import deque
+from typing import Dict, Deque, Optional
+
+# Only these are retried or hedged; repeating a POST/PUT/DELETE could create,
+# update or delete an account twice.
+IDEMPOTENT_METHODS = frozenset(["GET", "HEAD", "OPTIONS"])
+
+
+class RetryPolicy:
+    """Capped exponential backoff with full jitter.
+
+    The delay before retry ``n`` (0-based) is drawn uniformly from
+    ``[0, min(max_delay, base_delay * 2 ** n)]``.
+    """
+
+    def __init__(self, max_attempts: int = 3, base_delay: float = 0.2, max_delay: float = 2.0,
+                 status_forcelist=(429, 500, 502, 503, 504)):
+        self.max_attempts = max(1, max_attempts)
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.status_forcelist = frozenset(status_forcelist)
+
+    def should_retry(self, attempt: int) -> bool:
+        return attempt + 1 < self.max_attempts
+
+    def backoff(self, attempt: int) -> float:
+        return random.uniform(0, min(self.max_delay, self.base_delay * (2 ** attempt)))
+
+
+class HedgePolicy:
+    """Decides when to send a duplicate GET based on recent per-endpoint latency.
+
+    A hedge fires once the primary request has been outstanding longer than
+    the ``percentile`` of the last ``window`` latencies for that endpoint; no
+    hedging happens until ``min_samples`` latencies have been observed.
+    """
+
+    def __init__(self, percentile: float = 95, min_samples: int = 20, window: int = 200, min_delay: float = 0.05):
+        self.percentile = percentile
+        self.min_samples = min_samples
+        self.window = window
+        self.min_delay = min_delay
+        self._samples: Dict[str, Deque[float]] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, endpoint: str, seconds: float) -> None:
+        with self._lock:
+            samples = self._samples.get(endpoint)
+            if samples is None:
+                samples = self._samples[endpoint] = deque(maxlen=self.window)
+            samples.append(seconds)
+
+    def delay(self, endpoint: str) -> Optional[float]:
+        """Seconds to wait before hedging, or None if there is not enough history."""
+        with self._lock:
+            samples = sorted(self._samples.get(endpoint, ()))
+        if len(samples) < self.min_samples:
+            return None
+        index = min(len(samples) - 1, int(len(samples) * self.percentile / 100))
+        return max(self.min_delay, samples[index])
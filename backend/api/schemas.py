@@ -0,0 +1,239 @@
+"""Per-endpoint response schemas, compiled once into validators.
+
+A schema is written as plain Python values:
+
+- a type (``str``, ``int``) or tuple of types: ``isinstance`` check
+- a dict: object whose keys must be present; a ``"?"`` prefix marks an optional key
+- a one-item list: list whose items all match that item schema
+
+``SCHEMAS`` maps each endpoint to schemas keyed by ``responseCode``, with
+``"*"`` as the fallback for codes not listed (error envelopes).
+
+Each schema compiles to two functions: a generated ``check(value) -> bool``
+with no per-field path bookkeeping, run on every sampled response, and a
+slower validator that collects error paths, run only when the check fails.
+Null values are accepted for present fields.
+"""
+import random
+import threading
+from time import perf_counter
+from typing import Dict, Any, Callable, List, Optional, Union
+from api.api_endpoints import ApiEndpoints
+
+STRICT = "strict"
+WARN = "warn"
+OFF = "off"
+SCHEMA_MODES = (STRICT, WARN, OFF)
+
+Validator = Callable[[Any, str, List[str]], None]
+Check = Callable[[Any], bool]
+
+class SchemaValidationError(AssertionError):
+    """A response body did not match its endpoint's schema."""
+
+
+MESSAGE = {"responseCode": int, "message": str}
+
+USER = {
+    "id": int, "name": str, "email": str, "title": str,
+    "birth_day": str, "birth_month": str, "birth_year": str,
+    "first_name": str, "last_name": str, "company": str,
+    "address1": str, "address2": str, "country": str, "state": str, "city": str, "zipcode": str,
+}
+
+PRODUCT = {
+    "id": int, "name": str, "price": str, "brand": str,
+    "category": {"usertype": {"usertype": str}, "category": str},
+}
+
+BRAND = {"id": int, "brand": str}
+
+SCHEMAS: Dict[str, Dict[Union[int, str], Any]] = {
+    ApiEndpoints.PRODUCTS_LIST: {200: {"responseCode": int, "products": [PRODUCT]}, "*": MESSAGE},
+    ApiEndpoints.BRANDS_LIST: {200: {"responseCode": int, "brands": [BRAND]}, "*": MESSAGE},
+    ApiEndpoints.SEARCH_PRODUCT: {200: {"responseCode": int, "products": [PRODUCT]}, "*": MESSAGE},
+    ApiEndpoints.VERIFY_LOGIN: {"*": MESSAGE},
+    ApiEndpoints.CREATE_ACCOUNT: {"*": MESSAGE},
+    ApiEndpoints.DELETE_ACCOUNT: {"*": MESSAGE},
+    ApiEndpoints.UPDATE_ACCOUNT: {"*": MESSAGE},
+    ApiEndpoints.GET_USER_DETAIL: {200: {"responseCode": int, "user": USER}, "*": MESSAGE},
+}
+
+def _type_name(expected) -> str:
+    if isinstance(expected, tuple):
+        return " or ".join(t.__name__ for t in expected)
+    return expected.__name__
+
+def compile_schema(schema: Any) -> Validator:
+    """Turn a schema into ``validate(value, path, errors)``, which appends error strings."""
+    if isinstance(schema, list):
+        return _compile_list(schema[0])
+    if isinstance(schema, dict):
+        return _compile_object(schema)
+    expected_name = _type_name(schema)
+
+    def validate_type(value, path, errors):
+        # bool is an int subclass but never a valid number in these bodies
+        if not isinstance(value, schema) or isinstance(value, bool):
+            errors.append(f"{path}: expected {expected_name}, got {type(value).__name__}")
+    return validate_type
+
+def _compile_object(schema: Dict[str, Any]) -> Validator:
+    required, nested = [], []
+    for key, value in schema.items():
+        name = key.lstrip("?")
+        if not key.startswith("?"):
+            required.append(name)
+        nested.append((name, value))
+    # Fields that are plain type checks run in one tight loop; the rest recurse
+    flat = tuple((name, value) for name, value in nested if not isinstance(value, (dict, list)))
+    deep = tuple((name, compile_schema(value)) for name, value in nested if isinstance(value, (dict, list)))
+    required = tuple(required)
+
+    def validate_object(value, path, errors):
+        if not isinstance(value, dict):
+            errors.append(f"{path}: expected object, got {type(value).__name__}")
+            return
+        for name in required:
+            if name not in value:
+                errors.append(f"{path}.{name}: missing")
+        for name, expected in flat:
+            field = value.get(name)
+            if field is not None and (not isinstance(field, expected) or isinstance(field, bool)):
+                errors.append(f"{path}.{name}: expected {_type_name(expected)}, got {type(field).__name__}")
+        for name, validate in deep:
+            if name in value:
+                validate(value[name], f"{path}.{name}", errors)
+    return validate_object
+
+class _CheckBuilder:
+    """Generates the source of one check function per object/list in a schema."""
+
+    def __init__(self):
+        self.lines: List[str] = []
+        self.namespace: Dict[str, Any] = {}
+        self.count = 0
+
+    def _name(self, prefix: str, value: Any = None) -> str:
+        name = f"_{prefix}{self.count}"
+        self.count += 1
+        if value is not None:
+            self.namespace[name] = value
+        return name
+
+    def _type_test(self, var: str, expected) -> str:
+        if isinstance(expected, tuple):
+            return f"type({var}) not in {self._name('t', expected)}"
+        return f"type({var}) is not {self._name('t', expected)}"
+
+    def function(self, schema: Any) -> str:
+        """Emit a check function for a dict or list schema and return its name."""
+        name = self._name("check")
+        body = [f"def {name}(v):"]
+        if isinstance(schema, list):
+            item = schema[0]
+            if isinstance(item, (dict, list)):
+                body.append(f"    return type(v) is list and all(map({self.function(item)}, v))")
+            else:
+                body.append(f"    return type(v) is list and not any({self._type_test('x', item)} for x in v)")
+        else:
+            required = frozenset(key for key in schema if not key.startswith("?"))
+            body.append("    if type(v) is not dict: return False")
+            if required:
+                body.append(f"    if not {self._name('req', required)} <= v.keys(): return False")
+            for key, value in schema.items():
+                field = key.lstrip("?")
+                body.append(f"    f = v.get({field!r})")
+                if isinstance(value, (dict, list)):
+                    body.append(f"    if f is not None and not {self.function(value)}(f): return False")
+                else:
+                    body.append(f"    if f is not None and {self._type_test('f', value)}: return False")
+            body.append("    return True")
+        self.lines.extend(body)
+        return name
+
+def compile_check(schema: Any) -> Check:
+    """Generate a fast ``check(value) -> bool`` for a schema."""
+    builder = _CheckBuilder()
+    if isinstance(schema, (dict, list)):
+        name = builder.function(schema)
+    else:
+        name = builder._name("check")
+        builder.lines.append(f"def {name}(v):\n    return v is None or not ({builder._type_test('v', schema)})")
+    exec("\n".join(builder.lines), builder.namespace)
+    return builder.namespace[name]
+
+def _compile_list(item_schema: Any) -> Validator:
+    validate_item = compile_schema(item_schema)
+
+    def validate_list(value, path, errors):
+        if not isinstance(value, list):
+            errors.append(f"{path}: expected list, got {type(value).__name__}")
+            return
+        for index, item in enumerate(value):
+            validate_item(item, f"{path}[{index}]", errors)
+            if len(errors) >= 20:
+                return
+    return validate_list
+
+
+class SchemaRegistry:
+    """Compiled validators for every endpoint in ``schemas``, with sampling and cost accounting.
+
+    Args:
+        mode: ``strict`` raises SchemaValidationError, ``warn`` only records the errors, ``off`` skips
+        sample_rate: Fraction of responses validated
+        schemas: Endpoint -> {responseCode or "*": schema}
+    """
+
+    def __init__(self, mode: str = STRICT, sample_rate: float = 1.0, schemas: Optional[Dict[str, Dict]] = None):
+        if mode not in SCHEMA_MODES:
+            raise ValueError(f"Unknown schema mode '{mode}', expected one of {SCHEMA_MODES}")
+        self.mode = mode
+        self.sample_rate = sample_rate
+        self.validators = {
+            endpoint: {code: (compile_check(schema), compile_schema(schema)) for code, schema in by_code.items()}
+            for endpoint, by_code in (schemas if schemas is not None else SCHEMAS).items()
+        }
+        self.validated = 0
+        self.failed = 0
+        self.seconds = 0.0
+        self._lock = threading.Lock()
+
+    def validate(self, endpoint: str, body: Any) -> List[str]:
+        """Return schema errors for ``body``; raise them in strict mode."""
+        by_code = self.validators.get(endpoint.lstrip("/"))
+        if by_code is None or self.mode == OFF:
+            return []
+        if self.sample_rate < 1.0 and random.random() >= self.sample_rate:
+            return []
+        start = perf_counter()
+        code = body.get("responseCode") if isinstance(body, dict) else None
+        compiled = by_code.get(code) or by_code.get("*")
+        errors: List[str] = []
+        if compiled is not None:
+            check, validator = compiled
+            if not check(body):
+                validator(body, "$", errors)
+        elapsed = perf_counter() - start
+        with self._lock:
+            self.validated += 1
+            self.seconds += elapsed
+            if errors:
+                self.failed += 1
+        if errors and self.mode == STRICT:
+            raise SchemaValidationError(f"{endpoint} response does not match its schema: {'; '.join(errors)}")
+        return errors
+
+    def stats(self) -> Dict[str, float]:
+        with self._lock:
+            return {
+                "validated": self.validated,
+                "failed": self.failed,
+                "us_per_response": self.seconds / self.validated * 1e6 if self.validated else 0.0
+            }
+
+    def reset_stats(self) -> None:
+        with self._lock:
+            self.validated = self.failed = 0
+            self.seconds = 0.0
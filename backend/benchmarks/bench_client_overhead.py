@@ -0,0 +1,247 @@
+"""Client-overhead benchmark: CPU cost of ApiClient and ApiLogger per call, with no network.
+
+Requests go through the full ApiClient pipeline (URL building, retry/timeout
+handling, latency recording, JSON decode, schema validation, response logging) but are answered
+by an in-process transport adapter. Each verb is measured with small, medium
+and huge (~5 MB productsList) response bodies, with traffic logging on
+(pretty-printed to a temporary directory) and off. The ``schema us`` column is
+the time spent validating each response against its endpoint schema.
+
+Every case is timed in --repeat short rounds, round robin, each bracketed by a
+fixed reference workload (JSON decode/encode without the client). The ``rel
+cost`` column is the median over rounds of a call's time in units of that
+reference, which cancels most of the machine's speed drift between and within
+runs; calls/s is the best round. A case regresses only if its relative cost
+grew by more than --threshold and that growth is more than --noise-us
+microseconds per call at this run's speed:
+
+    python -m benchmarks.bench_client_overhead --save benchmarks/client_baseline.json
+    python -m benchmarks.bench_client_overhead --compare benchmarks/client_baseline.json --threshold 0.2 --noise-us 50
+"""
+import os
+import sys
+import json
+import time
+import logging
+import argparse
+import tempfile
+import statistics
+import tracemalloc
+from typing import Dict, Any, Callable, List
+import requests
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+from api.api_client import ApiClient
+from api.api_endpoints import ApiEndpoints
+from server.catalog import PRODUCTS
+from utils.logger import ApiLogger, api_logger
+
+BASE_URL = "http://bench.invalid/api"
+
+SIZES = {"small": 100, "medium": 64 * 1024, "huge": 5 * 1024 * 1024}
+
+RESPONSE_HEADERS = {
+    "Date": "Sun, 18 Oct 2026 08:00:00 GMT",
+    "Content-Type": "text/html; charset=utf-8",
+    "Connection": "keep-alive",
+    "Vary": "Accept-Encoding",
+    "Cache-Control": "no-cache",
+    "Server": "bench",
+}
+
+USER = {
+    "name": "Bench User", "email": "bench.user@example.com", "password": "secret123", "title": "Mr",
+    "birth_date": "1", "birth_month": "1", "birth_year": "1990", "firstname": "Bench", "lastname": "User",
+    "company": "Bench Co", "address1": "1 Bench Street", "address2": "Suite 1", "country": "Canada",
+    "zipcode": "12345", "state": "Ontario", "city": "Toronto", "mobile_number": "5550100",
+}
+
+USER_DETAIL = {
+    "id": 1, "name": "Bench User", "email": "bench.user@example.com", "title": "Mr",
+    "birth_day": "1", "birth_month": "1", "birth_year": "1990", "first_name": "Bench", "last_name": "User",
+    "company": "Bench Co", "address1": "1 Bench Street", "address2": "Suite 1", "country": "Canada",
+    "state": "Ontario", "city": "Toronto", "zipcode": "12345",
+}
+
+def build_body(size: int) -> bytes:
+    """A JSON body of roughly ``size`` bytes that matches every endpoint's 200 schema."""
+    products = []
+    envelope = {"responseCode": 200, "message": "OK", "user": USER_DETAIL, "products": products}
+    body = json.dumps(envelope).encode("utf-8")
+    product_bytes = len(json.dumps(PRODUCTS[0])) + 2
+    while len(body) < size:
+        count = max(1, (size - len(body)) // product_bytes)
+        products.extend(dict(PRODUCTS[(len(products) + i) % len(PRODUCTS)], id=len(products) + i + 1)
+                        for i in range(count))
+        body = json.dumps(envelope).encode("utf-8")
+    return body
+
+
+class FakeTransport(HTTPAdapter):
+    """Answers every request with ``self.body`` without touching the network."""
+
+    def __init__(self):
+        super().__init__()
+        self.body = b"{}"
+
+    def send(self, request: requests.PreparedRequest, **kwargs) -> requests.Response:
+        response = requests.Response()
+        response.status_code = 200
+        response.reason = "OK"
+        response.headers = CaseInsensitiveDict(RESPONSE_HEADERS)
+        response.headers["Content-Length"] = str(len(self.body))
+        response._content = self.body
+        response.encoding = "utf-8"
+        response.url = request.url
+        response.request = request
+        response.connection = self
+        return response
+
+
+def verb_calls(client: ApiClient) -> Dict[str, Callable[[], Any]]:
+    return {
+        "GET": lambda: client.get(ApiEndpoints.PRODUCTS_LIST),
+        "POST": lambda: client.post(ApiEndpoints.CREATE_ACCOUNT, data=USER),
+        "PUT": lambda: client.put(ApiEndpoints.UPDATE_ACCOUNT, data=USER),
+        "DELETE": lambda: client.delete(ApiEndpoints.DELETE_ACCOUNT, data={"email": USER["email"], "password": USER["password"]}),
+    }
+
+def reference_call() -> Callable[[], Any]:
+    """Fixed JSON work the client overhead is measured against."""
+    body = build_body(2000)
+
+    def call() -> None:
+        json.loads(body)
+        json.dumps(USER)
+    return call
+
+def calls_per_sec(call: Callable[[], Any], min_time: float, min_calls: int, warmup: bool = True) -> float:
+    if warmup:
+        call()
+    calls = 0
+    start = time.perf_counter()
+    while calls < min_calls or time.perf_counter() - start < min_time:
+        call()
+        calls += 1
+    return calls / (time.perf_counter() - start)
+
+def allocations_per_call(call: Callable[[], Any], calls: int) -> Dict[str, float]:
+    """Peak traced KiB per call and KiB still allocated after ``calls`` calls."""
+    tracemalloc.start()
+    try:
+        before, _ = tracemalloc.get_traced_memory()
+        peaks = []
+        for _ in range(calls):
+            tracemalloc.reset_peak()
+            start, _ = tracemalloc.get_traced_memory()
+            call()
+            _, peak = tracemalloc.get_traced_memory()
+            peaks.append(peak - start)
+        after, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return {"peak_kib": sum(peaks) / len(peaks) / 1024, "retained_kib": (after - before) / calls / 1024}
+
+def configure_logging(log_dir: str) -> None:
+    """Point the API logger at ``log_dir`` and its console output at /dev/null."""
+    devnull = open(os.devnull, "w")
+    api_logger._instance = ApiLogger(log_dir=log_dir)
+    for logger in (api_logger.logger, logging.getLogger("api.api_client")):
+        for handler in logger.handlers:
+            if type(handler) is logging.StreamHandler:
+                handler.setStream(devnull)
+
+def measure(verbs: List[str], sizes: List[str], min_time: float, alloc_calls: int,
+            repeat: int = 10) -> Dict[str, Dict[str, float]]:
+    transport = FakeTransport()
+    client = ApiClient(base_url=BASE_URL)
+    client.session.mount("http://", transport)
+    log_dir = tempfile.TemporaryDirectory(prefix="bench-client-")
+    configure_logging(log_dir.name)
+    calls = verb_calls(client)
+    bodies = {size: build_body(SIZES[size]) for size in sizes}
+    cases = [(size, logging_on, verb) for size in sizes for logging_on in (False, True) for verb in verbs]
+
+    reference = reference_call()
+    results = {}
+    costs: Dict[str, List[float]] = {}
+    reference_us: List[float] = []
+    for round_index in range(max(1, repeat)):
+        for size, logging_on, verb in cases:
+            transport.body = bodies[size]
+            level = logging.INFO if logging_on else logging.WARNING
+            api_logger.logger.setLevel(level)
+            client.logger.setLevel(level)
+            name = f"{verb} {size} log={'on' if logging_on else 'off'}"
+            client.schemas.reset_stats()
+            before = 1e6 / calls_per_sec(reference, min_time / 2, min_calls=3)
+            rate = calls_per_sec(calls[verb], min_time, min_calls=1, warmup=round_index == 0)
+            after = 1e6 / calls_per_sec(reference, min_time / 2, min_calls=3)
+            reference_us.append((before + after) / 2)
+            costs.setdefault(name, []).append(1e6 / rate / reference_us[-1])
+            if name in results and results[name]["calls_per_sec"] >= rate:
+                continue
+            result = results.setdefault(name, allocations_per_call(calls[verb], alloc_calls))
+            result.update(calls_per_sec=rate, schema_us=client.schemas.stats()["us_per_response"])
+    for name, result in results.items():
+        result["relative_cost"] = statistics.median(costs[name])
+        result["reference_us"] = statistics.median(reference_us)
+    client.close()
+    log_dir.cleanup()
+    return results
+
+def compare(results: Dict[str, Dict[str, float]], baseline: Dict[str, Dict[str, float]], threshold: float,
+            noise_us: float) -> List[str]:
+    regressions = []
+    for name, result in results.items():
+        previous = baseline.get(name, {}).get("relative_cost")
+        if not previous:
+            continue
+        current = result["relative_cost"]
+        # Express both costs in microseconds at this run's speed for the noise floor
+        previous_us, current_us = previous * result["reference_us"], current * result["reference_us"]
+        if current > previous * (1 + threshold) and current_us - previous_us > noise_us:
+            regressions.append(f"{name}: relative cost {previous:.1f} -> {current:.1f} "
+                               f"({current / previous - 1:+.0%}, ~{current_us - previous_us:.0f} us/call)")
+    return regressions
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--verbs", nargs="+", default=["GET", "POST", "PUT", "DELETE"])
+    parser.add_argument("--sizes", nargs="+", choices=list(SIZES), default=list(SIZES))
+    parser.add_argument("--min-time", type=float, default=0.05, help="Seconds spent timing each case per round")
+    parser.add_argument("--repeat", type=int, default=10, help="Rounds over all cases")
+    parser.add_argument("--alloc-calls", type=int, default=3, help="Calls traced for allocation figures")
+    parser.add_argument("--save", help="Write results to this JSON file")
+    parser.add_argument("--compare", help="Baseline JSON file to compare against")
+    parser.add_argument("--threshold", type=float, default=0.2, help="Allowed relative growth in relative cost")
+    parser.add_argument("--noise-us", type=float, default=50.0, help="Ignore slowdowns smaller than this per call")
+    args = parser.parse_args()
+
+    results = measure(args.verbs, args.sizes, args.min_time, args.alloc_calls, args.repeat)
+    print(f"{'case':<24} {'calls/s':>10} {'us/call':>10} {'rel cost':>9} {'schema us':>10} {'peak KiB':>10} {'kept KiB':>9}")
+    for name, result in results.items():
+        rate = result["calls_per_sec"]
+        print(f"{name:<24} {rate:>10.1f} {1e6 / rate:>10.1f} {result['relative_cost']:>9.1f} {result['schema_us']:>10.1f} "
+              f"{result['peak_kib']:>10.1f} {result['retained_kib']:>9.1f}")
+
+    if args.save:
+        with open(args.save, "w") as f:
+            json.dump(results, f, indent=2)
+
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+        if not any("relative_cost" in result for result in baseline.values()):
+            print(f"{args.compare} has no relative costs; save a new baseline to compare against.")
+            sys.exit(2)
+        regressions = compare(results, baseline, args.threshold, args.noise_us)
+        if regressions:
+            print("Client overhead regressions:")
+            for line in regressions:
+                print(f"  {line}")
+            sys.exit(1)
+        print("No client overhead regressions.")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+"""Micro-benchmark: JSON decodes per call before and after ApiResponse caching.
+
+The old client decoded a response body once for logging and once in
+``_process_response``; ``test_users.py`` then decoded it two or three more
+times in its assertions. ApiResponse decodes it once.
+
+    python -m benchmarks.bench_response_parse --products 5000
+"""
+import json
+import time
+import argparse
+import requests
+from api.api_response import ApiResponse
+from server.catalog import PRODUCTS
+
+def build_products_response(product_count: int) -> requests.Response:
+    products = [dict(PRODUCTS[i % len(PRODUCTS)], id=i + 1) for i in range(product_count)]
+    response = requests.Response()
+    response.status_code = 200
+    response.encoding = "utf-8"
+    response._content = json.dumps({"responseCode": 200, "products": products}).encode("utf-8")
+    return response
+
+def legacy_call(response: requests.Response) -> None:
+    response.json()                         # logging
+    data = response.json()                  # _process_response
+    response.response_code = data["responseCode"]
+    response.json()["products"]             # assertions
+    response.json().get("message")
+    response.json()
+
+def cached_call(response: requests.Response) -> None:
+    api_response = ApiResponse.from_response(response)
+    api_response.json()
+    data = api_response.json()
+    api_response.response_code = data["responseCode"]
+    api_response.json()["products"]
+    api_response.message
+    api_response.json()
+
+def measure(func, response: requests.Response, iterations: int) -> float:
+    """Return CPU seconds per call."""
+    start = time.process_time()
+    for _ in range(iterations):
+        func(response)
+    return (time.process_time() - start) / iterations
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--products", type=int, default=5000, help="Products in the synthetic productsList payload")
+    parser.add_argument("--iterations", type=int, default=50)
+    args = parser.parse_args()
+
+    response = build_products_response(args.products)
+    size_kb = len(response.content) / 1024
+
+    legacy = measure(legacy_call, response, args.iterations)
+    cached = measure(cached_call, response, args.iterations)
+
+    print(f"productsList payload: {args.products} products, {size_kb:.0f} KiB")
+    print(f"legacy (5 decodes): {legacy * 1000:8.3f} ms CPU/call")
+    print(f"cached (1 decode):  {cached * 1000:8.3f} ms CPU/call")
+    print(f"saved:              {(legacy - cached) * 1000:8.3f} ms CPU/call ({legacy / cached:.1f}x)")
+
+if __name__ == "__main__":
+    main()
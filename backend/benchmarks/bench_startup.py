@@ -0,0 +1,100 @@
+"""Startup benchmark: import and collection time paid by every pytest worker.
+
+Each measurement runs in a fresh interpreter and the median of --repeat runs
+is reported. Save a baseline and compare later runs against it:
+
+    python -m benchmarks.bench_startup --save benchmarks/startup_baseline.json
+    python -m benchmarks.bench_startup --compare benchmarks/startup_baseline.json
+"""
+import os
+import re
+import sys
+import json
+import time
+import argparse
+import statistics
+import subprocess
+from typing import Dict, List
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Modules a worker imports before collection; pytest is preloaded so its own
+# import cost is not attributed to them.
+MODULES = [
+    "config.config",
+    "utils.logger",
+    "utils.helpers",
+    "data.test_data",
+    "api.api_client",
+    "api.api_methods",
+    "conftest",
+]
+
+_IMPORTTIME_LINE = re.compile(r"import time:\s+(\d+)\s+\|\s+(\d+)\s+\|\s+(\S+)")
+
+def import_time_ms(module: str) -> float:
+    """Cumulative import time of ``module`` in a fresh interpreter."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import pytest; import {module}"],
+        cwd=BACKEND_DIR, capture_output=True, text=True, check=True
+    )
+    for line in result.stderr.splitlines():
+        match = _IMPORTTIME_LINE.match(line)
+        if match and match.group(3) == module:
+            return int(match.group(2)) / 1000
+    return 0.0
+
+def collection_time_ms() -> float:
+    """Wall time of a full ``pytest --collect-only`` run, i.e. one worker's startup."""
+    start = time.perf_counter()
+    subprocess.run(
+        [sys.executable, "-m", "pytest", "--collect-only", "-q", "-p", "no:cacheprovider"],
+        cwd=BACKEND_DIR, capture_output=True, check=True
+    )
+    return (time.perf_counter() - start) * 1000
+
+def measure(repeat: int) -> Dict[str, float]:
+    results = {}
+    for module in MODULES:
+        results[f"import:{module}"] = statistics.median(import_time_ms(module) for _ in range(repeat))
+    results["collect"] = statistics.median(collection_time_ms() for _ in range(repeat))
+    return results
+
+def compare(results: Dict[str, float], baseline: Dict[str, float], threshold: float, noise_ms: float) -> List[str]:
+    regressions = []
+    for name, value in results.items():
+        previous = baseline.get(name)
+        if previous is not None and value > previous * (1 + threshold) and value - previous > noise_ms:
+            regressions.append(f"{name}: {previous:.1f} ms -> {value:.1f} ms (+{(value / previous - 1):.0%})")
+    return regressions
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--save", help="Write results to this JSON file")
+    parser.add_argument("--compare", help="Baseline JSON file to compare against")
+    parser.add_argument("--threshold", type=float, default=0.25, help="Allowed relative slowdown")
+    parser.add_argument("--noise-ms", type=float, default=20.0, help="Ignore slowdowns smaller than this")
+    args = parser.parse_args()
+
+    results = measure(args.repeat)
+    for name, value in results.items():
+        print(f"{name:<28} {value:8.1f} ms")
+
+    if args.save:
+        with open(args.save, "w") as f:
+            json.dump(results, f, indent=2)
+
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+        regressions = compare(results, baseline, args.threshold, args.noise_ms)
+        if regressions:
+            print("Startup regressions:")
+            for line in regressions:
+                print(f"  {line}")
+            sys.exit(1)
+        print("No startup regressions.")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,113 @@
+"""Memory benchmark: buffered productsList versus ApiClient.stream.
+
+The buffered path reads the whole body, decodes it into one dict and logs
+that dict. The streamed path parses one product at a time and logs a short
+preview. Bodies are generated lazily by an in-process transport, so the
+traced peak is what the client itself holds; traffic logging is on and
+written to a temporary directory.
+
+    python -m benchmarks.bench_streaming --products 1000 10000 50000
+"""
+import io
+import json
+import time
+import argparse
+import tempfile
+import tracemalloc
+from typing import Dict, Any, Callable, Iterator
+import requests
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+from api.api_client import ApiClient
+from api.api_endpoints import ApiEndpoints
+from benchmarks.bench_client_overhead import BASE_URL, configure_logging
+from server.catalog import PRODUCTS
+
+def catalog_chunks(product_count: int) -> Iterator[bytes]:
+    yield b'{"responseCode": 200, "products": ['
+    for i in range(product_count):
+        product = json.dumps(dict(PRODUCTS[i % len(PRODUCTS)], id=i + 1)).encode("utf-8")
+        yield product if i == 0 else b", " + product
+    yield b"]}"
+
+class _GeneratedBody(io.RawIOBase):
+    """File-like body that produces its bytes only as they are read."""
+
+    def __init__(self, chunks: Iterator[bytes]):
+        self.chunks = chunks
+        self.pending = b""
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+        while not self.pending:
+            self.pending = next(self.chunks, b"")
+            if not self.pending:
+                return 0
+        size = min(len(buffer), len(self.pending))
+        buffer[:size] = self.pending[:size]
+        self.pending = self.pending[size:]
+        return size
+
+
+class GeneratedCatalogTransport(HTTPAdapter):
+    """Answers every request with a lazily generated productsList body."""
+
+    def __init__(self, product_count: int):
+        super().__init__()
+        self.product_count = product_count
+
+    def send(self, request: requests.PreparedRequest, **kwargs) -> requests.Response:
+        response = requests.Response()
+        response.status_code = 200
+        response.reason = "OK"
+        response.headers = CaseInsensitiveDict({"Content-Type": "text/html; charset=UTF-8"})
+        response.raw = io.BufferedReader(_GeneratedBody(catalog_chunks(self.product_count)))
+        response.encoding = "utf-8"
+        response.url = request.url
+        response.request = request
+        return response
+
+
+def traced(call: Callable[[], int]) -> Dict[str, Any]:
+    """Run ``call`` under tracemalloc; return its peak KiB, seconds and item count."""
+    tracemalloc.start()
+    try:
+        start = time.perf_counter()
+        items = call()
+        seconds = time.perf_counter() - start
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return {"peak_kib": peak / 1024, "seconds": seconds, "items": items}
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--products", type=int, nargs="+", default=[1000, 10000, 50000])
+    args = parser.parse_args()
+
+    log_dir = tempfile.TemporaryDirectory(prefix="bench-streaming-")
+    client = ApiClient(base_url=BASE_URL)
+    configure_logging(log_dir.name)
+
+    def buffered() -> int:
+        return len(client.get(ApiEndpoints.PRODUCTS_LIST).json()["products"])
+
+    def streamed() -> int:
+        with client.stream(ApiEndpoints.PRODUCTS_LIST, "products") as response:
+            return sum(1 for _ in response)
+
+    print(f"{'products':>9} {'mode':<9} {'peak KiB':>10} {'seconds':>9}")
+    for product_count in args.products:
+        client.session.mount("http://", GeneratedCatalogTransport(product_count))
+        for mode, call in (("buffered", buffered), ("streamed", streamed)):
+            result = traced(call)
+            assert result["items"] == product_count, f"{mode}: parsed {result['items']} of {product_count} products"
+            print(f"{product_count:>9} {mode:<9} {result['peak_kib']:>10.0f} {result['seconds']:>9.3f}")
+
+    client.close()
+    log_dir.cleanup()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,49 @@
+"""Benchmark: users/sec of generate_test_user() versus UserBatch.
+
+    python -m benchmarks.bench_user_generation --sizes 10000 1000000
+
+generate_test_user() takes roughly a millisecond per user, so for large sizes
+it is timed on the first --legacy-limit users and its rate extrapolated.
+"""
+import time
+import argparse
+from utils.helpers import generate_test_user
+from utils.user_factory import UserBatch
+
+def legacy_rate(count: int) -> float:
+    start = time.perf_counter()
+    for _ in range(count):
+        generate_test_user()
+    return count / (time.perf_counter() - start)
+
+def batch_rates(count: int, seed: int):
+    """Return (users/sec generating the columns, users/sec including materializing every dict)."""
+    start = time.perf_counter()
+    batch = UserBatch(count, seed)
+    generated = time.perf_counter() - start
+    emails = set()
+    for user in batch:
+        emails.add(user["email"])
+    total = time.perf_counter() - start
+    assert len(emails) == count, f"Expected {count} unique emails, got {len(emails)}"
+    return count / generated, count / total
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 1_000_000])
+    parser.add_argument("--legacy-limit", type=int, default=10_000,
+                        help="Max users generated with generate_test_user() per size")
+    parser.add_argument("--seed", type=int, default=1234)
+    args = parser.parse_args()
+
+    print(f"{'users':>10} {'legacy u/s':>12} {'batch gen u/s':>14} {'batch+dict u/s':>15} {'speedup':>8}")
+    for size in args.sizes:
+        legacy = legacy_rate(min(size, args.legacy_limit))
+        generated, materialized = batch_rates(size, args.seed)
+        marker = "*" if size > args.legacy_limit else " "
+        print(f"{size:>10} {legacy:>11.0f}{marker} {generated:>14.0f} {materialized:>15.0f} {materialized / legacy:>7.1f}x")
+    if any(size > args.legacy_limit for size in args.sizes):
+        print(f"* legacy rate measured on the first {args.legacy_limit} users")
+
+if __name__ == "__main__":
+    main()
@@ -1,27 +1,16 @@
-import os
-from dotenv import load_dotenv
+"""Backend configuration.
 
-# Load environment variables from .env file
-load_dotenv()
+``Config`` is built on first access rather than when this module is imported:
+that is when the .env file is read, so importing the module alone costs an
+xdist worker nothing before collection.
+"""
 
-class Config:
-    """Configuration settings for backend tests."""
-    
-    # Base URLs
-    BASE_URL = os.getenv("BASE_URL", "https://www.automationexercise.com")
-    API_BASE_URL = os.getenv("API_BASE_URL", "https://www.automationexercise.com/api")
-    
-    # Timeouts
-    DEFAULT_TIMEOUT = int(os.getenv("DEFAULT_TIMEOUT", 30))
-    
-    # API endpoints
-    API_ENDPOINTS = {
-        "products_list": "productsList",
-        "brands_list": "brandsList",
-        "search_product": "searchProduct",
-        "verify_login": "verifyLogin",
-        "create_account": "createAccount",
-        "delete_account": "deleteAccount",
-        "update_account": "updateAccount",
-        "get_user_detail": "getUserDetailByEmail"
-    }
+def __getattr__(name: str):
+    if name != "Config":
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    from dotenv import load_dotenv
+    # Values from the .env file must be in os.environ before the settings read them
+    load_dotenv()
+    from config.settings import Config
+    globals()["Config"] = Config
+    return Config
@@ -0,0 +1,149 @@
+"""Settings read from the environment.
+
+Import ``Config`` from ``config.config``, which loads the .env file before
+this module is first imported.
+"""
+import os
+import tempfile
+from typing import Tuple
+
+class Config:
+    """Configuration settings for backend tests."""
+    
+    # Base URLs
+    BASE_URL = os.getenv("BASE_URL", "https://www.automationexercise.com")
+    API_BASE_URL = os.getenv("API_BASE_URL", "https://www.automationexercise.com/api")
+    
+    # Record/replay: passthrough, record or replay
+    API_MODE = os.getenv("API_MODE", "passthrough")
+    CASSETTE_DIR = os.getenv("CASSETTE_DIR", "cassettes")
+    # Request fields whose values are ignored when matching recorded requests
+    CASSETTE_IGNORE_FIELDS = [
+        field.strip() for field in os.getenv(
+            "CASSETTE_IGNORE_FIELDS",
+            "name,email,password,title,birth_date,birth_month,birth_year,firstname,lastname,"
+            "company,address1,address2,country,zipcode,state,city,mobile_number"
+        ).split(",") if field.strip()
+    ]
+    
+    # API traffic logging: "sync" writes on the calling thread, "queue" hands
+    # records to a background writer bounded by API_LOG_QUEUE_SIZE
+    API_LOG_MODE = os.getenv("API_LOG_MODE", "sync")
+    API_LOG_QUEUE_SIZE = int(os.getenv("API_LOG_QUEUE_SIZE", 10000))
+    API_LOG_SAMPLE_EVERY = int(os.getenv("API_LOG_SAMPLE_EVERY", 10))
+    # "pretty" multi-line records, or "jsonl" one-line events in a size-rotated file
+    API_LOG_FORMAT = os.getenv("API_LOG_FORMAT", "pretty")
+    API_LOG_MAX_BODY_BYTES = int(os.getenv("API_LOG_MAX_BODY_BYTES", 4096))
+    API_LOG_MAX_FILE_BYTES = int(os.getenv("API_LOG_MAX_FILE_BYTES", 50 * 1024 * 1024))
+    API_LOG_BACKUP_COUNT = int(os.getenv("API_LOG_BACKUP_COUNT", 5))
+    # Fraction of calls logged per endpoint, e.g. "productsList=0.1,*=1"
+    API_LOG_SAMPLE_RATES = {
+        endpoint.strip(): float(rate)
+        for endpoint, rate in (
+            item.split("=", 1) for item in os.getenv("API_LOG_SAMPLE_RATES", "").split(",") if "=" in item
+        )
+    }
+    
+    # Connection pooling
+    API_POOL_CONNECTIONS = int(os.getenv("API_POOL_CONNECTIONS", 10))
+    API_POOL_MAXSIZE = int(os.getenv("API_POOL_MAXSIZE", 10))
+    API_POOL_BLOCK = os.getenv("API_POOL_BLOCK", "false").lower() in ("1", "true", "yes")
+    API_KEEP_ALIVE = os.getenv("API_KEEP_ALIVE", "true").lower() in ("1", "true", "yes")
+    API_ADAPTER_MAX_RETRIES = int(os.getenv("API_ADAPTER_MAX_RETRIES", 0))
+    # Connections opened to the API host before the first test
+    API_WARMUP_CONNECTIONS = int(os.getenv("API_WARMUP_CONNECTIONS", 0))
+    # Concurrent requests per ApiMethods bulk call (create_accounts etc.); at most
+    # the pool size, so batch threads never queue for a connection
+    API_BATCH_WORKERS = min(int(os.getenv("API_BATCH_WORKERS", API_POOL_MAXSIZE)), API_POOL_MAXSIZE)
+    
+    # Client-side rate limits in requests/second, shared by every worker on this host,
+    # e.g. "*=20,productsList=5" ("*" is one budget for all endpoints together);
+    # a full bucket allows API_RATE_LIMIT_BURST seconds' worth of requests at once
+    API_RATE_LIMITS = {
+        endpoint.strip(): float(rate)
+        for endpoint, rate in (
+            item.split("=", 1) for item in os.getenv("API_RATE_LIMITS", "").split(",") if "=" in item
+        )
+    }
+    API_RATE_LIMIT_BURST = float(os.getenv("API_RATE_LIMIT_BURST", 1.0))
+    API_RATE_LIMIT_DIR = os.getenv("API_RATE_LIMIT_DIR", os.path.join(tempfile.gettempdir(), "api-rate-limit"))
+    
+    # GET response cache in ApiClient: "on", "strict" (also re-fetches API_CACHE_VERIFY_RATE
+    # of the hits and fails on a stale one) or "off". Entries are dropped when
+    # createAccount/updateAccount/deleteAccount touches their email; API_CACHE_ENDPOINTS
+    # lists the cached GETs ("*" for all)
+    API_CACHE_MODE = os.getenv("API_CACHE_MODE", "off")
+    API_CACHE_MAX_ENTRIES = int(os.getenv("API_CACHE_MAX_ENTRIES", 256))
+    API_CACHE_ENDPOINTS = [
+        endpoint.strip() for endpoint in os.getenv("API_CACHE_ENDPOINTS", "getUserDetailByEmail").split(",") if endpoint.strip()
+    ]
+    API_CACHE_VERIFY_RATE = float(os.getenv("API_CACHE_VERIFY_RATE", 0.1))
+    
+    # Pre-provisioned accounts: shared ones are leased to read-only tests,
+    # exclusive ones are handed to a single mutating test
+    USER_POOL_SHARED_SIZE = int(os.getenv("USER_POOL_SHARED_SIZE", 1))
+    USER_POOL_EXCLUSIVE_SIZE = int(os.getenv("USER_POOL_EXCLUSIVE_SIZE", 2))
+    USER_POOL_WORKERS = int(os.getenv("USER_POOL_WORKERS", 8))
+    
+    # Generated test users: a fixed TEST_DATA_SEED makes them reproducible (per xdist
+    # worker or load generator process, which each get their own sequence) and,
+    # with USER_CACHE_DIR set, lets generated batches be reused from disk
+    TEST_DATA_SEED = int(os.getenv("TEST_DATA_SEED")) if os.getenv("TEST_DATA_SEED") else None
+    USER_BATCH_SIZE = int(os.getenv("USER_BATCH_SIZE", 1000))
+    USER_CACHE_DIR = os.getenv("USER_CACHE_DIR")
+    
+    # Catalog (productsList/brandsList) snapshot kept for CATALOG_TTL seconds; shared
+    # between xdist workers through CATALOG_CACHE_DIR (default: the pytest cache)
+    CATALOG_TTL = float(os.getenv("CATALOG_TTL", 3600))
+    CATALOG_CACHE_DIR = os.getenv("CATALOG_CACHE_DIR")
+    
+    # Timeouts
+    DEFAULT_TIMEOUT = int(os.getenv("DEFAULT_TIMEOUT", 30))
+    DEFAULT_CONNECT_TIMEOUT = float(os.getenv("DEFAULT_CONNECT_TIMEOUT", 5))
+    
+    # Retries for idempotent (GET) calls: capped exponential backoff with jitter
+    API_RETRY_ATTEMPTS = int(os.getenv("API_RETRY_ATTEMPTS", 3))
+    API_RETRY_BASE_DELAY = float(os.getenv("API_RETRY_BASE_DELAY", 0.2))
+    API_RETRY_MAX_DELAY = float(os.getenv("API_RETRY_MAX_DELAY", 2.0))
+    
+    # Hedged GETs: send a duplicate once a call outlives the endpoint's recent p95
+    API_HEDGE_ENABLED = os.getenv("API_HEDGE_ENABLED", "false").lower() in ("1", "true", "yes")
+    API_HEDGE_PERCENTILE = float(os.getenv("API_HEDGE_PERCENTILE", 95))
+    API_HEDGE_MIN_SAMPLES = int(os.getenv("API_HEDGE_MIN_SAMPLES", 20))
+    
+    # Response schema validation in ApiClient: strict (fail on mismatch), warn or off;
+    # API_SCHEMA_SAMPLE_RATE validates only that fraction of responses
+    API_SCHEMA_MODE = os.getenv("API_SCHEMA_MODE", "strict")
+    API_SCHEMA_SAMPLE_RATE = float(os.getenv("API_SCHEMA_SAMPLE_RATE", 1.0))
+    
+    # Streamed list responses (ApiClient.stream): bytes read per chunk and
+    # items kept as the logged preview
+    API_STREAM_CHUNK_SIZE = int(os.getenv("API_STREAM_CHUNK_SIZE", 64 * 1024))
+    API_STREAM_PREVIEW_ITEMS = int(os.getenv("API_STREAM_PREVIEW_ITEMS", 3))
+    
+    # API endpoints
+    API_ENDPOINTS = {
+        "products_list": "productsList",
+        "brands_list": "brandsList",
+        "search_product": "searchProduct",
+        "verify_login": "verifyLogin",
+        "create_account": "createAccount",
+        "delete_account": "deleteAccount",
+        "update_account": "updateAccount",
+        "get_user_detail": "getUserDetailByEmail"
+    }
+    
+    # Per-endpoint (connect, read) timeouts keyed by API_ENDPOINTS name,
+    # e.g. API_TIMEOUT_PRODUCTS_LIST="3,60"
+    API_TIMEOUTS = {
+        name: tuple(float(value) for value in os.getenv(f"API_TIMEOUT_{name.upper()}").split(","))
+        for name in API_ENDPOINTS if os.getenv(f"API_TIMEOUT_{name.upper()}")
+    }
+    
+    @classmethod
+    def get_timeout(cls, endpoint: str) -> Tuple[float, float]:
+        """Return the (connect, read) timeout for an endpoint path such as "productsList"."""
+        for name, path in cls.API_ENDPOINTS.items():
+            if path == endpoint.lstrip("/") and name in cls.API_TIMEOUTS:
+                return cls.API_TIMEOUTS[name]
+        return cls.DEFAULT_CONNECT_TIMEOUT, float(cls.DEFAULT_TIMEOUT)
@@ -1,23 +1,244 @@
 import os
+import asyncio
+import contextlib
 import pytest
-from dotenv import load_dotenv
+import pytest_asyncio
 from api.api_client import ApiClient
+from api.cassette import Cassette, CassetteNormalizer, API_MODES, PASSTHROUGH, RECORD, clear_recordings
 from api.api_methods import ApiMethods
+from api.rate_limit import merge_wait_stats
+from api.response_cache import merge_cache_stats
+from api.async_api_client import AsyncApiClient
+from api.async_api_methods import AsyncApiMethods
+from data.user_pool import UserPool, delete_created_accounts
+from data.prerequisites import Prerequisites, saved_round_trips
+from data.catalog_cache import CatalogCache
+from server.local_api_server import LocalApiServer
+from config.config import Config
 
-# Load environment variables from .env file
-load_dotenv()
+pytest_plugins = ["plugins.latency_report", "plugins.duration_scheduler", "plugins.trace_timeline", "plugins.api_profiler", "plugins.latency_gate"]
+
+connection_stats_key = pytest.StashKey[dict]()
+prerequisite_stats_key = pytest.StashKey[dict]()
+rate_limit_stats_key = pytest.StashKey[dict]()
+response_cache_stats_key = pytest.StashKey[dict]()
+
+# Cassette file name in --cassette-dir; xdist workers record "api-gw<N>"
+CASSETTE_NAME = "api"
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--local-api",
+        action="store_true",
+        default=os.getenv("API_LOCAL_SERVER", "").lower() in ("1", "true", "yes"),
+        help="Run tests against the bundled in-process API server instead of API_BASE_URL."
+    )
+    parser.addoption(
+        "--api-mode",
+        choices=API_MODES,
+        default=Config.API_MODE,
+        help="passthrough: call the API; record: call it and save a cassette; replay: serve from the cassette."
+    )
+    parser.addoption(
+        "--cassette-dir",
+        default=Config.CASSETTE_DIR,
+        help="Directory holding recorded cassettes."
+    )
+
+def pytest_configure(config):
+    # Workers record their own cassettes; clear the previous recording first so replay never mixes the two
+    if config.getoption("--api-mode") == RECORD and not hasattr(config, "workerinput"):
+        clear_recordings(config.getoption("--cassette-dir"), CASSETTE_NAME)
+
+@pytest.fixture(scope="session")
+def local_api_server():
+    """Start the in-process API server on an ephemeral port."""
+    with LocalApiServer() as server:
+        yield server
 
 @pytest.fixture(scope="session")
-def api_base_url():
+def api_base_url(request):
     """Return API base URL."""
+    if request.config.getoption("--local-api"):
+        return request.getfixturevalue("local_api_server").base_url
     return os.getenv("API_BASE_URL", "https://www.automationexercise.com/api")
 
 @pytest.fixture(scope="session")
-def api_client(api_base_url):
+def api_client(request, api_base_url):
     """Return API client instance."""
-    return ApiClient(base_url=api_base_url)
+    api_mode = request.config.getoption("--api-mode")
+    cassette = None
+    if api_mode != PASSTHROUGH:
+        name = CASSETTE_NAME
+        worker = os.getenv("PYTEST_XDIST_WORKER")
+        if api_mode == RECORD and worker:
+            name = f"{CASSETTE_NAME}-{worker}"
+        cassette = Cassette(request.config.getoption("--cassette-dir"), name=name, mode=api_mode)
+
+    client = ApiClient(
+        base_url=api_base_url,
+        api_mode=api_mode,
+        cassette=cassette,
+        normalizer=CassetteNormalizer(Config.CASSETTE_IGNORE_FIELDS)
+    )
+    client.warmup(Config.API_WARMUP_CONNECTIONS)
+    yield client
+    request.config.stash[connection_stats_key] = client.connection_stats()
+    if client.rate_limiter is not None:
+        request.config.stash[rate_limit_stats_key] = client.rate_limiter.stats()
+    if client.response_cache is not None:
+        request.config.stash[response_cache_stats_key] = client.response_cache.stats()
+    client.close()
+
+def cassette_session_scope(api_client, name: str):
+    """Record or replay the block's requests under the session scope ``name``, then restore the test's scope."""
+    if api_client.cassette is None:
+        return contextlib.nullcontext()
+    return api_client.cassette.in_scope(f"session:{name}")
+
+@pytest.fixture(autouse=True)
+def cassette_scope(request):
+    """Key recorded requests by test so replay is independent of run order."""
+    if request.config.getoption("--api-mode") != PASSTHROUGH:
+        request.getfixturevalue("api_client").cassette.scope = request.node.nodeid
 
 @pytest.fixture(scope="session")
 def api_methods(api_client):
-    """Return API methods instance."""
-    return ApiMethods(api_client=api_client)
\ No newline at end of file
+    """Return API methods instance; accounts it created are deleted at session end."""
+    methods = ApiMethods(api_client=api_client)
+    yield methods
+    with cassette_session_scope(api_client, "teardown"):
+        failures = delete_created_accounts(methods, max_workers=Config.USER_POOL_WORKERS)
+    if failures:
+        api_client.logger.warning(f"Could not delete {len(failures)} test accounts: {failures}")
+
+@pytest.fixture(scope="session")
+def user_pool(api_client, api_methods):
+    """Provision pooled accounts concurrently before the first test that needs one."""
+    pool = UserPool(
+        api_methods,
+        shared_size=Config.USER_POOL_SHARED_SIZE,
+        exclusive_size=Config.USER_POOL_EXCLUSIVE_SIZE,
+        max_workers=Config.USER_POOL_WORKERS
+    )
+    with cassette_session_scope(api_client, "user_pool"):
+        pool.provision()
+    return pool
+
+@pytest.fixture(scope="session")
+def catalog(request, api_client, api_methods):
+    """Products and brands fetched once (per CATALOG_TTL, shared across workers) and keyword-indexed."""
+    cache_dir = Config.CATALOG_CACHE_DIR
+    if api_client.cassette is not None:
+        # Recorded runs must contain the catalog requests, so no shared snapshot
+        cache_dir = None
+    elif cache_dir is None and getattr(request.config, "cache", None) is not None:
+        cache_dir = str(request.config.cache.mkdir("catalog"))
+    cache = CatalogCache(api_methods, ttl=Config.CATALOG_TTL, cache_dir=cache_dir)
+    with cassette_session_scope(api_client, "catalog"):
+        cache.snapshot()
+    return cache
+
+@pytest.fixture(scope="session")
+def prerequisite_cache(request, user_pool):
+    """Per-worker store of declared prerequisite state."""
+    cache = Prerequisites(user_pool)
+    request.config.stash[prerequisite_stats_key] = cache.stats
+    return cache
+
+@pytest.fixture
+def prerequisites(request, prerequisite_cache):
+    """State declared with ``@pytest.mark.requires(*names, mutates=False)``, keyed by name."""
+    marker = request.node.get_closest_marker("requires")
+    if marker is None:
+        return {}
+    mutates = marker.kwargs.get("mutates", False)
+    return {name: prerequisite_cache.get(name, mutates=mutates) for name in marker.args}
+
+@pytest_asyncio.fixture
+async def async_api_client(request, api_base_url):
+    """Return async API client instance bound to the test's event loop."""
+    if request.config.getoption("--api-mode") != PASSTHROUGH:
+        pytest.skip("AsyncApiClient does not record or replay cassettes")
+    async with AsyncApiClient(base_url=api_base_url) as client:
+        yield client
+
+@pytest_asyncio.fixture
+async def async_api_methods(async_api_client):
+    """Return async API methods instance; accounts it created are deleted after the test."""
+    methods = AsyncApiMethods(api_client=async_api_client)
+    yield methods
+    await asyncio.gather(
+        *(methods.delete_account(email, password) for email, password in methods.tracked_accounts().items()),
+        return_exceptions=True
+    )
+    # Accounts whose delete failed or raised are still tracked
+    leftover = methods.tracked_accounts()
+    if leftover:
+        async_api_client.logger.warning(f"Could not delete {len(leftover)} test accounts: {sorted(leftover)}")
+
+def pytest_sessionfinish(session):
+    workeroutput = getattr(session.config, "workeroutput", None)
+    if workeroutput is not None:
+        workeroutput["prerequisite_stats"] = session.config.stash.get(prerequisite_stats_key, {})
+        workeroutput["rate_limit_stats"] = session.config.stash.get(rate_limit_stats_key, {})
+        workeroutput["response_cache_stats"] = session.config.stash.get(response_cache_stats_key, {})
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_testnodedown(node, error):
+    worker_stats = getattr(node, "workeroutput", {}).get("prerequisite_stats", {})
+    totals = node.config.stash.setdefault(prerequisite_stats_key, {})
+    for name, counts in worker_stats.items():
+        merged = totals.setdefault(name, dict.fromkeys(counts, 0))
+        for key, count in counts.items():
+            merged[key] = merged.get(key, 0) + count
+    merge_wait_stats(
+        node.config.stash.setdefault(rate_limit_stats_key, {}),
+        getattr(node, "workeroutput", {}).get("rate_limit_stats", {})
+    )
+    merge_cache_stats(
+        node.config.stash.setdefault(response_cache_stats_key, {}),
+        getattr(node, "workeroutput", {}).get("response_cache_stats", {})
+    )
+
+def pytest_terminal_summary(terminalreporter, config):
+    prerequisite_stats = config.stash.get(prerequisite_stats_key, {})
+    if prerequisite_stats and not hasattr(config, "workeroutput"):
+        terminalreporter.write_sep("-", "API prerequisites")
+        for name, counts in sorted(prerequisite_stats.items()):
+            terminalreporter.write_line(
+                f"{name}: {counts['shared']} shared uses from {counts['materialized']} setups, "
+                f"{counts['isolated']} isolated"
+            )
+        terminalreporter.write_line(f"{saved_round_trips(prerequisite_stats)} API round trips saved")
+    stats = config.stash.get(connection_stats_key, None)
+    if stats and stats["requests"]:
+        terminalreporter.write_sep("-", "API connections")
+        terminalreporter.write_line(
+            f"{stats['requests']} requests, {stats['new_connections']} new connections "
+            f"({stats['warmed_connections']} warmed up), {stats['reused']} reused "
+            f"({stats['reused'] / stats['requests']:.0%})"
+        )
+    rate_limit_stats = config.stash.get(rate_limit_stats_key, {})
+    if rate_limit_stats and not hasattr(config, "workeroutput"):
+        terminalreporter.write_sep("-", "API rate limiting")
+        for endpoint, counts in sorted(rate_limit_stats.items()):
+            terminalreporter.write_line(
+                f"{endpoint}: {counts['throttled']} of {counts['requests']} requests throttled, "
+                f"{counts['wait_s']:.2f}s waiting (max {counts['max_wait_s'] * 1000:.0f} ms)"
+            )
+        total_wait = sum(counts["wait_s"] for counts in rate_limit_stats.values())
+        terminalreporter.write_line(f"{total_wait:.2f}s spent throttled in total")
+    cache_stats = config.stash.get(response_cache_stats_key, {})
+    if cache_stats and not hasattr(config, "workeroutput"):
+        terminalreporter.write_sep("-", "API response cache")
+        lookups = cache_stats["hits"] + cache_stats["misses"]
+        terminalreporter.write_line(
+            f"{cache_stats['hits']} hits, {cache_stats['misses']} misses "
+            f"({cache_stats['hits'] / lookups if lookups else 0:.0%} hit rate), "
+            f"{cache_stats['evictions']} evictions, {cache_stats['invalidations']} invalidated by writes"
+        )
+        if cache_stats["verified"]:
+            terminalreporter.write_line(
+                f"{cache_stats['verified']} hits verified against the server, {cache_stats['stale']} stale"
+            )
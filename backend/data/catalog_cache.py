@@ -0,0 +1,181 @@
+"""Session catalog cache: productsList and brandsList fetched once, indexed for lookups.
+
+The catalog rarely changes within a run, so it is fetched once and kept for
+``ttl`` seconds. With a ``cache_dir`` the snapshot is written to a JSON file
+guarded by an flock, so xdist workers share one fetch instead of each making
+their own.
+
+``CatalogIndex`` maps every keyword in product names, categories and brands
+to product ids. ``search(term)`` reproduces the API's searchProduct match (a
+case-insensitive substring of name or category) by intersecting the
+candidates of each word of ``term`` and checking only those products.
+"""
+import os
+import re
+import json
+import time
+import hashlib
+from contextlib import contextmanager
+from http import HTTPStatus
+from typing import Dict, Any, Iterator, List, Optional, Set
+from api.api_methods import ApiMethods
+
+try:
+    import fcntl
+except ImportError:  # Windows: workers fetch independently
+    fcntl = None
+
+_WORD = re.compile(r"[a-z0-9]+")
+
+# Fields searchProduct matches against
+SEARCH_FIELDS = ("name", "category")
+
+def _fields(product: Dict[str, Any]) -> Dict[str, str]:
+    category = product.get("category") or {}
+    return {
+        "name": product.get("name", ""),
+        "category": category.get("category", ""),
+        "usertype": (category.get("usertype") or {}).get("usertype", ""),
+        "brand": product.get("brand", ""),
+    }
+
+
+class CatalogIndex:
+    """Inverted keyword index over a product list."""
+
+    def __init__(self, products: List[Dict[str, Any]], brands: Optional[List[Dict[str, Any]]] = None):
+        self.products = products
+        self.brands = brands or []
+        self._fields = [{name: value.lower() for name, value in _fields(product).items()} for product in products]
+        self.postings: Dict[str, Set[int]] = {}
+        for position, fields in enumerate(self._fields):
+            for value in fields.values():
+                for word in _WORD.findall(value):
+                    self.postings.setdefault(word, set()).add(position)
+        self._vocabulary = sorted(self.postings)
+        self._substring_memo: Dict[str, Set[int]] = {}
+
+    def _containing(self, fragment: str) -> Set[int]:
+        """Positions of products with a keyword containing ``fragment``."""
+        positions = self._substring_memo.get(fragment)
+        if positions is None:
+            positions = set()
+            for word in self._vocabulary:
+                if fragment in word:
+                    positions |= self.postings[word]
+            self._substring_memo[fragment] = positions
+        return positions
+
+    def search(self, term: str, fields=SEARCH_FIELDS) -> List[Dict[str, Any]]:
+        """Products a searchProduct call for ``term`` should return, in catalog order."""
+        term = term.lower()
+        fragments = _WORD.findall(term)
+        if fragments:
+            candidates = set.intersection(*(self._containing(fragment) for fragment in fragments))
+        else:
+            candidates = range(len(self.products))
+        return [
+            self.products[position] for position in sorted(candidates)
+            if any(term in self._fields[position][field] for field in fields)
+        ]
+
+    def by_brand(self, brand: str) -> List[Dict[str, Any]]:
+        brand = brand.lower()
+        return [product for position, product in enumerate(self.products) if self._fields[position]["brand"] == brand]
+
+
+class CatalogCache:
+    """Products and brands fetched through ``api_methods`` at most once per ``ttl`` seconds.
+
+    Args:
+        api_methods: ApiMethods used to fetch the catalog
+        ttl: Seconds a snapshot stays valid
+        cache_dir: Directory for the snapshot shared between processes; None keeps it in memory only
+    """
+
+    def __init__(self, api_methods: ApiMethods, ttl: float = 3600, cache_dir: Optional[str] = None):
+        self.api_methods = api_methods
+        self.ttl = ttl
+        self.cache_dir = cache_dir
+        self.fetches = 0
+        self._snapshot: Optional[Dict[str, Any]] = None
+        self._index: Optional[CatalogIndex] = None
+
+    @property
+    def path(self) -> Optional[str]:
+        if not self.cache_dir:
+            return None
+        key = hashlib.sha1(self.api_methods.api_client.base_url.encode("utf-8")).hexdigest()[:12]
+        return os.path.join(self.cache_dir, f"catalog_{key}.json")
+
+    def _fresh(self, snapshot: Optional[Dict[str, Any]]) -> bool:
+        return snapshot is not None and time.time() - snapshot["fetched_at"] < self.ttl
+
+    def _fetch(self) -> Dict[str, Any]:
+        products = self.api_methods.get_all_products()
+        brands = self.api_methods.get_all_brands()
+        for response in (products, brands):
+            if response.response_code != HTTPStatus.OK:
+                raise RuntimeError(f"Could not fetch catalog from {response.url}: {response.text}")
+        self.fetches += 1
+        return {"fetched_at": time.time(), "products": products.json()["products"], "brands": brands.json()["brands"]}
+
+    @contextmanager
+    def _file_lock(self) -> Iterator[None]:
+        os.makedirs(self.cache_dir, exist_ok=True)
+        with open(f"{self.path}.lock", "w") as lock:
+            if fcntl is not None:
+                fcntl.flock(lock, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(lock, fcntl.LOCK_UN)
+
+    def _read_file(self) -> Optional[Dict[str, Any]]:
+        try:
+            with open(self.path) as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def _write_file(self, snapshot: Dict[str, Any]) -> None:
+        tmp_path = f"{self.path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(snapshot, f, separators=(",", ":"))
+        os.replace(tmp_path, self.path)
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Return a fresh snapshot, fetching it (once across processes) if needed."""
+        if self._fresh(self._snapshot):
+            return self._snapshot
+        if self.path is None:
+            snapshot = self._fetch()
+        else:
+            with self._file_lock():
+                snapshot = self._read_file()
+                if not self._fresh(snapshot):
+                    snapshot = self._fetch()
+                    self._write_file(snapshot)
+        self._snapshot = snapshot
+        self._index = None
+        return snapshot
+
+    @property
+    def products(self) -> List[Dict[str, Any]]:
+        return self.snapshot()["products"]
+
+    @property
+    def brands(self) -> List[Dict[str, Any]]:
+        return self.snapshot()["brands"]
+
+    @property
+    def index(self) -> CatalogIndex:
+        snapshot = self.snapshot()
+        if self._index is None:
+            self._index = CatalogIndex(snapshot["products"], snapshot["brands"])
+        return self._index
+
+    def search(self, term: str) -> List[Dict[str, Any]]:
+        """Products searchProduct should return for ``term``, from the cached catalog."""
+        return self.index.search(term)
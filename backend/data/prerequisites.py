@@ -0,0 +1,77 @@
+"""Declared prerequisite state for tests, shared when read-only.
+
+Tests state what must exist before they run with
+``@pytest.mark.requires("existing_account")`` and read it from the
+``prerequisites`` fixture. Read-only tests share one instance per name per
+worker; tests marked ``mutates=True`` get an isolated instance of their own.
+"""
+import copy
+import threading
+from typing import Dict, Any, Callable
+from data.user_pool import UserPool
+
+class Prerequisite:
+    """How to build one named piece of state.
+
+    Args:
+        shared: Builds the instance shared by read-only tests
+        isolated: Builds an instance for one mutating test
+        round_trips: API calls a test would spend setting this up (and tearing it down) itself
+    """
+
+    def __init__(self, shared: Callable[[UserPool], Any], isolated: Callable[[UserPool], Any], round_trips: int):
+        self.shared = shared
+        self.isolated = isolated
+        self.round_trips = round_trips
+
+def _leased_account(pool: UserPool) -> Dict[str, Any]:
+    with pool.lease() as user:
+        return user
+
+def _exclusive_account(pool: UserPool) -> Dict[str, Any]:
+    return pool.exclusive()
+
+PREREQUISITES: Dict[str, Prerequisite] = {
+    # createAccount up front, deleteAccount at session end
+    "existing_account": Prerequisite(shared=_leased_account, isolated=_exclusive_account, round_trips=2),
+}
+
+class Prerequisites:
+    """Materializes prerequisites for one worker and counts the API round trips sharing saved."""
+
+    def __init__(self, user_pool: UserPool):
+        self.user_pool = user_pool
+        self._shared: Dict[str, Any] = {}
+        self._lock = threading.Lock()
+        # name -> {"shared": uses, "materialized": shared builds, "isolated": isolated builds}
+        self.stats: Dict[str, Dict[str, int]] = {}
+
+    def _count(self, name: str, key: str) -> None:
+        counts = self.stats.setdefault(name, {"shared": 0, "materialized": 0, "isolated": 0})
+        counts[key] += 1
+
+    def get(self, name: str, mutates: bool = False) -> Any:
+        """Return the state ``name``: a copy of the shared instance, or a new one if ``mutates``."""
+        if name not in PREREQUISITES:
+            raise KeyError(f"Unknown prerequisite '{name}'; known: {sorted(PREREQUISITES)}")
+        prerequisite = PREREQUISITES[name]
+        if mutates:
+            with self._lock:
+                self._count(name, "isolated")
+            return prerequisite.isolated(self.user_pool)
+        with self._lock:
+            if name not in self._shared:
+                self._shared[name] = prerequisite.shared(self.user_pool)
+                self._count(name, "materialized")
+            self._count(name, "shared")
+            return copy.deepcopy(self._shared[name])
+
+    def round_trips_saved(self) -> int:
+        return saved_round_trips(self.stats)
+
+def saved_round_trips(stats: Dict[str, Dict[str, int]]) -> int:
+    """Round trips avoided by serving shared uses from fewer materializations."""
+    return sum(
+        (counts["shared"] - counts["materialized"]) * PREREQUISITES[name].round_trips
+        for name, counts in stats.items() if name in PREREQUISITES
+    )
@@ -1,9 +1,28 @@
 """Test data for backend API tests."""
-from faker import Faker
-from utils.helpers import generate_test_user, generate_payment_details
+from config.config import Config
+from utils.helpers import generate_test_user, generate_payment_details, get_faker
+from utils.user_factory import UserStream
 
-# Initialize Faker
-fake = Faker()
+# Batch-generated users handed out by TestData.get_dynamic_user()
+user_stream = UserStream(
+    batch_size=Config.USER_BATCH_SIZE,
+    seed=Config.TEST_DATA_SEED,
+    cache_dir=Config.USER_CACHE_DIR
+)
+
+class _LazyClassAttribute:
+    """Class attribute computed on first access and then stored on the class."""
+    
+    def __init__(self, factory):
+        self.factory = factory
+    
+    def __set_name__(self, owner, name):
+        self.name = name
+    
+    def __get__(self, instance, owner):
+        value = self.factory()
+        setattr(owner, self.name, value)
+        return value
 
 class TestData:
     """Test data class."""
@@ -15,8 +34,8 @@ class TestData:
         "name": "Test User"
     }
     
-    # Dynamic user data that will be regenerated when imported
-    TEST_USER = generate_test_user()
+    # Dynamic user data, generated on first access
+    TEST_USER = _LazyClassAttribute(generate_test_user)
     
     # Invalid user data
     INVALID_USER = {
@@ -25,13 +44,13 @@ class TestData:
     }
     
     # Product search data
-    PRODUCT_SEARCH = {
-        "valid_product": fake.random_element(elements=["top", "dress", "tshirt", "jeans"]),
-        "invalid_product": f"invalid{fake.pystr(min_chars=8, max_chars=12)}"
-    }
+    PRODUCT_SEARCH = _LazyClassAttribute(lambda: {
+        "valid_product": get_faker().random_element(elements=["top", "dress", "tshirt", "jeans"]),
+        "invalid_product": f"invalid{get_faker().pystr(min_chars=8, max_chars=12)}"
+    })
     
     # Payment details
-    PAYMENT_DETAILS = generate_payment_details()
+    PAYMENT_DETAILS = _LazyClassAttribute(generate_payment_details)
     
     @staticmethod
     def get_dynamic_user():
@@ -40,4 +59,4 @@ class TestData:
         Returns:
             Newly generated user data
         """
-        return generate_test_user()
+        return user_stream.next_user()
@@ -0,0 +1,87 @@
+"""Pre-provisioned user accounts shared across a test session."""
+import os
+import uuid
+import itertools
+import threading
+from contextlib import contextmanager
+from http import HTTPStatus
+from typing import Dict, Any, List, Iterator, Tuple
+from api.api_methods import ApiMethods
+from data.test_data import TestData
+
+class UserPoolError(RuntimeError):
+    """Raised when the pool cannot provision an account."""
+
+def delete_created_accounts(api_methods: ApiMethods, max_workers: int = 8) -> List[Tuple[str, Any]]:
+    """Delete every account created through ``api_methods`` and not yet deleted, in parallel.
+
+    Returns:
+        (email, error) pairs for accounts that could not be deleted
+    """
+    results = api_methods.delete_accounts(list(api_methods.tracked_accounts().items()), max_workers=max_workers)
+    return [
+        (result.item[0], result.error if result.error is not None else result.response.text)
+        for result in results if not result.ok
+    ]
+
+class UserPool:
+    """Accounts created up front and handed out to tests.
+
+    Shared accounts are leased to read-only tests (many at once, round robin);
+    exclusive accounts are handed to a single mutating test and never reused.
+    Emails carry the xdist worker id so pools on different workers never collide.
+    """
+
+    def __init__(self, api_methods: ApiMethods, shared_size: int = 2, exclusive_size: int = 4, max_workers: int = 8):
+        self.api_methods = api_methods
+        self.shared_size = shared_size
+        self.exclusive_size = exclusive_size
+        self.max_workers = max(1, max_workers)
+        self.worker_id = os.getenv("PYTEST_XDIST_WORKER", "main")
+        self.leases = 0
+        self._shared: List[Dict[str, Any]] = []
+        self._exclusive: List[Dict[str, Any]] = []
+        self._round_robin = itertools.count()
+        self._lock = threading.Lock()
+
+    def new_user(self) -> Dict[str, Any]:
+        """Generate user data with an email unique to this worker."""
+        user = TestData.get_dynamic_user()
+        user["email"] = f"pool.{self.worker_id}.{uuid.uuid4().hex[:12]}.{user['email']}"
+        return user
+
+    def _create(self, user: Dict[str, Any]) -> Dict[str, Any]:
+        response = self.api_methods.create_account(user)
+        if response.response_code != HTTPStatus.CREATED:
+            raise UserPoolError(f"Could not provision pool account {user['email']}: {response.text}")
+        return user
+
+    def provision(self) -> None:
+        """Create all shared and exclusive accounts concurrently."""
+        users = [self.new_user() for _ in range(self.shared_size + self.exclusive_size)]
+        results = self.api_methods.create_accounts(users, max_workers=self.max_workers)
+        for result in results:
+            if result.error is not None:
+                raise result.error
+            if not result.ok:
+                raise UserPoolError(f"Could not provision pool account {result.item['email']}: {result.response.text}")
+        created = [result.item for result in results]
+        self._shared = created[:self.shared_size]
+        self._exclusive = created[self.shared_size:]
+
+    @contextmanager
+    def lease(self) -> Iterator[Dict[str, Any]]:
+        """Lease a shared account for read-only use; yields a copy of its data."""
+        with self._lock:
+            if not self._shared:
+                self._shared.append(self._create(self.new_user()))
+            user = self._shared[next(self._round_robin) % len(self._shared)]
+            self.leases += 1
+        yield dict(user)
+
+    def exclusive(self) -> Dict[str, Any]:
+        """Take an account no other test will see; created on demand once the reserve runs out."""
+        with self._lock:
+            if self._exclusive:
+                return self._exclusive.pop()
+        return self._create(self.new_user())
@@ -0,0 +1,348 @@
+"""Open-model load generator over ApiMethods scenarios.
+
+    python -m load.generator --local-api --scenario user_lifecycle --rate 20 --duration 30 --ramp-up 10
+    python -m load.generator --stages 30:10,60:50,30:50 --processes 4 --json run.json --csv run.csv
+
+Scenario starts follow the arrival rate alone, whatever the response times
+(open model), so a slow API does not throttle the load. Starts that wait for
+a free thread are reported as queue time instead of being dropped from the
+numbers. A stage ``seconds:rate`` ramps linearly from the previous rate (0 at
+the start) to ``rate`` scenarios/sec over ``seconds``.
+"""
+import os
+import csv
+import json
+import random
+import logging
+import argparse
+import threading
+from time import perf_counter, sleep
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+from multiprocessing import get_context
+from typing import Dict, Any, Iterator, List, Optional, Tuple
+from api.api_client import ApiClient
+from api.api_methods import ApiMethods
+from api.latency import LatencyHistogram
+from config.config import Config
+from data.test_data import user_stream
+from data.user_pool import delete_created_accounts
+from load.scenarios import SCENARIOS, Step, new_context
+
+# Resolution of the arrival schedule
+_TICK = 0.001
+
+def parse_stages(text: str) -> List[Tuple[float, float]]:
+    """Parse ``"30:10,60:50"`` into [(30.0, 10.0), (60.0, 50.0)]."""
+    stages = []
+    for item in text.split(","):
+        seconds, rate = item.split(":")
+        stages.append((float(seconds), float(rate)))
+    return stages
+
+def arrival_times(stages: List[Tuple[float, float]], scale: float = 1.0, poisson: bool = False,
+                  phase: float = 0.0, rng: Optional[random.Random] = None) -> Iterator[float]:
+    """Yield scenario start offsets (seconds) for a piecewise-linear rate profile.
+
+    Args:
+        stages: (duration, target rate) pairs; each ramps linearly from the previous rate
+        scale: Fraction of the rate this process generates
+        poisson: Exponential inter-arrival times instead of evenly spaced ones
+        phase: Offset in [0, 1) of the first arrival, so processes interleave
+        rng: Random source for poisson arrivals
+
+    Returns:
+        Generator of arrival offsets from the start of the run
+    """
+    rng = rng or random.Random()
+    expected = 0.0
+    threshold = rng.expovariate(1.0) if poisson else 1.0 - phase
+    start, previous_rate = 0.0, 0.0
+    for duration, rate in stages:
+        if duration <= 0:
+            previous_rate = rate
+            continue
+        steps = int(duration / _TICK)
+        for step in range(steps):
+            t = step * _TICK
+            current = (previous_rate + (rate - previous_rate) * (t + _TICK / 2) / duration) * scale
+            expected += current * _TICK
+            while expected >= threshold:
+                yield start + t
+                threshold += rng.expovariate(1.0) if poisson else 1.0
+        start += duration
+        previous_rate = rate
+
+def profile_duration(stages: List[Tuple[float, float]]) -> float:
+    return sum(duration for duration, _ in stages)
+
+
+class StepStats:
+    """Latency and outcome counts of one scenario step."""
+
+    def __init__(self):
+        self.histogram = LatencyHistogram()
+        self.ok = 0
+        self.errors = 0
+        self.skipped = 0
+        self.reasons: Dict[str, int] = {}
+
+    def error(self, reason: str) -> None:
+        self.errors += 1
+        self.reasons[reason] = self.reasons.get(reason, 0) + 1
+
+    def merge(self, other: "StepStats") -> None:
+        self.histogram.merge(other.histogram)
+        self.ok += other.ok
+        self.errors += other.errors
+        self.skipped += other.skipped
+        for reason, count in other.reasons.items():
+            self.reasons[reason] = self.reasons.get(reason, 0) + count
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {"histogram": self.histogram.to_dict(), "ok": self.ok, "errors": self.errors,
+                "skipped": self.skipped, "reasons": self.reasons}
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "StepStats":
+        stats = cls()
+        stats.histogram = LatencyHistogram.from_dict(data["histogram"])
+        stats.ok, stats.errors, stats.skipped = data["ok"], data["errors"], data["skipped"]
+        stats.reasons = dict(data["reasons"])
+        return stats
+
+
+class LoadStats:
+    """Per-step stats plus end-to-end scenario and queue time for one run."""
+
+    def __init__(self, step_names: List[str]):
+        self.steps = {name: StepStats() for name in step_names}
+        self.scenario = StepStats()
+        self.queue = LatencyHistogram()
+        self.elapsed = 0.0
+        self.leaked_accounts = 0
+        self._lock = threading.Lock()
+
+    def merge(self, other: "LoadStats") -> None:
+        for name, stats in other.steps.items():
+            self.steps[name].merge(stats)
+        self.scenario.merge(other.scenario)
+        self.queue.merge(other.queue)
+        self.elapsed = max(self.elapsed, other.elapsed)
+        self.leaked_accounts += other.leaked_accounts
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "steps": {name: stats.to_dict() for name, stats in self.steps.items()},
+            "scenario": self.scenario.to_dict(),
+            "queue": self.queue.to_dict(),
+            "elapsed": self.elapsed,
+            "leaked_accounts": self.leaked_accounts
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "LoadStats":
+        stats = cls(list(data["steps"]))
+        stats.steps = {name: StepStats.from_dict(step) for name, step in data["steps"].items()}
+        stats.scenario = StepStats.from_dict(data["scenario"])
+        stats.queue = LatencyHistogram.from_dict(data["queue"])
+        stats.elapsed = data["elapsed"]
+        stats.leaked_accounts = data["leaked_accounts"]
+        return stats
+
+    def rows(self) -> List[Dict[str, Any]]:
+        """One summary row per step, then the whole scenario (including queue time)."""
+        rows = []
+        for name, stats in list(self.steps.items()) + [("scenario", self.scenario)]:
+            attempts = stats.ok + stats.errors
+            histogram = stats.histogram
+            rows.append({
+                "step": name,
+                "requests": attempts,
+                "errors": stats.errors,
+                "skipped": stats.skipped,
+                "error_rate": round(stats.errors / attempts, 4) if attempts else 0.0,
+                "throughput_rps": round(attempts / self.elapsed, 2) if self.elapsed else 0.0,
+                "p50_ms": round(histogram.percentile(50), 2),
+                "p90_ms": round(histogram.percentile(90), 2),
+                "p99_ms": round(histogram.percentile(99), 2),
+                "max_ms": round(histogram.max_ms, 2),
+                "mean_ms": round(histogram.mean_ms, 2)
+            })
+        return rows
+
+
+def run_scenario(methods: ApiMethods, steps: List[Step], stats: LoadStats, scheduled: float) -> None:
+    """Run one scenario; after a failed step the remaining steps are skipped."""
+    started = perf_counter()
+    context = new_context()
+    failed = False
+    results = []
+    for name, call, expected in steps:
+        if failed:
+            results.append((name, None, None))
+            continue
+        step_start = perf_counter()
+        try:
+            response = call(methods, context)
+            reason = None if response.response_code == expected else \
+                f"responseCode {response.response_code} (HTTP {response.status_code})"
+        except Exception as e:
+            reason = type(e).__name__
+        results.append((name, perf_counter() - step_start, reason))
+        failed = reason is not None
+    finished = perf_counter()
+
+    with stats._lock:
+        stats.queue.record(max(0.0, started - scheduled))
+        for name, seconds, reason in results:
+            step = stats.steps[name]
+            if seconds is None:
+                step.skipped += 1
+                continue
+            step.histogram.record(seconds)
+            if reason is None:
+                step.ok += 1
+            else:
+                step.error(reason)
+        stats.scenario.histogram.record(finished - scheduled)
+        if failed:
+            stats.scenario.error(next(reason for _, _, reason in results if reason))
+        else:
+            stats.scenario.ok += 1
+
+def run_worker(settings: Dict[str, Any]) -> Dict[str, Any]:
+    """Generate this process's share of the load; returns LoadStats.to_dict()."""
+    Config.API_LOG_SAMPLE_RATES = {"*": settings["log_sample_rate"]}
+    # Every process would otherwise draw the same users from TEST_DATA_SEED
+    user_stream.reseed(Config.TEST_DATA_SEED, stream_id=f"load-{settings['index']}")
+    client = ApiClient(base_url=settings["base_url"])
+    client.logger.setLevel(logging.WARNING)
+    methods = ApiMethods(api_client=client)
+    steps = SCENARIOS[settings["scenario"]]
+    stats = LoadStats([name for name, _, _ in steps])
+    rng = random.Random(settings["seed"])
+    arrivals = arrival_times(settings["stages"], scale=1 / settings["processes"], poisson=settings["poisson"],
+                             phase=settings["index"] / settings["processes"], rng=rng)
+
+    executor = ThreadPoolExecutor(max_workers=settings["concurrency"], thread_name_prefix="load")
+    start = perf_counter()
+    try:
+        for offset in arrivals:
+            scheduled = start + offset
+            delay = scheduled - perf_counter()
+            if delay > 0:
+                sleep(delay)
+            executor.submit(run_scenario, methods, steps, stats, scheduled)
+    finally:
+        executor.shutdown(wait=True)
+    stats.elapsed = perf_counter() - start
+    stats.leaked_accounts = len(delete_created_accounts(methods, max_workers=settings["concurrency"]))
+    client.close()
+    return stats.to_dict()
+
+def run(settings: Dict[str, Any]) -> LoadStats:
+    """Run ``settings["processes"]`` workers and merge their stats."""
+    steps = SCENARIOS[settings["scenario"]]
+    total = LoadStats([name for name, _, _ in steps])
+    seed = settings.get("seed")
+    worker_settings = [dict(settings, index=index, seed=None if seed is None else seed + index)
+                       for index in range(settings["processes"])]
+    if settings["processes"] == 1:
+        results = [run_worker(worker_settings[0])]
+    else:
+        with ProcessPoolExecutor(max_workers=settings["processes"], mp_context=get_context("spawn")) as executor:
+            results = list(executor.map(run_worker, worker_settings))
+    for result in results:
+        total.merge(LoadStats.from_dict(result))
+    return total
+
+def format_table(rows: List[Dict[str, Any]]) -> List[str]:
+    columns = ["step", "requests", "errors", "skipped", "error_rate", "throughput_rps",
+               "p50_ms", "p90_ms", "p99_ms", "max_ms"]
+    widths = [max(len(column), *(len(str(row[column])) for row in rows)) for column in columns]
+    lines = ["  ".join(column.rjust(width) if i else column.ljust(width) for i, (column, width) in enumerate(zip(columns, widths)))]
+    for row in rows:
+        lines.append("  ".join(str(row[column]).rjust(width) if i else str(row[column]).ljust(width)
+                               for i, (column, width) in enumerate(zip(columns, widths))))
+    return lines
+
+def write_csv(path: str, rows: List[Dict[str, Any]]) -> None:
+    with open(path, "w", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=list(rows[0]))
+        writer.writeheader()
+        writer.writerows(rows)
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--scenario", choices=sorted(SCENARIOS), default="user_lifecycle")
+    parser.add_argument("--base-url", default=os.getenv("API_BASE_URL", "https://www.automationexercise.com/api"))
+    parser.add_argument("--local-api", action="store_true", help="Start the bundled API server and target it")
+    parser.add_argument("--rate", type=float, default=5.0, help="Scenario starts per second across all processes")
+    parser.add_argument("--duration", type=float, default=30.0, help="Seconds of load including ramp-up")
+    parser.add_argument("--ramp-up", type=float, default=0.0, help="Seconds to ramp linearly from 0 to --rate")
+    parser.add_argument("--stages", help="Ramp profile 'seconds:rate,...'; overrides --rate/--duration/--ramp-up")
+    parser.add_argument("--poisson", action="store_true", help="Exponential inter-arrival times")
+    parser.add_argument("--processes", type=int, default=1)
+    parser.add_argument("--concurrency", type=int, default=16, help="Max in-flight scenarios per process")
+    parser.add_argument("--seed", type=int)
+    parser.add_argument("--log-sample-rate", type=float, default=0.0,
+                        help="Fraction of requests written to the API traffic log")
+    parser.add_argument("--json", help="Write results to this JSON file")
+    parser.add_argument("--csv", help="Write per-step rows to this CSV file")
+    args = parser.parse_args()
+
+    if args.stages:
+        stages = parse_stages(args.stages)
+    else:
+        ramp_up = min(args.ramp_up, args.duration)
+        stages = [(ramp_up, args.rate), (args.duration - ramp_up, args.rate)]
+    settings = {
+        "scenario": args.scenario,
+        "base_url": args.base_url,
+        "stages": stages,
+        "poisson": args.poisson,
+        "processes": max(1, args.processes),
+        "concurrency": max(1, args.concurrency),
+        "seed": args.seed,
+        "log_sample_rate": args.log_sample_rate
+    }
+
+    server = None
+    if args.local_api:
+        from server.local_api_server import LocalApiServer
+        server = LocalApiServer().start()
+        settings["base_url"] = server.base_url
+    try:
+        print(f"Running '{args.scenario}' against {settings['base_url']} for {profile_duration(stages):.0f}s "
+              f"({settings['processes']} process(es) x {settings['concurrency']} threads)")
+        stats = run(settings)
+    finally:
+        if server is not None:
+            server.stop()
+
+    rows = stats.rows()
+    for line in format_table(rows):
+        print(line)
+    print(f"queue time p50 {stats.queue.percentile(50):.1f} ms, p99 {stats.queue.percentile(99):.1f} ms, "
+          f"max {stats.queue.max_ms:.1f} ms")
+    errors = {name: step.reasons for name, step in stats.steps.items() if step.reasons}
+    for name, reasons in errors.items():
+        print(f"{name} errors: {reasons}")
+    if stats.leaked_accounts:
+        print(f"Could not delete {stats.leaked_accounts} accounts created during the run")
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump({
+                "settings": settings,
+                "elapsed": stats.elapsed,
+                "steps": rows,
+                "queue": {"p50_ms": stats.queue.percentile(50), "p99_ms": stats.queue.percentile(99),
+                          "max_ms": stats.queue.max_ms},
+                "errors": errors
+            }, f, indent=2)
+    if args.csv:
+        write_csv(args.csv, rows)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+"""Named ApiMethods flows driven by the load generator.
+
+A scenario is an ordered list of steps. Each step is ``(name, call,
+expected_response_code)`` where ``call(api_methods, context)`` sends one
+request; ``context`` is a dict shared by the steps of one scenario run.
+"""
+from http import HTTPStatus
+from typing import Dict, Any, Callable, List, Tuple
+import requests
+from api.api_methods import ApiMethods
+from data.test_data import TestData
+
+Step = Tuple[str, Callable[[ApiMethods, Dict[str, Any]], requests.Response], int]
+
+def new_context() -> Dict[str, Any]:
+    """State for one scenario run: a freshly generated user."""
+    return {"user": TestData.get_dynamic_user()}
+
+def _create_account(methods: ApiMethods, context: Dict[str, Any]) -> requests.Response:
+    return methods.create_account(context["user"])
+
+def _verify_login(methods: ApiMethods, context: Dict[str, Any]) -> requests.Response:
+    return methods.verify_login(context["user"]["email"], context["user"]["password"])
+
+def _get_user_detail(methods: ApiMethods, context: Dict[str, Any]) -> requests.Response:
+    return methods.get_user_detail(context["user"]["email"])
+
+def _update_account(methods: ApiMethods, context: Dict[str, Any]) -> requests.Response:
+    updated = dict(context["user"], company=f"{context['user']['company']} Updated")
+    return methods.update_account(updated)
+
+def _delete_account(methods: ApiMethods, context: Dict[str, Any]) -> requests.Response:
+    return methods.delete_account(context["user"]["email"], context["user"]["password"])
+
+def _products_list(methods: ApiMethods, context: Dict[str, Any]) -> requests.Response:
+    return methods.get_all_products()
+
+def _brands_list(methods: ApiMethods, context: Dict[str, Any]) -> requests.Response:
+    return methods.get_all_brands()
+
+def _search_product(methods: ApiMethods, context: Dict[str, Any]) -> requests.Response:
+    return methods.search_product("top")
+
+SCENARIOS: Dict[str, List[Step]] = {
+    # The flow covered by tests/test_users.py
+    "user_lifecycle": [
+        ("create_account", _create_account, HTTPStatus.CREATED),
+        ("verify_login", _verify_login, HTTPStatus.OK),
+        ("get_user_detail", _get_user_detail, HTTPStatus.OK),
+        ("update_account", _update_account, HTTPStatus.OK),
+        ("delete_account", _delete_account, HTTPStatus.OK),
+    ],
+    "catalog": [
+        ("products_list", _products_list, HTTPStatus.OK),
+        ("brands_list", _brands_list, HTTPStatus.OK),
+        ("search_product", _search_product, HTTPStatus.OK),
+    ],
+}
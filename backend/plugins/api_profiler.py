@@ -0,0 +1,266 @@
+"""pytest plugin: opt-in CPU or memory profile of the API layer (``--profile-api=cpu|mem``).
+
+Each test (or, with ``--profile-api-marker=NAME``, each test carrying that
+marker) runs under the profiler, and hot spots are summed over the session
+and attributed to our own frames: functions in files under the rootdir
+(other than these plugins), so
+time spent in requests or json counts against the ``ApiClient`` or
+``ApiLogger`` method that called it.
+
+- ``cpu``: cProfile (thread CPU time) on the test thread. The table shows,
+  per own function, its calls, its own time (including library calls it
+  makes, excluding calls into other own functions) and its cumulative time.
+  A sampler thread also records wall-clock stacks of every busy thread
+  (including thread pools and the local API server) for the
+  collapsed-stack file.
+- ``mem``: tracemalloc, started and stopped around each test. The table
+  shows memory the test allocated and still held when it finished, by the
+  innermost own frame that allocated it, plus the tests with the highest
+  traced peak.
+
+The collapsed stacks (``frame;frame;frame weight``, for flamegraph.pl or
+speedscope) are written to ``--profile-api-out``. Nothing is registered
+unless the option is given, so an unprofiled run pays nothing.
+"""
+import os
+import sys
+import time
+import cProfile
+import pstats
+import threading
+import tracemalloc
+from typing import Dict, Any, Callable, List, Optional, Tuple
+import pytest
+
+CPU = "cpu"
+MEM = "mem"
+
+WORKER_OUTPUT_KEY = "api_profile"
+
+# Seconds between stack samples in cpu mode
+SAMPLE_INTERVAL = 0.005
+
+# Frames kept per tracemalloc allocation
+TRACEMALLOC_FRAMES = 25
+
+# Threads whose innermost frame is in one of these are parked, not working
+IDLE_MODULES = frozenset(["threading", "queue", "selectors"])
+
+def pytest_addoption(parser):
+    group = parser.getgroup("api profiling")
+    group.addoption(
+        "--profile-api",
+        choices=(CPU, MEM),
+        default=None,
+        help="Profile tests with cProfile (cpu) or tracemalloc (mem) and report our own hot spots."
+    )
+    group.addoption("--profile-api-marker", default=None, help="Only profile tests carrying this marker.")
+    group.addoption("--profile-api-top", type=int, default=20, help="Rows in the hot spot table.")
+    group.addoption("--profile-api-out", default=".", help="Directory for the collapsed-stack file.")
+
+def pytest_configure(config):
+    mode = config.getoption("--profile-api")
+    if mode:
+        config.pluginmanager.register(ApiProfiler(config, mode), "api-profiler")
+
+
+def own_frame_times(stats: Dict[tuple, tuple], is_own: Callable[[str], Any]) -> Dict[tuple, Tuple[int, float, float]]:
+    """(calls, own seconds, cumulative seconds) of each own function in pstats ``stats``.
+
+    Own seconds are the cumulative time minus the time spent in calls to other
+    own functions, so library time counts against the own frame that called it.
+    """
+    own_time = {function: row[3] for function, row in stats.items() if is_own(function[0])}
+    for callee, (_, _, _, _, callers) in stats.items():
+        if callee not in own_time:
+            continue
+        for caller, edge in callers.items():
+            if caller in own_time and caller != callee:
+                own_time[caller] -= edge[3]
+    return {function: (stats[function][1], max(0.0, own), stats[function][3]) for function, own in own_time.items()}
+
+
+class StackSampler:
+    """Background thread collecting collapsed stacks of every other thread, from the first own frame down."""
+
+    def __init__(self, label_stack, interval: float = SAMPLE_INTERVAL):
+        self.label_stack = label_stack
+        self.interval = interval
+        self.stacks: Dict[str, int] = {}
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="api-profile-sampler", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        self._thread.join()
+
+    def _run(self) -> None:
+        me = threading.get_ident()
+        while not self._stop.wait(self.interval):
+            for ident, frame in sys._current_frames().items():
+                if ident == me or frame.f_globals.get("__name__") in IDLE_MODULES:
+                    continue
+                stack = self.label_stack(frame)
+                if stack:
+                    self.stacks[stack] = self.stacks.get(stack, 0) + 1
+
+
+class ApiProfiler:
+    """Profiles each selected test and aggregates own-frame hot spots over the session."""
+
+    def __init__(self, config, mode: str):
+        self.config = config
+        self.mode = mode
+        self.marker = config.getoption("--profile-api-marker")
+        self.top = config.getoption("--profile-api-top")
+        self.out_dir = config.getoption("--profile-api-out")
+        self.root = str(config.rootpath) + os.sep
+        self.tests = 0
+        # label -> [calls, own seconds, cumulative seconds] (cpu) or [allocations, bytes] (mem)
+        self.rows: Dict[str, List[float]] = {}
+        self.stacks: Dict[str, float] = {}
+        self.peaks: Dict[str, float] = {}
+        self._labels: Dict[str, Optional[str]] = {}
+
+    def _module(self, filename: str) -> Optional[str]:
+        """Dotted module of one of our own files, or None for library and profiler frames."""
+        label = self._labels.get(filename, "")
+        if label == "":
+            label = None
+            if (filename.startswith(self.root) and "site-packages" not in filename
+                    and not filename.startswith(os.path.dirname(__file__) + os.sep)):
+                label = os.path.splitext(filename[len(self.root):])[0].replace(os.sep, ".")
+            self._labels[filename] = label
+        return label
+
+    def _frame_label(self, frame) -> str:
+        code = frame.f_code
+        module = self._module(code.co_filename) or frame.f_globals.get("__name__", "?")
+        return f"{module}.{getattr(code, 'co_qualname', code.co_name)}"
+
+    def _label_stack(self, frame) -> str:
+        frames = []
+        while frame is not None:
+            frames.append(frame)
+            frame = frame.f_back
+        frames.reverse()
+        for index, candidate in enumerate(frames):
+            if self._module(candidate.f_code.co_filename):
+                return ";".join(self._frame_label(f) for f in frames[index:])
+        return ""
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_runtest_protocol(self, item, nextitem):
+        if self.marker and item.get_closest_marker(self.marker) is None:
+            yield
+            return
+        self.tests += 1
+        if self.mode == CPU:
+            # Thread CPU time, so waiting on the network does not count as a hot spot
+            profile = cProfile.Profile(time.thread_time)
+            sampler = StackSampler(self._label_stack)
+            sampler.start()
+            profile.enable()
+            try:
+                yield
+            finally:
+                profile.disable()
+                sampler.stop()
+            self._add_cpu(profile)
+            self._add_stacks(sampler.stacks)
+        else:
+            # Traced only while the test runs, so snapshots hold just its allocations
+            tracemalloc.start(TRACEMALLOC_FRAMES)
+            try:
+                yield
+            finally:
+                _, peak = tracemalloc.get_traced_memory()
+                snapshot = tracemalloc.take_snapshot()
+                tracemalloc.stop()
+            self.peaks[item.nodeid] = peak / 1024
+            self._add_mem(snapshot.statistics("traceback"))
+
+    def _add_cpu(self, profile: cProfile.Profile) -> None:
+        stats = pstats.Stats(profile).stats
+        for (filename, lineno, name), (calls, own, cumulative) in own_frame_times(stats, self._module).items():
+            row = self.rows.setdefault(f"{self._module(filename)}.{name}:{lineno}", [0, 0.0, 0.0])
+            row[0] += calls
+            row[1] += own
+            row[2] += cumulative
+
+    def _add_stacks(self, stacks: Dict[str, float]) -> None:
+        for stack, weight in stacks.items():
+            self.stacks[stack] = self.stacks.get(stack, 0) + weight
+
+    def _add_mem(self, statistics) -> None:
+        for statistic in statistics:
+            own = [frame for frame in statistic.traceback if self._module(frame.filename)]
+            if not own:
+                continue
+            labels = [f"{self._module(frame.filename)}:{frame.lineno}" for frame in own]
+            row = self.rows.setdefault(labels[-1], [0, 0])
+            row[0] += statistic.count
+            row[1] += statistic.size
+            stack = ";".join(labels)
+            self.stacks[stack] = self.stacks.get(stack, 0) + statistic.size
+
+    def to_dict(self) -> Dict:
+        return {"tests": self.tests, "rows": self.rows, "stacks": self.stacks, "peaks": self.peaks}
+
+    @pytest.hookimpl(optionalhook=True)
+    def pytest_testnodedown(self, node, error):
+        data = getattr(node, "workeroutput", {}).get(WORKER_OUTPUT_KEY)
+        if not data:
+            return
+        self.tests += data["tests"]
+        for label, values in data["rows"].items():
+            row = self.rows.setdefault(label, [0] * len(values))
+            for index, value in enumerate(values):
+                row[index] += value
+        self._add_stacks(data["stacks"])
+        self.peaks.update(data["peaks"])
+
+    def pytest_sessionfinish(self, session):
+        workeroutput = getattr(self.config, "workeroutput", None)
+        if workeroutput is not None:
+            workeroutput[WORKER_OUTPUT_KEY] = self.to_dict()
+            return
+        if self.stacks:
+            os.makedirs(self.out_dir, exist_ok=True)
+            with open(self.collapsed_path, "w") as f:
+                for stack, weight in sorted(self.stacks.items()):
+                    f.write(f"{stack} {int(weight)}\n")
+
+    @property
+    def collapsed_path(self) -> str:
+        return os.path.join(self.out_dir, f"api-profile-{self.mode}.collapsed")
+
+    def table(self) -> List[str]:
+        if self.mode == CPU:
+            header = f"{'function':<60} {'calls':>8} {'own s':>9} {'cum s':>9}"
+            ranked = sorted(self.rows.items(), key=lambda item: item[1][1], reverse=True)[:self.top]
+            lines = [f"{label[-60:]:<60} {int(calls):>8} {own:>9.3f} {cum:>9.3f}" for label, (calls, own, cum) in ranked]
+        else:
+            header = f"{'allocated at':<60} {'blocks':>8} {'kept KiB':>9}"
+            ranked = sorted(self.rows.items(), key=lambda item: item[1][1], reverse=True)[:self.top]
+            lines = [f"{label[-60:]:<60} {int(count):>8} {size / 1024:>9.1f}" for label, (count, size) in ranked]
+        return [header] + lines
+
+    def pytest_terminal_summary(self, terminalreporter):
+        if hasattr(self.config, "workeroutput") or not self.tests:
+            return
+        terminalreporter.write_sep("-", f"API profile ({self.mode}, {self.tests} tests)")
+        for line in self.table():
+            terminalreporter.write_line(line)
+        if self.mode == MEM and self.peaks:
+            terminalreporter.write_line("")
+            terminalreporter.write_line(f"{'test':<80} {'peak KiB':>9}")
+            for nodeid, peak in sorted(self.peaks.items(), key=lambda item: item[1], reverse=True)[:self.top]:
+                terminalreporter.write_line(f"{nodeid[-80:]:<80} {peak:>9.1f}")
+        if self.stacks:
+            terminalreporter.write_line(f"collapsed stacks: {self.collapsed_path}")
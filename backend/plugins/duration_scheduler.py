@@ -0,0 +1,193 @@
+"""pytest plugin: duration-aware xdist scheduling (``-n N --dist-durations``).
+
+Per-test durations (setup + call + teardown) are kept in the pytest cache as
+a moving average over previous runs. Tests are queued longest first; each
+worker holds two tests at a time and takes the next longest whenever it
+finishes one, so a worker that drew short tests keeps pulling work instead of
+sitting idle. Tests without history are estimated from the median of their
+class, then module, then the whole suite. The terminal summary compares the
+predicted makespan (LPT over the estimates) with the actual one.
+"""
+import heapq
+import statistics
+from time import perf_counter
+from typing import Dict, List, Optional
+import pytest
+
+CACHE_KEY = "api/test_durations"
+
+# Weight of the latest run in the stored moving average
+SMOOTHING = 0.5
+
+# Estimate for a test when nothing at all is known
+DEFAULT_DURATION = 0.1
+
+scheduler_key = pytest.StashKey["DurationScheduling"]()
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--dist-durations",
+        action="store_true",
+        default=False,
+        help="Schedule xdist tests longest first using durations from previous runs."
+    )
+
+def load_durations(config) -> Dict[str, float]:
+    cache = getattr(config, "cache", None)
+    return dict(cache.get(CACHE_KEY, {})) if cache is not None else {}
+
+def _parents(nodeid: str) -> List[str]:
+    """Class and module prefixes of a node id, innermost first."""
+    parts = nodeid.split("::")
+    return ["::".join(parts[:i]) for i in range(len(parts) - 1, 0, -1)]
+
+def estimate_durations(nodeids: List[str], history: Dict[str, float]) -> Dict[str, float]:
+    """History for known tests; median of the nearest known class/module/suite otherwise."""
+    groups: Dict[str, List[float]] = {}
+    for nodeid, seconds in history.items():
+        for parent in _parents(nodeid):
+            groups.setdefault(parent, []).append(seconds)
+    suite = statistics.median(history.values()) if history else DEFAULT_DURATION
+    estimates = {}
+    for nodeid in nodeids:
+        if nodeid in history:
+            estimates[nodeid] = history[nodeid]
+            continue
+        estimates[nodeid] = next(
+            (statistics.median(groups[parent]) for parent in _parents(nodeid) if parent in groups), suite
+        )
+    return estimates
+
+def lpt_makespan(durations: List[float], workers: int) -> float:
+    """Makespan of greedy longest-processing-time-first list scheduling."""
+    loads = [0.0] * max(1, workers)
+    for seconds in sorted(durations, reverse=True):
+        heapq.heappush(loads, heapq.heappop(loads) + seconds)
+    return max(loads)
+
+
+def _make_scheduling_class():
+    from xdist.scheduler import LoadScheduling
+
+    class DurationScheduling(LoadScheduling):
+        """LoadScheduling that hands out tests longest first, two at a time per worker."""
+
+        def __init__(self, config, log=None):
+            super().__init__(config, log)
+            self.history = load_durations(config)
+            self.estimates: Dict[int, float] = {}
+            self.unknown = 0
+            self.predicted_makespan = 0.0
+            self.started: Optional[float] = None
+            self.finished: Optional[float] = None
+            self.node_busy: Dict[str, float] = {}
+
+        def schedule(self) -> None:
+            # LoadScheduling.schedule() sends each worker a chunk of up to a quarter of
+            # its share in collection order, so the initial distribution is done here
+            if self.collection is not None:
+                for node in self.nodes:
+                    self.check_schedule(node)
+                return
+            if not self._check_nodes_have_same_collection():
+                self.log("**Different tests collected, aborting run**")
+                return
+            self.collection = next(iter(self.node2collection.values()))
+            estimates = estimate_durations(self.collection, self.history)
+            self.estimates = {index: estimates[nodeid] for index, nodeid in enumerate(self.collection)}
+            self.unknown = sum(1 for nodeid in self.collection if nodeid not in self.history)
+            self.predicted_makespan = lpt_makespan(list(estimates.values()), len(self.nodes))
+            self.started = perf_counter()
+            self.pending[:] = range(len(self.collection))
+            self._sort_pending()
+            # Round robin, so the longest tests start on different workers
+            for _ in range(2):
+                for node in self.nodes:
+                    self._send_tests(node, 1)
+            if not self.pending:
+                for node in self.nodes:
+                    node.shutdown()
+
+        def _sort_pending(self) -> None:
+            self.pending.sort(key=lambda index: self.estimates.get(index, DEFAULT_DURATION), reverse=True)
+
+        def check_schedule(self, node, duration: float = 0) -> None:
+            if node.shutting_down:
+                return
+            if self.pending:
+                self._sort_pending()
+                node_pending = self.node2pending[node]
+                if len(node_pending) < 2:
+                    self._send_tests(node, 2 - len(node_pending))
+            else:
+                node.shutdown()
+
+        def mark_test_complete(self, node, item_index: int, duration: float = 0) -> None:
+            worker = node.gateway.id
+            self.node_busy[worker] = self.node_busy.get(worker, 0.0) + duration
+            self.finished = perf_counter()
+            super().mark_test_complete(node, item_index, duration)
+
+        def remove_node(self, node) -> Optional[str]:
+            pending = self.node2pending.pop(node)
+            if not pending:
+                return None
+            crashitem = self.collection[pending.pop(0)]
+            self.pending.extend(pending)
+            self._sort_pending()
+            for other in self.node2pending:
+                self.check_schedule(other)
+            return crashitem
+
+        @property
+        def actual_makespan(self) -> float:
+            if self.started is None or self.finished is None:
+                return 0.0
+            return self.finished - self.started
+
+    return DurationScheduling
+
+@pytest.hookimpl(tryfirst=True, optionalhook=True)
+def pytest_xdist_make_scheduler(config, log):
+    if not config.getoption("--dist-durations"):
+        return None
+    scheduler = _make_scheduling_class()(config, log)
+    config.stash[scheduler_key] = scheduler
+    return scheduler
+
+class DurationRecorder:
+    """Sums each test's phase durations and folds them into the cached history."""
+
+    def __init__(self, config):
+        self.config = config
+        self.durations: Dict[str, float] = {}
+
+    def pytest_runtest_logreport(self, report):
+        # Under xdist the controller receives every worker's reports here
+        self.durations[report.nodeid] = self.durations.get(report.nodeid, 0.0) + report.duration
+
+    def pytest_sessionfinish(self, session):
+        cache = getattr(self.config, "cache", None)
+        if cache is None or not self.durations:
+            return
+        history = load_durations(self.config)
+        for nodeid, seconds in self.durations.items():
+            previous = history.get(nodeid)
+            history[nodeid] = seconds if previous is None else SMOOTHING * seconds + (1 - SMOOTHING) * previous
+        cache.set(CACHE_KEY, {nodeid: round(seconds, 6) for nodeid, seconds in history.items()})
+
+def pytest_configure(config):
+    if not hasattr(config, "workeroutput"):
+        config.pluginmanager.register(DurationRecorder(config), "duration-recorder")
+
+def pytest_terminal_summary(terminalreporter, config):
+    scheduler = config.stash.get(scheduler_key, None)
+    if scheduler is None or scheduler.started is None:
+        return
+    terminalreporter.write_sep("-", "Duration scheduling")
+    terminalreporter.write_line(
+        f"predicted makespan {scheduler.predicted_makespan:.2f}s, actual {scheduler.actual_makespan:.2f}s "
+        f"({len(scheduler.estimates)} tests, {scheduler.unknown} without history)"
+    )
+    for worker, busy in sorted(scheduler.node_busy.items()):
+        terminalreporter.write_line(f"{worker}: {busy:.2f}s in test calls")
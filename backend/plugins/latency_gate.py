@@ -0,0 +1,122 @@
+"""pytest plugin: latency regression gate against a stored baseline.
+
+``--latency-save-baseline=PATH`` writes this run's per-endpoint latency
+histograms and suite wall time to PATH (commit it as the blessed baseline).
+``--latency-baseline=PATH`` compares the run against it, prints a diff table
+per ApiEndpoints constant and fails the session when an endpoint is
+significantly slower (see ``api.latency_baseline``). The baseline records
+whether it came from ``--local-api``; against the local server the network
+is out of the picture, so a regression points at ApiClient/ApiLogger.
+"""
+import os
+import time
+from typing import List
+import pytest
+from api.latency import latency_recorder
+from api.latency_baseline import (
+    build_baseline, compare, load_baseline, save_baseline, BaselineError, EndpointDiff
+)
+from plugins.latency_report import endpoint_names
+
+gate_key = pytest.StashKey[dict]()
+
+def pytest_addoption(parser):
+    group = parser.getgroup("latency gate")
+    group.addoption("--latency-baseline", default=None, help="Fail the session on significant regressions against this baseline.")
+    group.addoption("--latency-save-baseline", default=None, help="Write this run's latency baseline to this path.")
+    group.addoption("--latency-alpha", type=float, default=0.01, help="Significance level, before correcting for the number of endpoints.")
+    group.addoption("--latency-min-effect", type=float, default=0.1,
+                    help="Smallest relative p50 slowdown that can fail the gate.")
+
+def _target(config) -> str:
+    if config.getoption("--local-api"):
+        return "local"
+    return os.getenv("API_BASE_URL", "https://www.automationexercise.com/api")
+
+def _is_worker(config) -> bool:
+    return hasattr(config, "workeroutput")
+
+def pytest_configure(config):
+    path = config.getoption("--latency-baseline")
+    if path and not _is_worker(config):
+        try:
+            baseline = load_baseline(path)
+        except BaselineError as e:
+            raise pytest.UsageError(str(e))
+        config.stash[gate_key] = {"baseline": baseline, "diffs": None}
+
+def pytest_sessionstart(session):
+    session.config.stash.setdefault(gate_key, {})["started"] = time.perf_counter()
+
+def pytest_sessionfinish(session):
+    config = session.config
+    if _is_worker(config):
+        return
+    # Workers' histograms were merged into latency_recorder by plugins.latency_report
+    state = config.stash[gate_key]
+    state["suite_seconds"] = time.perf_counter() - state["started"]
+    save_path = config.getoption("--latency-save-baseline")
+    if save_path:
+        save_baseline(save_path, build_baseline(latency_recorder, state["suite_seconds"], _target(config)))
+    baseline = state.get("baseline")
+    if baseline is None or baseline["target"] != _target(config):
+        return
+    state["diffs"] = compare(
+        baseline, latency_recorder,
+        alpha=config.getoption("--latency-alpha"),
+        min_effect=config.getoption("--latency-min-effect")
+    )
+    if any(diff.regressed for diff in state["diffs"]) and session.exitstatus == pytest.ExitCode.OK:
+        session.exitstatus = pytest.ExitCode.TESTS_FAILED
+
+def _format(value, pattern: str) -> str:
+    return "-" if value is None else format(value, pattern)
+
+def diff_rows(diffs: List[EndpointDiff]) -> List[List[str]]:
+    names = endpoint_names()
+    rows = []
+    for diff in diffs:
+        if diff.regressed:
+            verdict = "REGRESSED"
+        elif diff.p_value is None:
+            verdict = "not tested"
+        else:
+            verdict = "ok"
+        rows.append([
+            names.get(diff.endpoint, diff.endpoint), diff.method,
+            _format(diff.baseline["count"] if diff.baseline else None, "d"),
+            _format(diff.current.count if diff.current else None, "d"),
+            _format(diff.baseline_p50, ".1f"), _format(diff.current_p50, ".1f"),
+            "-" if diff.ratio is None else f"{diff.ratio - 1:+.0%}",
+            _format(diff.p_value, ".2g"), verdict
+        ])
+    return rows
+
+HEADERS = ["endpoint", "method", "base n", "n", "base p50", "p50", "change", "p", "verdict"]
+
+def pytest_terminal_summary(terminalreporter, config):
+    state = config.stash.get(gate_key, {})
+    if _is_worker(config) or "baseline" not in state:
+        return
+    baseline = state["baseline"]
+    terminalreporter.write_sep("-", "Latency regression gate")
+    if baseline["target"] != _target(config):
+        terminalreporter.write_line(
+            f"baseline was recorded against {baseline['target']}, this run used {_target(config)}: not compared"
+        )
+        return
+    rows = diff_rows(state["diffs"])
+    widths = [max(len(row[i]) for row in [HEADERS] + rows) for i in range(len(HEADERS))]
+    for row in [HEADERS] + rows:
+        terminalreporter.write_line("  ".join(
+            cell.ljust(width) if i in (0, 1, 8) else cell.rjust(width) for i, (cell, width) in enumerate(zip(row, widths))
+        ))
+    terminalreporter.write_line(
+        f"suite wall time {state['suite_seconds']:.2f}s (baseline {baseline['suite_seconds']:.2f}s, "
+        f"{baseline['created']})"
+    )
+    regressed = [diff for diff in state["diffs"] if diff.regressed]
+    if regressed:
+        terminalreporter.write_line(
+            f"{len(regressed)} endpoint(s) significantly slower than the baseline", red=True, bold=True
+        )
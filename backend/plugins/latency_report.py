@@ -0,0 +1,75 @@
+"""pytest plugin: per-endpoint API latency table in the terminal summary and HTML report.
+
+ApiClient records every request into ``api.latency.latency_recorder``. Under
+pytest-xdist each worker ships its histograms to the controller through
+``workeroutput``, where they are merged before the summary is written.
+"""
+import html
+from typing import List
+import pytest
+from api.api_endpoints import ApiEndpoints
+from api.latency import LatencyRecorder, latency_recorder
+
+WORKER_OUTPUT_KEY = "api_latency"
+
+PERCENTILES = (50, 90, 99)
+
+HEADERS = ["endpoint", "method", "count", "p50 ms", "p90 ms", "p99 ms", "max ms",
+           "connect p50", "ttfb p50", "download p50"]
+
+def endpoint_names():
+    return {path: name for name, path in vars(ApiEndpoints).items() if name.isupper()}
+
+def latency_rows(recorder: LatencyRecorder) -> List[List[str]]:
+    """One row per (endpoint, method), labelled with its ApiEndpoints constant."""
+    names = endpoint_names()
+    rows = []
+    for endpoint, method in recorder.endpoints():
+        total = recorder.get(endpoint, method)
+        if total is None:
+            continue
+        phases = [recorder.get(endpoint, method, phase) for phase in ("connect", "ttfb", "download")]
+        rows.append(
+            [names.get(endpoint, endpoint), method, str(total.count)]
+            + [f"{total.percentile(p):.1f}" for p in PERCENTILES]
+            + [f"{total.max_ms:.1f}"]
+            + [f"{phase.percentile(50):.1f}" if phase is not None else "-" for phase in phases]
+        )
+    return rows
+
+def _format_table(rows: List[List[str]]) -> List[str]:
+    widths = [max(len(row[i]) for row in [HEADERS] + rows) for i in range(len(HEADERS))]
+    def line(row: List[str]) -> str:
+        return "  ".join(cell.ljust(width) if i < 2 else cell.rjust(width)
+                         for i, (cell, width) in enumerate(zip(row, widths)))
+    return [line(HEADERS)] + [line(row) for row in rows]
+
+def pytest_sessionfinish(session):
+    workeroutput = getattr(session.config, "workeroutput", None)
+    if workeroutput is not None:
+        workeroutput[WORKER_OUTPUT_KEY] = latency_recorder.to_dict()
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_testnodedown(node, error):
+    data = getattr(node, "workeroutput", {}).get(WORKER_OUTPUT_KEY)
+    if data:
+        latency_recorder.merge(LatencyRecorder.from_dict(data))
+
+def pytest_terminal_summary(terminalreporter, config):
+    if hasattr(config, "workeroutput"):
+        return
+    rows = latency_rows(latency_recorder)
+    if rows:
+        terminalreporter.write_sep("-", "API latency")
+        for line in _format_table(rows):
+            terminalreporter.write_line(line)
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_html_results_summary(prefix, summary, postfix):
+    rows = latency_rows(latency_recorder)
+    if not rows:
+        return
+    def row_html(cells: List[str], tag: str) -> str:
+        return "<tr>" + "".join(f"<{tag}>{html.escape(cell)}</{tag}>" for cell in cells) + "</tr>"
+    table = row_html(HEADERS, "th") + "".join(row_html(row, "td") for row in rows)
+    postfix.append(f"<h2>API latency</h2><table>{table}</table>")
@@ -0,0 +1,88 @@
+"""pytest plugin: session timeline in Chrome trace format (``--trace-dir DIR``).
+
+Collection, every fixture setup, each test's setup/call/teardown and every
+ApiClient request (via ``utils.tracing.tracer``) become spans tagged with
+the worker id and test nodeid. Each process writes ``DIR/trace-<worker>.json``;
+at the end of the session the controller merges them into
+``DIR/session_trace.json``, which opens in ui.perfetto.dev or chrome://tracing.
+"""
+import os
+import glob
+import pytest
+from utils.tracing import tracer, merge_traces
+
+MERGED_NAME = "session_trace.json"
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--trace-dir",
+        default=os.getenv("API_TRACE_DIR"),
+        help="Write a Chrome/Perfetto timeline of test phases and API requests to this directory."
+    )
+
+def _worker_id(config) -> str:
+    return getattr(config, "workerinput", {}).get("workerid", "main")
+
+def pytest_configure(config):
+    trace_dir = config.getoption("--trace-dir")
+    if not trace_dir:
+        return
+    worker = _worker_id(config)
+    if worker == "main":
+        # Files left over from a previous session would end up in this one's merge
+        for path in glob.glob(os.path.join(trace_dir, "trace-*.json")):
+            os.remove(path)
+    tracer.start(os.path.join(trace_dir, f"trace-{worker}.json"), process_name=worker)
+    tracer.context = {"worker": worker}
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_collection(session):
+    with tracer.span("collection", "pytest", **tracer.context):
+        yield
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_protocol(item, nextitem):
+    if not tracer.enabled:
+        yield
+        return
+    tracer.context["nodeid"] = item.nodeid
+    with tracer.span(item.nodeid, "test", **tracer.context):
+        yield
+    tracer.context.pop("nodeid", None)
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_fixture_setup(fixturedef, request):
+    with tracer.span(f"fixture {fixturedef.argname}", "fixture", scope=fixturedef.scope, **tracer.context):
+        yield
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_setup(item):
+    with tracer.span("setup", "pytest", **tracer.context):
+        yield
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_call(item):
+    with tracer.span("call", "pytest", **tracer.context):
+        yield
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_teardown(item, nextitem):
+    with tracer.span("teardown", "pytest", **tracer.context):
+        yield
+
+@pytest.hookimpl(trylast=True)
+def pytest_sessionfinish(session):
+    if tracer.path is None:
+        return
+    tracer.close()
+    if _worker_id(session.config) == "main":
+        # Under xdist the workers have all finished by now
+        trace_dir = os.path.dirname(tracer.path)
+        paths = sorted(glob.glob(os.path.join(trace_dir, "trace-*.json")))
+        merge_traces(paths, os.path.join(trace_dir, MERGED_NAME))
+
+def pytest_terminal_summary(terminalreporter, config):
+    if tracer.path is None or _worker_id(config) != "main":
+        return
+    terminalreporter.write_sep("-", "Trace timeline")
+    terminalreporter.write_line(f"{os.path.join(os.path.dirname(tracer.path), MERGED_NAME)} (open in ui.perfetto.dev)")
@@ -0,0 +1,52 @@
+"""Bundled product and brand catalog served by the local API server."""
+from typing import Dict, Any, List
+
+def _product(product_id: int, name: str, price: int, brand: str, usertype: str, category: str) -> Dict[str, Any]:
+    return {
+        "id": product_id,
+        "name": name,
+        "price": f"Rs. {price}",
+        "brand": brand,
+        "category": {
+            "usertype": {"usertype": usertype},
+            "category": category
+        }
+    }
+
+PRODUCTS: List[Dict[str, Any]] = [
+    _product(1, "Blue Top", 500, "Polo", "Women", "Tops"),
+    _product(2, "Men Tshirt", 400, "H&M", "Men", "Tshirts"),
+    _product(3, "Sleeveless Dress", 1000, "Madame", "Women", "Dress"),
+    _product(4, "Stylish Dress", 1500, "Madame", "Women", "Dress"),
+    _product(5, "Winter Top", 600, "Mast & Harbour", "Women", "Tops"),
+    _product(6, "Summer White Top", 400, "H&M", "Women", "Tops"),
+    _product(7, "Madame Top For Women", 1000, "Madame", "Women", "Tops"),
+    _product(8, "Fancy Green Top", 700, "Polo", "Women", "Tops"),
+    _product(11, "Blue Cotton Indie Mickey Dress", 1530, "Madame", "Women", "Dress"),
+    _product(12, "Lace Top For Women", 1400, "Mast & Harbour", "Women", "Tops"),
+    _product(14, "Half Sleeves Top Schiffli Detailing - Pink", 359, "Mast & Harbour", "Women", "Tops"),
+    _product(15, "Frozen Tops For Kids", 278, "Allen Solly Junior", "Kids", "Tops & Shirts"),
+    _product(16, "Full Sleeves Top Cherry - Pink", 679, "Kookie Kids", "Kids", "Tops & Shirts"),
+    _product(18, "Printed Off Shoulder Top - White", 315, "Kookie Kids", "Kids", "Tops & Shirts"),
+    _product(20, "Little Girls Mr. Panda Shirt", 543, "Allen Solly Junior", "Kids", "Tops & Shirts"),
+    _product(21, "Sleeveless Unicorn Patch Gown - Pink", 1050, "Kookie Kids", "Kids", "Dress"),
+    _product(22, "Cotton Mull Embroidered Dress", 1500, "Babyhug", "Kids", "Dress"),
+    _product(24, "Colour Blocked Shirt – Sky Blue", 1000, "Polo", "Men", "Tshirts"),
+    _product(28, "Pure Cotton V-Neck T-Shirt", 1299, "Polo", "Men", "Tshirts"),
+    _product(29, "Green Side Placket Detail T-Shirt", 1000, "Polo", "Men", "Tshirts"),
+    _product(30, "Premium Polo T-Shirts", 1500, "Polo", "Men", "Tshirts"),
+    _product(31, "Pure Cotton Neon Green Tshirt", 850, "H&M", "Men", "Tshirts"),
+    _product(33, "Soft Stretch Jeans", 799, "Allen Solly Junior", "Men", "Jeans"),
+    _product(35, "Regular Fit Straight Jeans", 1200, "Babyhug", "Men", "Jeans"),
+    _product(37, "Grunt Blue Slim Fit Jeans", 1400, "Allen Solly Junior", "Men", "Jeans"),
+    _product(38, "Rose Pink Embroidered Maxi Dress", 1400, "Biba", "Women", "Saree"),
+    _product(39, "Cotton Silk Hand Block Print Saree", 3000, "Biba", "Women", "Saree"),
+    _product(40, "Rust Red Linen Saree", 3500, "Biba", "Women", "Saree"),
+    _product(41, "Beautiful Peacock Blue Cotton Linen Saree", 5000, "Biba", "Women", "Saree"),
+    _product(43, "GRAPHIC DESIGN MEN T SHIRT - BLUE", 1389, "Mast & Harbour", "Men", "Tshirts"),
+]
+
+BRANDS: List[Dict[str, Any]] = [
+    {"id": brand_id, "brand": product["brand"]}
+    for brand_id, product in enumerate(PRODUCTS, start=1)
+]
@@ -0,0 +1,303 @@
+"""In-process stand-in for the Automation Exercise API.
+
+Implements every route in ApiEndpoints with the same envelope the live site
+uses: HTTP 200 for every handled request, with the outcome carried in the
+``responseCode`` and ``message`` fields of the JSON body.
+"""
+import re
+import json
+import threading
+import argparse
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Any, Optional, Tuple
+from urllib.parse import urlsplit, parse_qs
+
+from api.api_endpoints import ApiEndpoints
+from server.catalog import PRODUCTS, BRANDS
+
+EMAIL_PATTERN = re.compile(r"^[^@\s]+@[^@\s]+\.[^@\s]+$")
+
+ACCOUNT_FIELDS = [
+    "name", "email", "password", "title", "birth_date", "birth_month", "birth_year",
+    "firstname", "lastname", "company", "address1", "address2", "country",
+    "zipcode", "state", "city", "mobile_number"
+]
+
+# Request field -> field name in the getUserDetailByEmail response
+USER_DETAIL_FIELDS = {
+    "name": "name",
+    "email": "email",
+    "title": "title",
+    "birth_date": "birth_day",
+    "birth_month": "birth_month",
+    "birth_year": "birth_year",
+    "firstname": "first_name",
+    "lastname": "last_name",
+    "company": "company",
+    "address1": "address1",
+    "address2": "address2",
+    "country": "country",
+    "state": "state",
+    "city": "city",
+    "zipcode": "zipcode"
+}
+
+METHOD_NOT_SUPPORTED = (HTTPStatus.METHOD_NOT_ALLOWED, {"message": "This request method is not supported."})
+
+
+class UserStore:
+    """Thread-safe in-memory account store indexed by email."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._by_email: Dict[str, Dict[str, str]] = {}
+        self._next_id = 1
+
+    def __len__(self) -> int:
+        return len(self._by_email)
+
+    @staticmethod
+    def _key(email: str) -> str:
+        return email.strip().lower()
+
+    def create(self, user_data: Dict[str, str]) -> bool:
+        """Store a new account; returns False if the email is already taken."""
+        key = self._key(user_data["email"])
+        with self._lock:
+            if key in self._by_email:
+                return False
+            self._by_email[key] = dict(user_data, id=str(self._next_id))
+            self._next_id += 1
+            return True
+
+    def get(self, email: str) -> Optional[Dict[str, str]]:
+        with self._lock:
+            user = self._by_email.get(self._key(email))
+            return dict(user) if user is not None else None
+
+    def authenticate(self, email: str, password: str) -> bool:
+        user = self.get(email)
+        return user is not None and user["password"] == password
+
+    def update(self, user_data: Dict[str, str]) -> bool:
+        key = self._key(user_data["email"])
+        with self._lock:
+            user = self._by_email.get(key)
+            if user is None or user["password"] != user_data["password"]:
+                return False
+            user.update({k: v for k, v in user_data.items() if k in ACCOUNT_FIELDS})
+            return True
+
+    def delete(self, email: str, password: str) -> bool:
+        key = self._key(email)
+        with self._lock:
+            user = self._by_email.get(key)
+            if user is None or user["password"] != password:
+                return False
+            del self._by_email[key]
+            return True
+
+    def clear(self) -> None:
+        with self._lock:
+            self._by_email.clear()
+
+
+def _missing(params: Dict[str, str], required, method: str) -> Optional[Tuple[int, Dict[str, Any]]]:
+    for field in required:
+        if not params.get(field):
+            return HTTPStatus.BAD_REQUEST, {"message": f"Bad request, {field} parameter is missing in {method} request."}
+    return None
+
+
+class AutomationExerciseApi:
+    """Route handlers for the stand-in API, independent of the HTTP layer."""
+
+    def __init__(self, store: Optional[UserStore] = None):
+        self.store = store or UserStore()
+        self.routes = {
+            ApiEndpoints.PRODUCTS_LIST: self.products_list,
+            ApiEndpoints.BRANDS_LIST: self.brands_list,
+            ApiEndpoints.SEARCH_PRODUCT: self.search_product,
+            ApiEndpoints.VERIFY_LOGIN: self.verify_login,
+            ApiEndpoints.CREATE_ACCOUNT: self.create_account,
+            ApiEndpoints.DELETE_ACCOUNT: self.delete_account,
+            ApiEndpoints.UPDATE_ACCOUNT: self.update_account,
+            ApiEndpoints.GET_USER_DETAIL: self.get_user_detail,
+        }
+
+    def handle(self, method: str, endpoint: str, params: Dict[str, str]) -> Optional[Dict[str, Any]]:
+        """Dispatch a request and return the JSON body, or None for unknown routes."""
+        handler = self.routes.get(endpoint)
+        if handler is None:
+            return None
+        response_code, body = handler(method, params)
+        return {"responseCode": int(response_code), **body}
+
+    def products_list(self, method: str, params: Dict[str, str]):
+        if method != "GET":
+            return METHOD_NOT_SUPPORTED
+        return HTTPStatus.OK, {"products": PRODUCTS}
+
+    def brands_list(self, method: str, params: Dict[str, str]):
+        if method != "GET":
+            return METHOD_NOT_SUPPORTED
+        return HTTPStatus.OK, {"brands": BRANDS}
+
+    def search_product(self, method: str, params: Dict[str, str]):
+        if method != "POST":
+            return METHOD_NOT_SUPPORTED
+        missing = _missing(params, ["search_product"], method)
+        if missing:
+            return missing
+        term = params["search_product"].lower()
+        products = [
+            product for product in PRODUCTS
+            if term in product["name"].lower() or term in product["category"]["category"].lower()
+        ]
+        return HTTPStatus.OK, {"products": products}
+
+    def verify_login(self, method: str, params: Dict[str, str]):
+        if method != "POST":
+            return METHOD_NOT_SUPPORTED
+        if not params.get("email") or not params.get("password"):
+            return HTTPStatus.BAD_REQUEST, {"message": "Bad request, email or password parameter is missing in POST request."}
+        if not self.store.authenticate(params["email"], params["password"]):
+            return HTTPStatus.NOT_FOUND, {"message": "User not found!"}
+        return HTTPStatus.OK, {"message": "User exists!"}
+
+    def create_account(self, method: str, params: Dict[str, str]):
+        if method != "POST":
+            return METHOD_NOT_SUPPORTED
+        missing = _missing(params, ACCOUNT_FIELDS, method)
+        if missing:
+            return missing
+        if not EMAIL_PATTERN.match(params["email"]):
+            return HTTPStatus.BAD_REQUEST, {"message": "Bad request, invalid email address."}
+        if not self.store.create({k: params[k] for k in ACCOUNT_FIELDS}):
+            return HTTPStatus.BAD_REQUEST, {"message": "Email already exists!"}
+        return HTTPStatus.CREATED, {"message": "User created!"}
+
+    def delete_account(self, method: str, params: Dict[str, str]):
+        if method != "DELETE":
+            return METHOD_NOT_SUPPORTED
+        missing = _missing(params, ["email", "password"], method)
+        if missing:
+            return missing
+        if not self.store.delete(params["email"], params["password"]):
+            return HTTPStatus.NOT_FOUND, {"message": "Account not found!"}
+        return HTTPStatus.OK, {"message": "Account deleted!"}
+
+    def update_account(self, method: str, params: Dict[str, str]):
+        if method != "PUT":
+            return METHOD_NOT_SUPPORTED
+        missing = _missing(params, ["email", "password"], method)
+        if missing:
+            return missing
+        if not self.store.update(params):
+            return HTTPStatus.NOT_FOUND, {"message": "Account not found!"}
+        return HTTPStatus.OK, {"message": "User updated!"}
+
+    def get_user_detail(self, method: str, params: Dict[str, str]):
+        if method != "GET":
+            return METHOD_NOT_SUPPORTED
+        missing = _missing(params, ["email"], method)
+        if missing:
+            return missing
+        user = self.store.get(params["email"])
+        if user is None:
+            return HTTPStatus.NOT_FOUND, {"message": "Account not found with this email, try another email!"}
+        detail = {"id": int(user["id"])}
+        detail.update({target: user[source] for source, target in USER_DETAIL_FIELDS.items()})
+        return HTTPStatus.OK, {"user": detail}
+
+
+class _RequestHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+
+    def _params(self) -> Tuple[str, Dict[str, str]]:
+        parts = urlsplit(self.path)
+        params = {k: v[-1] for k, v in parse_qs(parts.query, keep_blank_values=True).items()}
+        length = int(self.headers.get("Content-Length") or 0)
+        if length:
+            body = self.rfile.read(length).decode("utf-8")
+            params.update({k: v[-1] for k, v in parse_qs(body, keep_blank_values=True).items()})
+        return parts.path, params
+
+    def _dispatch(self) -> None:
+        path, params = self._params()
+        endpoint = path.rstrip("/").rsplit("/", 1)[-1]
+        body = self.server.api.handle(self.command, endpoint, params)
+        status = HTTPStatus.OK
+        if body is None:
+            status = HTTPStatus.NOT_FOUND
+            body = {"responseCode": int(HTTPStatus.NOT_FOUND), "message": "Not found"}
+        payload = json.dumps(body).encode("utf-8")
+        self.send_response(status)
+        # The live site serves JSON bodies as text/html; mirror it.
+        self.send_header("Content-Type", "text/html; charset=UTF-8")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        if self.command != "HEAD":
+            self.wfile.write(payload)
+
+    do_GET = do_HEAD = do_POST = do_PUT = do_DELETE = do_PATCH = _dispatch
+
+    def log_message(self, format, *args) -> None:
+        pass
+
+
+class LocalApiServer:
+    """Runs AutomationExerciseApi on a background thread."""
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0):
+        self.api = AutomationExerciseApi()
+        self.httpd = ThreadingHTTPServer((host, port), _RequestHandler)
+        self.httpd.daemon_threads = True
+        self.httpd.api = self.api
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def base_url(self) -> str:
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}/api"
+
+    def start(self) -> "LocalApiServer":
+        self._thread = threading.Thread(
+            target=self.httpd.serve_forever, kwargs={"poll_interval": 0.05}, name="local-api-server", daemon=True
+        )
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self.httpd.shutdown()
+        self.httpd.server_close()
+        if self._thread is not None:
+            self._thread.join()
+
+    def __enter__(self) -> "LocalApiServer":
+        return self.start()
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.stop()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Serve the Automation Exercise API locally.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    args = parser.parse_args()
+
+    server = LocalApiServer(args.host, args.port)
+    print(f"Serving Automation Exercise API on {server.base_url}")
+    try:
+        server.httpd.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.httpd.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,51 @@
+import socket
+import asyncio
+from time import perf_counter
+import pytest
+from api.api_client import ApiClient
+from api.async_api_client import AsyncApiClient
+from api.cassette import PASSTHROUGH
+from api.latency import LatencyRecorder
+from api.api_endpoints import ApiEndpoints
+from config.config import Config
+
+class TestApiClient:
+    """Connection handling of the synchronous ApiClient."""
+
+    def test_warmed_connections_are_reused(self, request, api_base_url):
+        """Connections opened by warmup stay pooled, so the first requests need no handshake."""
+        if request.config.getoption("--api-mode") != PASSTHROUGH:
+            pytest.skip("Connections are only warmed up against a live server")
+        client = ApiClient(base_url=api_base_url, latency=LatencyRecorder())
+
+        opened = client.warmup(2)
+        for _ in range(3):
+            client.get(ApiEndpoints.BRANDS_LIST)
+        stats = client.connection_stats()
+        client.close()
+
+        assert opened == 2, f"Expected 2 warmed connections, got {opened}"
+        assert stats["new_connections"] == 2 and stats["reused"] == 3, \
+            f"Expected every request to reuse a warmed connection, got {stats}"
+
+
+class TestAsyncApiClient:
+    """Timeouts of the asyncio ApiClient."""
+
+    @pytest.mark.asyncio
+    async def test_stalled_server_times_out(self, monkeypatch):
+        """A server that accepts but never answers fails the request after the read timeout."""
+        import aiohttp
+        stalled = socket.socket()
+        stalled.bind(("127.0.0.1", 0))
+        stalled.listen()
+        monkeypatch.setattr(Config, "get_timeout", classmethod(lambda cls, endpoint: (1.0, 0.2)))
+
+        async with AsyncApiClient(base_url=f"http://127.0.0.1:{stalled.getsockname()[1]}/api") as client:
+            started = perf_counter()
+            with pytest.raises((asyncio.TimeoutError, aiohttp.ServerTimeoutError)):
+                await client.get(ApiEndpoints.BRANDS_LIST)
+            elapsed = perf_counter() - started
+        stalled.close()
+
+        assert elapsed < 5, f"Expected the 0.2s read timeout to fire, waited {elapsed:.1f}s"
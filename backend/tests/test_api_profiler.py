@@ -0,0 +1,31 @@
+import json
+import cProfile
+import pstats
+from plugins.api_profiler import own_frame_times
+
+def _inner(payload):
+    for _ in range(200):
+        json.loads(json.dumps(payload))
+
+def _outer(payload):
+    json.dumps([payload] * 2000)
+    return _inner(payload)
+
+class TestApiProfiler:
+    """Attribution of cProfile time to our own frames."""
+
+    def test_library_time_counts_against_own_caller(self):
+        """An own function's own time includes its library calls but not its calls into other own functions."""
+        profile = cProfile.Profile()
+        profile.enable()
+        _outer({"id": 1, "name": "Blue Top", "tags": list(range(20))})
+        profile.disable()
+
+        times = own_frame_times(pstats.Stats(profile).stats, lambda filename: filename == __file__)
+
+        by_name = {function[2]: values for function, values in times.items()}
+        assert set(by_name) == {"_outer", "_inner"}, f"Expected only this module's functions, got {sorted(by_name)}"
+        calls, own, cumulative = by_name["_outer"]
+        assert calls == 1 and own > 0, f"Expected _outer's json.dumps time as its own time, got {by_name['_outer']}"
+        assert abs(cumulative - own - by_name["_inner"][2]) < 1e-3, \
+            f"Expected _outer's cumulative time to split into its own time and _inner's, got {by_name}"
@@ -0,0 +1,101 @@
+import pytest
+from http import HTTPStatus
+from api.api_client import ApiClient
+from api.api_methods import ApiMethods
+from api.cassette import Cassette, CassetteMiss, CassetteNormalizer, RECORD, REPLAY
+from api.latency import LatencyRecorder
+from config.config import Config
+from data.test_data import TestData
+from data.user_pool import UserPool
+from server.local_api_server import LocalApiServer
+
+class TestCassette:
+    """Record against the local server, then replay without any server."""
+
+    def _methods(self, base_url, mode, directory, name="api"):
+        client = ApiClient(
+            base_url=base_url,
+            api_mode=mode,
+            cassette=Cassette(str(directory), name=name, mode=mode),
+            normalizer=CassetteNormalizer(Config.CASSETTE_IGNORE_FIELDS),
+            latency=LatencyRecorder()
+        )
+        return client, ApiMethods(api_client=client)
+
+    def test_replay_matches_new_dynamic_user(self, tmp_path):
+        recorded_user = TestData.get_dynamic_user()
+        with LocalApiServer() as server:
+            client, methods = self._methods(server.base_url, RECORD, tmp_path)
+            methods.create_account(recorded_user)
+            methods.get_user_detail(recorded_user["email"])
+            client.close()
+
+        replayed_user = TestData.get_dynamic_user()
+        client, methods = self._methods("http://127.0.0.1:9/api", REPLAY, tmp_path)
+
+        create_response = methods.create_account(replayed_user)
+        assert create_response.response_code == HTTPStatus.CREATED, \
+            f"Expected response code 201 CREATED, got {create_response.response_code}. Response: {create_response.json()}"
+
+        get_response = methods.get_user_detail(replayed_user["email"])
+        retrieved_user = get_response.json()["user"]
+        assert retrieved_user["email"] == replayed_user["email"], \
+            f"Expected replayed email '{replayed_user['email']}', got '{retrieved_user['email']}'"
+        assert retrieved_user["name"] == replayed_user["name"], \
+            f"Expected replayed name '{replayed_user['name']}', got '{retrieved_user['name']}'"
+
+        with pytest.raises(CassetteMiss):
+            methods.get_all_brands()
+        client.close()
+
+    def _read_pooled_account(self, methods, cassette):
+        pool = UserPool(methods, shared_size=1, exclusive_size=2, max_workers=3)
+        with cassette.in_scope("session:user_pool"):
+            pool.provision()
+        with pool.lease() as user:
+            return user, methods.get_user_detail(user["email"])
+
+    def test_replay_pooled_account_read_in_test_scope(self, tmp_path):
+        """Accounts created in the pool's session scope replay with this run's values when read from a test."""
+        with LocalApiServer() as server:
+            client, methods = self._methods(server.base_url, RECORD, tmp_path)
+            client.cassette.scope = "tests/test_users.py::test_read_user"
+            self._read_pooled_account(methods, client.cassette)
+            client.close()
+
+        client, methods = self._methods("http://127.0.0.1:9/api", REPLAY, tmp_path)
+        client.cassette.scope = "tests/test_users.py::test_read_user"
+        user, get_response = self._read_pooled_account(methods, client.cassette)
+        client.close()
+
+        assert client.cassette.scope == "tests/test_users.py::test_read_user", \
+            f"Expected the test scope to be restored, got '{client.cassette.scope}'"
+        retrieved_user = get_response.json()["user"]
+        assert (retrieved_user["email"], retrieved_user["name"]) == (user["email"], user["name"]), \
+            f"Expected the pooled account {user['email']} / {user['name']}, got {retrieved_user}"
+
+    def test_serial_recording_replaces_worker_cassettes(self, tmp_path):
+        """A serial re-recording deletes per-worker cassettes of an earlier -n N run instead of replaying them."""
+        user = TestData.get_dynamic_user()
+        with LocalApiServer() as server:
+            client, methods = self._methods(server.base_url, RECORD, tmp_path, name="api-gw0")
+            client.cassette.scope = "tests/test_users.py::test_read_user"
+            methods.get_user_detail(user["email"])
+            client.close()
+
+            client, methods = self._methods(server.base_url, RECORD, tmp_path)
+            client.cassette.scope = "tests/test_users.py::test_read_user"
+            methods.create_account(user)
+            methods.get_user_detail(user["email"])
+            client.close()
+
+        client, methods = self._methods("http://127.0.0.1:9/api", REPLAY, tmp_path)
+        client.cassette.scope = "tests/test_users.py::test_read_user"
+        methods.create_account(user)
+        get_response = methods.get_user_detail(user["email"])
+        client.close()
+
+        assert sorted(path.name for path in tmp_path.iterdir()) == ["api.cassette", "api.idx"], \
+            f"Expected only the serial recording to remain, got {sorted(path.name for path in tmp_path.iterdir())}"
+        assert get_response.response_code == HTTPStatus.OK, \
+            f"Expected the re-recorded account detail, got {get_response.json()}"
@@ -0,0 +1,70 @@
+from plugins.duration_scheduler import CACHE_KEY, estimate_durations, lpt_makespan, _make_scheduling_class
+
+class _FakeConfig:
+    """Just enough of pytest.Config for the scheduler: two workers and a duration cache."""
+
+    def __init__(self, history):
+        self.cache = self
+        self.history = history
+
+    def get(self, key, default):
+        return self.history if key == CACHE_KEY else default
+
+    def getvalue(self, name):
+        return ["2*popen"] if name == "tx" else None
+
+    def getoption(self, name):
+        return None
+
+class _FakeNode:
+    """Worker controller that records the test indexes sent to it."""
+
+    def __init__(self, worker_id):
+        self.gateway = type("Gateway", (), {"id": worker_id})()
+        self.shutting_down = False
+        self.sent = []
+
+    def send_runtest_some(self, indices):
+        self.sent.extend(indices)
+
+    def shutdown(self):
+        self.shutting_down = True
+
+class TestDurationScheduler:
+    """Duration estimates and makespan prediction behind --dist-durations."""
+
+    def test_unknown_tests_use_nearest_known_group(self):
+        """A new test is estimated from its class, then its module, then the suite."""
+        history = {
+            "tests/test_a.py::TestA::test_slow": 3.0,
+            "tests/test_a.py::TestA::test_fast": 1.0,
+            "tests/test_b.py::test_one": 0.2,
+        }
+        estimates = estimate_durations(
+            ["tests/test_a.py::TestA::test_new", "tests/test_b.py::test_new", "tests/test_c.py::test_new"], history
+        )
+
+        assert estimates == {
+            "tests/test_a.py::TestA::test_new": 2.0,
+            "tests/test_b.py::test_new": 0.2,
+            "tests/test_c.py::test_new": 1.0,
+        }, f"Unexpected estimates: {estimates}"
+
+    def test_lpt_makespan(self):
+        """Longest-first splits 3, 3, 2, 2, 2 over two workers as 3+2+2 and 3+2."""
+        assert lpt_makespan([2, 3, 2, 3, 2], workers=2) == 7, "Expected LPT makespan 7"
+
+    def test_initial_distribution_is_longest_first(self):
+        """The first tests each worker receives are the longest ones, not a chunk in collection order."""
+        collection = [f"tests/test_a.py::test_{i}" for i in range(12)]
+        history = {nodeid: float(i) for i, nodeid in enumerate(collection)}
+        scheduler = _make_scheduling_class()(_FakeConfig(history))
+        nodes = [_FakeNode("gw0"), _FakeNode("gw1")]
+        for node in nodes:
+            scheduler.add_node(node)
+            scheduler.add_node_collection(node, collection)
+
+        scheduler.schedule()
+
+        assert [node.sent for node in nodes] == [[11, 9], [10, 8]], \
+            f"Expected the four longest tests spread over both workers, got {[node.sent for node in nodes]}"
@@ -0,0 +1,32 @@
+import random
+from api.latency import LatencyHistogram, LatencyRecorder
+
+class TestLatency:
+    """Latency histograms behind the API latency report."""
+
+    def test_percentiles_within_bucket_precision(self):
+        """Percentiles stay within ~6% of the exact value."""
+        rng = random.Random(3)
+        samples = sorted(rng.uniform(0.0005, 2.0) for _ in range(10000))
+        histogram = LatencyHistogram()
+        for sample in samples:
+            histogram.record(sample)
+
+        for percent in (50, 90, 99):
+            exact = samples[round(len(samples) * percent / 100) - 1] * 1000
+            assert abs(histogram.percentile(percent) - exact) <= exact * 0.07, \
+                f"p{percent}: expected ~{exact:.2f} ms, got {histogram.percentile(percent):.2f} ms"
+
+    def test_worker_histograms_merge(self):
+        """Recorders serialized by xdist workers merge into the controller's totals."""
+        first, second = LatencyRecorder(), LatencyRecorder()
+        first.record("getUserDetailByEmail", "GET", total=0.010)
+        second.record("getUserDetailByEmail", "GET", total=0.030)
+
+        merged = LatencyRecorder()
+        for recorder in (first, second):
+            merged.merge(LatencyRecorder.from_dict(recorder.to_dict()))
+        histogram = merged.get("getUserDetailByEmail", "GET")
+
+        assert histogram.count == 2, f"Expected 2 samples, got {histogram.count}"
+        assert histogram.max_ms == 30.0, f"Expected max 30 ms, got {histogram.max_ms}"
@@ -0,0 +1,53 @@
+import json
+import random
+import pytest
+from api.latency import LatencyHistogram, LatencyRecorder
+from api.latency_baseline import (
+    build_baseline, compare, load_baseline, mann_whitney_greater, save_baseline, BaselineError
+)
+
+def _histogram(rng, scale, count=200):
+    histogram = LatencyHistogram()
+    for _ in range(count):
+        histogram.record(rng.lognormvariate(0, 0.3) * scale)
+    return histogram
+
+def _recorder(rng, scales):
+    recorder = LatencyRecorder()
+    for endpoint, scale in scales.items():
+        for _ in range(50):
+            recorder.record(endpoint, "GET", total=rng.lognormvariate(0, 0.3) * scale)
+    return recorder
+
+class TestLatencyGate:
+    """Baseline files and the significance test behind the latency regression gate."""
+
+    def test_mann_whitney_detects_shift_only(self):
+        """A 30% slower distribution is significant; another draw of the same one is not."""
+        rng = random.Random(7)
+        baseline = _histogram(rng, 0.010)
+
+        _, same_p = mann_whitney_greater(baseline, _histogram(rng, 0.010))
+        superiority, shifted_p = mann_whitney_greater(baseline, _histogram(rng, 0.013))
+
+        assert same_p > 0.01, f"Identical distributions flagged, p={same_p}"
+        assert shifted_p < 1e-6 and superiority > 0.6, \
+            f"Shift not detected: p={shifted_p}, superiority={superiority}"
+
+    def test_compare_against_saved_baseline(self, tmp_path):
+        """Only the endpoint that got slower regresses, and a baseline of another version is rejected."""
+        rng = random.Random(11)
+        path = str(tmp_path / "baseline.json")
+        save_baseline(path, build_baseline(_recorder(rng, {"brandsList": 0.005, "productsList": 0.005}), 1.5, "local"))
+
+        diffs = compare(load_baseline(path), _recorder(rng, {"brandsList": 0.005, "productsList": 0.008}))
+
+        regressed = [diff.endpoint for diff in diffs if diff.regressed]
+        assert regressed == ["productsList"], f"Expected only productsList to regress, got {regressed}"
+        with open(path) as f:
+            data = json.load(f)
+        data["version"] = 0
+        with open(path, "w") as f:
+            json.dump(data, f)
+        with pytest.raises(BaselineError):
+            load_baseline(path)
@@ -0,0 +1,24 @@
+from time import perf_counter
+from load.generator import LoadStats, arrival_times, run_scenario
+from load.scenarios import SCENARIOS
+
+class TestLoadGenerator:
+    """Arrival schedule and scenario accounting of the load generator."""
+
+    def test_ramp_arrivals_follow_rate_profile(self):
+        """A 0→20/s ramp over 2s then 20/s for 1s starts 20 + 20 scenarios."""
+        arrivals = list(arrival_times([(2, 20), (1, 20)]))
+
+        assert len(arrivals) == 40, f"Expected 40 arrivals, got {len(arrivals)}"
+        assert sum(1 for t in arrivals if t < 1) == 5, \
+            f"Expected a quarter of the ramp's arrivals in its first half, got {arrivals}"
+
+    def test_user_lifecycle_scenario_records_every_step(self, api_methods):
+        """One lifecycle run records one successful request per step."""
+        steps = SCENARIOS["user_lifecycle"]
+        stats = LoadStats([name for name, _, _ in steps])
+
+        run_scenario(api_methods, steps, stats, scheduled=perf_counter())
+
+        for row in stats.rows():
+            assert (row["requests"], row["errors"]) == (1, 0), f"Unexpected result for {row['step']}: {row}"
@@ -0,0 +1,122 @@
+import json
+import logging
+import threading
+import pytest
+from utils.logger import ApiLogger, QUEUE, JSONL
+from utils.log_reader import iter_events, main
+
+@pytest.fixture
+def make_api_logger(tmp_path, monkeypatch):
+    """Build ApiLoggers writing JSONL under tmp_path, detached from the session logger's handlers."""
+    shared = logging.getLogger("api_logger")
+    monkeypatch.setattr(shared, "handlers", [])
+    created = []
+
+    def make(**kwargs) -> ApiLogger:
+        api_log = ApiLogger(log_dir=str(tmp_path), log_format=JSONL, **kwargs)
+        for handler in list(shared.handlers):
+            if not isinstance(handler, logging.FileHandler):
+                shared.removeHandler(handler)
+        created.append(api_log)
+        return api_log
+
+    yield make
+    for api_log in created:
+        api_log.close()
+    for handler in shared.handlers:
+        handler.close()
+
+class TestApiLoggerQueue:
+    """Back-pressure and shutdown of the queue-mode ApiLogger."""
+
+    def test_flood_samples_then_drops_and_flushes_on_close(self, make_api_logger, tmp_path):
+        """Past the high-water mark records are sampled, past capacity dropped; close() writes everything kept."""
+        api_log = make_api_logger(mode=QUEUE, queue_size=100, sample_every=10)
+        gate = threading.Event()
+        write = api_log._write
+
+        def stalled_write(*args):
+            gate.wait(5)
+            write(*args)
+
+        api_log._write = stalled_write
+        flood = 2000
+
+        for i in range(flood):
+            api_log.log_event("retry", f"http://localhost/api/brandsList?i={i}", attempt=i)
+        dropped, sampled_out = api_log.dropped, api_log.sampled_out
+        gate.set()
+        api_log.close()
+
+        events = list(iter_events([str(tmp_path / "api_traffic.jsonl")]))
+        kept = flood - dropped - sampled_out
+        assert sampled_out > dropped > 0, f"Expected sampling before drops, got {dropped} dropped, {sampled_out} sampled out"
+        assert 100 <= kept <= 101, f"Expected the queue (plus the record being written) to be kept, got {kept}"
+        assert len(events) == kept, f"Expected all {kept} queued records flushed on close, found {len(events)}"
+        assert events[0]["attempt"] == 0 and all(event["event"] == "retry" for event in events), \
+            f"Expected records written in order, first was {events[0]}"
+        with open(tmp_path / "api_traffic.jsonl") as f:
+            assert f"{dropped} records dropped, {sampled_out} sampled out" in f.read(), \
+                "Expected the back-pressure summary to be logged on close"
+
+    def test_queued_records_keep_values_at_call_time(self, make_api_logger, tmp_path):
+        """Changes the caller makes to its dicts after logging do not reach the queued record."""
+        api_log = make_api_logger(mode=QUEUE, queue_size=100)
+        gate = threading.Event()
+        write = api_log._write
+
+        def stalled_write(*args):
+            gate.wait(5)
+            write(*args)
+
+        api_log._write = stalled_write
+        params = {"email": "first@example.com"}
+        headers = {"X-Attempt": "1"}
+
+        api_log.log_request("GET", "http://localhost/api/getUserDetailByEmail", headers=headers, params=params)
+        params["email"] = "second@example.com"
+        headers["X-Attempt"] = "2"
+        gate.set()
+        api_log.close()
+
+        event = next(iter_events([str(tmp_path / "api_traffic.jsonl")]))
+        assert event["params"] == {"email": "first@example.com"} and event["headers"] == {"X-Attempt": "1"}, \
+            f"Expected the values at call time, got {event}"
+
+    def test_close_drains_without_back_pressure(self, make_api_logger, tmp_path):
+        """Below the high-water mark nothing is lost and close() leaves no record behind."""
+        api_log = make_api_logger(mode=QUEUE, queue_size=1000)
+
+        correlation_id = api_log.log_request("GET", "http://localhost/api/brandsList")
+        api_log.log_response(200, "http://localhost/api/brandsList", response_json={"responseCode": 200},
+                             correlation_id=correlation_id)
+        api_log.close()
+
+        events = list(iter_events([str(tmp_path / "api_traffic.jsonl")]))
+        assert [event["event"] for event in events] == ["request", "response"], f"Unexpected events {events}"
+        assert api_log.dropped == api_log.sampled_out == 0, "Expected no back-pressure"
+
+
+class TestApiLoggerRotation:
+    """Size-rotated, gzipped JSONL logs read back through log_reader."""
+
+    def test_rotated_gzip_logs_read_back_in_order(self, make_api_logger, tmp_path, capsys):
+        """Every event survives rotation into .gz files and log_reader streams them oldest first."""
+        api_log = make_api_logger(max_file_bytes=1024, backup_count=50)
+        total = 150
+
+        for i in range(total):
+            api_log.log_event("cache_hit" if i % 3 == 0 else "retry", "http://localhost/api/brandsList", attempt=i)
+        api_log.request_handler.close()
+
+        rotated = sorted(path.name for path in tmp_path.glob("api_traffic.jsonl.*"))
+        events = list(iter_events([str(tmp_path / "api_traffic.jsonl*")]))
+        main([str(tmp_path / "api_traffic.jsonl*"), "--event", "cache_hit"])
+        cache_hits = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+
+        assert len(rotated) >= 10 and all(name.endswith(".gz") for name in rotated), \
+            f"Expected at least 10 gzipped rotations (so .10 sorts before .9), got {rotated}"
+        assert [event["attempt"] for event in events] == list(range(total)), \
+            f"Expected all {total} events oldest first, got {[event['attempt'] for event in events]}"
+        assert [event["attempt"] for event in cache_hits] == list(range(0, total, 3)), \
+            f"Expected --event cache_hit to select every third event, got {cache_hits}"
@@ -0,0 +1,35 @@
+from contextlib import nullcontext
+from data.prerequisites import Prerequisites
+
+class CountingPool:
+    """Stands in for UserPool, handing out numbered accounts."""
+
+    def __init__(self):
+        self.created = 0
+
+    def _account(self):
+        self.created += 1
+        return {"email": f"user{self.created}@example.com"}
+
+    def lease(self):
+        return nullcontext(self._account())
+
+    def exclusive(self):
+        return self._account()
+
+class TestPrerequisites:
+    """Shared versus isolated prerequisite state."""
+
+    def test_read_only_uses_share_one_setup(self):
+        """Read-only uses share one account; mutating uses each get their own."""
+        pool = CountingPool()
+        prerequisites = Prerequisites(pool)
+
+        shared = [prerequisites.get("existing_account") for _ in range(3)]
+        isolated = [prerequisites.get("existing_account", mutates=True) for _ in range(2)]
+
+        assert len({user["email"] for user in shared}) == 1, f"Expected one shared account, got {shared}"
+        assert len({user["email"] for user in isolated}) == 2, f"Expected two isolated accounts, got {isolated}"
+        assert pool.created == 3, f"Expected 3 accounts created, got {pool.created}"
+        assert prerequisites.round_trips_saved() == 4, \
+            f"Expected 4 round trips saved, got {prerequisites.round_trips_saved()}"
@@ -0,0 +1,88 @@
+import pytest
+from http import HTTPStatus
+from data.catalog_cache import CatalogCache, CatalogIndex
+from server.catalog import PRODUCTS
+
+class TestProducts:
+    """Test product search against the cached catalog."""
+    
+    @pytest.mark.parametrize("term", ["top", "Dress", "jeans", "blue top", "saree"])
+    def test_search_product_matches_catalog(self, api_methods, catalog, term):
+        """
+        API 5: POST To Search Product
+        
+        API URL: https://automationexercise.com/api/searchProduct
+        Request Method: POST
+        Request Parameter: search_product
+        Response Code: 200
+        Response JSON: Searched products list
+        """
+        search_response = api_methods.search_product(term)
+        
+        assert search_response.response_code == HTTPStatus.OK, \
+            f"Expected response code 200 OK, got {search_response.response_code}. Response: {search_response.json()}"
+        
+        found_ids = [product["id"] for product in search_response.json()["products"]]
+        expected_ids = [product["id"] for product in catalog.search(term)]
+        assert found_ids == expected_ids, \
+            f"Search for '{term}' returned {found_ids}, catalog lookup expects {expected_ids}"
+    
+    @pytest.mark.parametrize("term, expected_ids", [
+        ("top", [1, 5, 6, 7, 8, 12, 14, 15, 16, 18, 20]),
+        ("blue top", [1]),
+        ("saree", [38, 39, 40, 41]),
+    ])
+    def test_search_product_returns_known_products(self, api_methods, catalog, term, expected_ids):
+        """searchProduct and the catalog index both return the products known to match ``term``."""
+        search_response = api_methods.search_product(term)
+        
+        found_ids = [product["id"] for product in search_response.json()["products"]]
+        indexed_ids = [product["id"] for product in catalog.search(term)]
+        assert found_ids == expected_ids, f"Search for '{term}' returned {found_ids}, expected {expected_ids}"
+        assert indexed_ids == expected_ids, f"Catalog index for '{term}' returned {indexed_ids}, expected {expected_ids}"
+    
+    def test_index_search_on_handwritten_catalog(self):
+        """Substring, multi-word, category and case-insensitive matches on a catalog small enough to check by hand."""
+        products = [
+            {"id": 1, "name": "Blue Top", "brand": "Polo", "category": {"usertype": {"usertype": "Women"}, "category": "Tops"}},
+            {"id": 2, "name": "Men Tshirt", "brand": "H&M", "category": {"usertype": {"usertype": "Men"}, "category": "Tshirts"}},
+            {"id": 3, "name": "Stylish Dress", "brand": "Madame", "category": {"usertype": {"usertype": "Women"}, "category": "Dress"}},
+            {"id": 4, "name": "Top Blue Denim", "brand": "Polo", "category": {"usertype": {"usertype": "Men"}, "category": "Jeans"}},
+            {"id": 5, "name": "Cotton Saree", "brand": "Biba", "category": {"usertype": {"usertype": "Women"}, "category": "Saree"}},
+        ]
+        index = CatalogIndex(products)
+        
+        expectations = {
+            "top": [1, 4],          # name or category, any case
+            "blue top": [1],        # the whole term must appear, not just both words
+            "tshirt": [2],
+            "shirt": [2],           # inside a word
+            "dress": [3],
+            "saree": [5],
+            "polo": [],             # brand is not searched
+            "women": [],            # neither is usertype
+            "e d": [4],             # across a word boundary ("Blue Denim")
+            "dress top": [],        # both words exist, never together
+            "": [1, 2, 3, 4, 5],
+        }
+        for term, expected_ids in expectations.items():
+            found_ids = [product["id"] for product in index.search(term)]
+            assert found_ids == expected_ids, f"Index search for '{term}' returned {found_ids}, expected {expected_ids}"
+    
+    def test_index_matches_full_scan(self):
+        """Indexed search returns exactly what a substring scan of name and category does."""
+        index = CatalogIndex(PRODUCTS)
+        
+        for term in ["top", "tshirt", "men", "kids", "sleeve", "cotton indie", "x"]:
+            scan = [p for p in PRODUCTS
+                    if term in p["name"].lower() or term in p["category"]["category"].lower()]
+            assert index.search(term) == scan, f"Index and scan disagree for '{term}'"
+    
+    def test_catalog_snapshot_shared_through_cache_dir(self, api_methods, tmp_path):
+        """A second cache (e.g. another xdist worker) reads the snapshot instead of fetching."""
+        first = CatalogCache(api_methods, cache_dir=str(tmp_path))
+        second = CatalogCache(api_methods, cache_dir=str(tmp_path))
+        
+        assert first.products == second.products, "Expected both caches to see the same catalog"
+        assert (first.fetches, second.fetches) == (1, 0), \
+            f"Expected one fetch in total, got {first.fetches} and {second.fetches}"
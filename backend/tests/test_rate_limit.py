@@ -0,0 +1,31 @@
+import pytest
+from api.rate_limit import RateLimiter, merge_wait_stats
+
+class TestRateLimit:
+    """Token-bucket rate limiting shared through a memory-mapped file."""
+
+    def test_workers_share_one_budget(self, tmp_path):
+        """Two limiters on the same file (as two xdist workers) draw from one bucket."""
+        path = str(tmp_path / "buckets.bin")
+        workers = [RateLimiter({"*": 10}, path), RateLimiter({"*": 10}, path)]
+
+        waits = [workers[i % 2].reserve("productsList") for i in range(12)]
+
+        assert waits[:10] == [0.0] * 10, f"Expected a burst of 10 free requests, got {waits}"
+        assert waits[10] == pytest.approx(0.1, abs=0.02) and waits[11] == pytest.approx(0.2, abs=0.02), \
+            f"Expected requests beyond the burst to queue 0.1s apart, got {waits[10:]}"
+        for worker in workers:
+            worker.close()
+
+    def test_endpoint_limit_and_wait_stats(self):
+        """A per-endpoint limit throttles only that endpoint, and waits are counted and mergeable."""
+        limiter = RateLimiter({"*": 1000, "productsList": 50})
+
+        waits = [limiter.acquire("productsList") for _ in range(52)]
+        other = limiter.reserve("brandsList")
+
+        assert waits[-1] > 0 and other == 0.0, f"Expected only productsList to wait, got {waits[-1]} and {other}"
+        stats = merge_wait_stats(limiter.stats(), limiter.stats())["productsList"]
+        assert stats["requests"] == 104 and stats["throttled"] == 4, f"Unexpected merged stats {stats}"
+        assert stats["max_wait_s"] == pytest.approx(0.02, abs=0.01), f"Unexpected max wait {stats['max_wait_s']}"
+        limiter.close()
@@ -0,0 +1,50 @@
+import pytest
+from api.response_cache import ResponseCache, StaleCacheError, STRICT
+from data.test_data import TestData
+
+class TestResponseCache:
+    """Write-invalidated LRU cache of GET responses in ApiClient."""
+
+    def test_writes_invalidate_cached_user_detail(self, api_methods, monkeypatch):
+        """Repeated reads are served from the cache until a write to the same email, and the LRU is bounded."""
+        cache = ResponseCache(max_entries=1)
+        monkeypatch.setattr(api_methods.api_client, "response_cache", cache)
+        user_data = TestData.get_dynamic_user()
+        api_methods.create_account(user_data)
+
+        first = api_methods.get_user_detail(user_data["email"])
+        second = api_methods.get_user_detail(user_data["email"])
+        api_methods.update_account(dict(user_data, name="Renamed"))
+        after_update = api_methods.get_user_detail(user_data["email"])
+        api_methods.get_user_detail(f"nonexistent_{user_data['email']}")
+        api_methods.delete_account(user_data["email"], user_data["password"])
+        after_delete = api_methods.get_user_detail(user_data["email"])
+
+        assert second is first, "Expected the second read to be served from the cache"
+        assert after_update.json()["user"]["name"] == "Renamed", \
+            f"Expected the update to be visible, got {after_update.json()}"
+        assert after_delete.response_code == 404, f"Expected the deleted account to be gone, got {after_delete.json()}"
+        stats = cache.stats()
+        assert (stats["hits"], stats["misses"], stats["evictions"]) == (1, 4, 2), f"Unexpected cache stats {stats}"
+
+    def test_strict_mode_detects_stale_hit(self, api_methods, monkeypatch):
+        """A write made behind the cache's back (as by another worker) fails the next verified hit."""
+        cache = ResponseCache(mode=STRICT, verify_rate=1.0)
+        monkeypatch.setattr(api_methods.api_client, "response_cache", cache)
+        user_data = TestData.get_dynamic_user()
+        api_methods.create_account(user_data)
+
+        api_methods.get_user_detail(user_data["email"])
+        fresh = api_methods.get_user_detail(user_data["email"])
+        with monkeypatch.context() as other_worker:
+            other_worker.setattr(api_methods.api_client, "response_cache", None)
+            api_methods.update_account(dict(user_data, name="Renamed"))
+        with pytest.raises(StaleCacheError):
+            api_methods.get_user_detail(user_data["email"])
+        refreshed = api_methods.get_user_detail(user_data["email"])
+
+        assert fresh.json()["user"]["name"] == user_data["name"], f"Unexpected verified hit {fresh.json()}"
+        assert refreshed.json()["user"]["name"] == "Renamed", \
+            f"Expected the stale entry to be replaced, got {refreshed.json()}"
+        stats = cache.stats()
+        assert (stats["verified"], stats["stale"]) == (3, 1), f"Unexpected cache stats {stats}"
@@ -0,0 +1,162 @@
+import time
+import threading
+import pytest
+import requests
+from api.api_client import ApiClient
+from api.api_endpoints import ApiEndpoints
+from api.latency import LatencyRecorder
+from api.retry import RetryPolicy, HedgePolicy
+from server.local_api_server import LocalApiServer
+from data.test_data import TestData
+
+class _FlakyRoute:
+    """Wraps a local server route: drops the connection for the first ``failures`` calls, stalls the first ``stalls``."""
+
+    def __init__(self, route, failures: int = 0, stalls: int = 0, stall_seconds: float = 0.0):
+        self.route = route
+        self.failures = failures
+        self.stalls = stalls
+        self.stall_seconds = stall_seconds
+        self.calls = 0
+        self._lock = threading.Lock()
+
+    def __call__(self, method, params):
+        with self._lock:
+            self.calls += 1
+            call = self.calls
+        if call <= self.failures:
+            raise ConnectionAbortedError(f"Injected failure {call}")
+        if call <= self.stalls:
+            time.sleep(self.stall_seconds)
+        return self.route(method, params)
+
+
+@pytest.fixture
+def flaky_server():
+    """A private local API server whose routes can be swapped for flaky ones."""
+    with LocalApiServer() as server:
+        # Injected failures would otherwise print a traceback per dropped connection
+        server.httpd.handle_error = lambda request, client_address: None
+        yield server
+
+def _make_flaky(server, endpoint: str, **kwargs) -> _FlakyRoute:
+    route = _FlakyRoute(server.api.routes[endpoint], **kwargs)
+    server.api.routes[endpoint] = route
+    return route
+
+def _client(server, max_attempts: int = 3) -> ApiClient:
+    client = ApiClient(base_url=server.base_url, latency=LatencyRecorder())
+    client.retry_policy = RetryPolicy(max_attempts=max_attempts, base_delay=0.001, max_delay=0.001)
+    client.hedge_policy = None
+    return client
+
+class TestRetryPolicy:
+    """Capped exponential backoff with full jitter."""
+
+    def test_backoff_is_full_jitter_under_the_cap(self):
+        """Delays spread over the whole [0, min(max_delay, base_delay * 2**n)] range."""
+        policy = RetryPolicy(max_attempts=5, base_delay=0.1, max_delay=0.5)
+
+        for attempt, cap in [(0, 0.1), (1, 0.2), (2, 0.4), (3, 0.5), (10, 0.5)]:
+            delays = [policy.backoff(attempt) for _ in range(500)]
+            assert all(0 <= delay <= cap for delay in delays), \
+                f"Attempt {attempt}: delays outside [0, {cap}]: {min(delays)}..{max(delays)}"
+            assert min(delays) < cap * 0.1 and max(delays) > cap * 0.9, \
+                f"Attempt {attempt}: expected full jitter over [0, {cap}], got {min(delays)}..{max(delays)}"
+
+    def test_should_retry_counts_attempts(self):
+        """max_attempts includes the first try."""
+        policy = RetryPolicy(max_attempts=3)
+
+        assert [policy.should_retry(attempt) for attempt in range(3)] == [True, True, False], \
+            "Expected two retries after the first attempt"
+
+
+class TestApiClientRetry:
+    """Retries of ApiClient against a local server that drops connections."""
+
+    def test_get_is_retried_until_it_succeeds(self, flaky_server):
+        """A GET that fails twice succeeds on the third and last attempt."""
+        route = _make_flaky(flaky_server, ApiEndpoints.BRANDS_LIST, failures=2)
+        client = _client(flaky_server, max_attempts=3)
+
+        response = client.get(ApiEndpoints.BRANDS_LIST)
+        client.close()
+
+        assert response.status_code == 200, f"Expected the third attempt to succeed, got {response.status_code}"
+        assert route.calls == 3, f"Expected 3 calls, got {route.calls}"
+
+    def test_get_gives_up_after_max_attempts(self, flaky_server):
+        """The last connection error is raised once the attempts are used up."""
+        route = _make_flaky(flaky_server, ApiEndpoints.BRANDS_LIST, failures=5)
+        client = _client(flaky_server, max_attempts=3)
+
+        with pytest.raises(requests.exceptions.ConnectionError):
+            client.get(ApiEndpoints.BRANDS_LIST)
+        client.close()
+
+        assert route.calls == 3, f"Expected 3 calls, got {route.calls}"
+
+    @pytest.mark.parametrize("method, endpoint", [
+        ("post", ApiEndpoints.CREATE_ACCOUNT),
+        ("put", ApiEndpoints.UPDATE_ACCOUNT),
+        ("delete", ApiEndpoints.DELETE_ACCOUNT),
+    ])
+    def test_writes_are_not_retried(self, flaky_server, method, endpoint):
+        """POST, PUT and DELETE fail on the first error, since repeating them could apply a write twice."""
+        route = _make_flaky(flaky_server, endpoint, failures=1)
+        client = _client(flaky_server, max_attempts=3)
+
+        with pytest.raises(requests.exceptions.ConnectionError):
+            getattr(client, method)(endpoint, data=TestData.get_dynamic_user())
+        client.close()
+
+        assert route.calls == 1, f"Expected a single {method.upper()} call, got {route.calls}"
+
+
+class TestApiClientHedging:
+    """Hedged GETs against a local server that stalls."""
+
+    def test_hedge_fires_after_recent_p95(self, flaky_server):
+        """A GET outliving the endpoint's recent p95 gets a duplicate, and the faster answer wins."""
+        route = _make_flaky(flaky_server, ApiEndpoints.BRANDS_LIST, stalls=1, stall_seconds=1.0)
+        client = _client(flaky_server)
+        client.hedge_policy = HedgePolicy(percentile=95, min_samples=20, min_delay=0.01)
+        for _ in range(19):
+            client.hedge_policy.observe(ApiEndpoints.BRANDS_LIST, 0.01)
+        client.hedge_policy.observe(ApiEndpoints.BRANDS_LIST, 0.2)
+        p95 = client.hedge_policy.delay(ApiEndpoints.BRANDS_LIST)
+
+        started = time.perf_counter()
+        response = client.get(ApiEndpoints.BRANDS_LIST)
+        elapsed = time.perf_counter() - started
+        client.close()
+
+        assert p95 == 0.2, f"Expected the hedge delay to be the recent p95 of 0.2s, got {p95}"
+        assert response.status_code == 200, f"Expected the hedged call to succeed, got {response.status_code}"
+        assert route.calls == 2, f"Expected the stalled call to be hedged once, got {route.calls} calls"
+        assert p95 <= elapsed < 1.0, f"Expected the hedge to answer after {p95}s and before the stall ends, took {elapsed:.2f}s"
+
+    def test_no_hedge_below_recent_p95(self, flaky_server):
+        """A GET answered within the recent p95 is sent once."""
+        route = _make_flaky(flaky_server, ApiEndpoints.BRANDS_LIST)
+        client = _client(flaky_server)
+        client.hedge_policy = HedgePolicy(percentile=95, min_samples=20, min_delay=0.01)
+        for _ in range(20):
+            client.hedge_policy.observe(ApiEndpoints.BRANDS_LIST, 1.0)
+
+        response = client.get(ApiEndpoints.BRANDS_LIST)
+        client.close()
+
+        assert response.status_code == 200, f"Expected the call to succeed, got {response.status_code}"
+        assert route.calls == 1, f"Expected no hedge, got {route.calls} calls"
+
+    def test_no_hedge_without_history(self, flaky_server):
+        """Hedging waits for min_samples latencies of the endpoint."""
+        client = _client(flaky_server)
+        client.hedge_policy = HedgePolicy(min_samples=20)
+        for _ in range(19):
+            client.hedge_policy.observe(ApiEndpoints.BRANDS_LIST, 0.01)
+
+        assert client.hedge_policy.delay(ApiEndpoints.BRANDS_LIST) is None, "Expected no hedge delay below min_samples"
+        client.close()
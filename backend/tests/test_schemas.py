@@ -0,0 +1,28 @@
+import pytest
+from api.api_endpoints import ApiEndpoints
+from api.schemas import SchemaRegistry, SchemaValidationError, STRICT, WARN
+from server.catalog import PRODUCTS, BRANDS
+
+class TestSchemas:
+    """Compiled per-endpoint response schemas."""
+
+    def test_catalog_matches_schemas(self):
+        """The bundled catalog passes the productsList and brandsList schemas."""
+        registry = SchemaRegistry(mode=STRICT)
+
+        registry.validate(ApiEndpoints.PRODUCTS_LIST, {"responseCode": 200, "products": PRODUCTS})
+        registry.validate(ApiEndpoints.BRANDS_LIST, {"responseCode": 200, "brands": BRANDS})
+
+        assert registry.stats()["validated"] == 2, f"Expected 2 validations, got {registry.stats()}"
+
+    def test_mismatch_reports_paths(self):
+        """Missing fields and wrong types are reported with their JSON paths."""
+        registry = SchemaRegistry(mode=WARN)
+        user = {"id": "7", "email": "a@example.com"}
+
+        errors = registry.validate(ApiEndpoints.GET_USER_DETAIL, {"responseCode": 200, "user": user})
+
+        assert "$.user.id: expected int, got str" in errors, f"Missing type error in {errors}"
+        assert "$.user.name: missing" in errors, f"Missing field error in {errors}"
+        with pytest.raises(SchemaValidationError):
+            SchemaRegistry(mode=STRICT).validate(ApiEndpoints.GET_USER_DETAIL, {"responseCode": 200, "user": user})
@@ -0,0 +1,30 @@
+import json
+from http import HTTPStatus
+from api.json_stream import JsonListStream
+from server.catalog import PRODUCTS
+
+class TestStreaming:
+    """Incrementally parsed productsList and brandsList responses."""
+
+    def test_items_survive_any_chunk_boundary(self):
+        """Items and envelope fields parse the same however the body is split."""
+        body = json.dumps({"responseCode": 200, "products": PRODUCTS[:3] + [12345, "Tôp ✓"], "message": "ok"}).encode("utf-8")
+
+        for size in range(1, 40):
+            stream = JsonListStream([body[i:i + size] for i in range(0, len(body), size)], "products")
+
+            assert stream.header() == {"responseCode": 200}, f"Chunk size {size}: header {stream.header()}"
+            assert list(stream) == PRODUCTS[:3] + [12345, "Tôp ✓"], f"Chunk size {size}: items differ"
+            assert stream.envelope == {"responseCode": 200, "message": "ok"}, f"Chunk size {size}: {stream.envelope}"
+
+    def test_stream_products_matches_products_list(self, api_methods):
+        """Streamed products equal the buffered productsList response, and the connection is released."""
+        expected = api_methods.get_all_products().json()["products"]
+
+        with api_methods.stream_products() as response:
+            assert response.response_code == HTTPStatus.OK, f"Expected response code 200, got {response.response_code}"
+            products = list(response)
+
+        assert products == expected, f"Streamed {len(products)} products, expected {len(expected)}"
+        assert response.complete and response.closed, "Expected the stream to be fully read and closed"
+        assert len(response.preview) <= response.preview_items, f"Preview kept {len(response.preview)} items"
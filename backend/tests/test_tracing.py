@@ -0,0 +1,41 @@
+import json
+from api.api_endpoints import ApiEndpoints
+from utils.tracing import Tracer, merge_traces, read_trace
+
+class TestTracing:
+    """Chrome trace spans for API requests and the per-worker file merger."""
+
+    def test_api_request_span(self, api_client, tmp_path, monkeypatch):
+        """Each ApiClient request becomes a span carrying its endpoint, status, byte counts and test context."""
+        tracer = Tracer()
+        tracer.start(str(tmp_path / "trace-gw0.json"), process_name="gw0")
+        tracer.context = {"worker": "gw0", "nodeid": "tests/test_tracing.py::test"}
+        monkeypatch.setattr(api_client, "tracer", tracer)
+
+        api_client.get(ApiEndpoints.BRANDS_LIST)
+        tracer.close()
+
+        spans = [event for event in read_trace(tracer.path) if event.get("cat") == "api"]
+        assert len(spans) == 1, f"Expected one API span, got {spans}"
+        args = spans[0]["args"]
+        assert args["endpoint"] == ApiEndpoints.BRANDS_LIST and args["status"] == 200, f"Unexpected span args {args}"
+        assert args["bytes_in"] > 0 and args["worker"] == "gw0" and args["nodeid"].endswith("::test"), \
+            f"Expected byte counts and test context in {args}"
+
+    def test_merge_worker_files(self, tmp_path):
+        """Worker files merge into one time-ordered timeline, including a file cut short by a crash."""
+        tracer = Tracer()
+        tracer.start(str(tmp_path / "trace-gw0.json"), process_name="gw0")
+        tracer.complete("call", "pytest", 2.0, 2.5)
+        tracer.close()
+        crashed = tmp_path / "trace-gw1.json"
+        crashed.write_text('[{"name":"call","cat":"pytest","ph":"X","ts":1.0,"dur":5.0,"pid":2,"tid":2},')
+        paths = [tracer.path, str(crashed)]
+
+        count = merge_traces(paths, str(tmp_path / "session.json"))
+
+        with open(tmp_path / "session.json") as f:
+            events = json.load(f)["traceEvents"]
+        spans = [event for event in events if event["ph"] == "X"]
+        assert count == len(events) and len(spans) == 2, f"Expected 2 spans in {events}"
+        assert spans[0]["ts"] <= spans[1]["ts"], f"Spans are not time ordered: {spans}"
@@ -0,0 +1,33 @@
+from utils.user_factory import UserBatch, UserStream
+from utils.helpers import generate_test_user
+
+class TestUserFactory:
+    """Batch-generated test users."""
+
+    def test_batch_emails_are_unique(self):
+        """Every user in a batch gets a distinct email."""
+        batch = UserBatch(5000, seed=42)
+        emails = [user["email"] for user in batch]
+
+        assert len(set(emails)) == len(emails), \
+            f"Expected {len(emails)} unique emails, got {len(set(emails))}"
+
+    def test_batch_is_reproducible_from_seed(self):
+        """The same seed produces the same users."""
+        assert UserBatch(50, seed=7)[49] == UserBatch(50, seed=7)[49], \
+            "Expected identical users for identical seeds"
+
+    def test_stream_users_match_legacy_fields(self):
+        """Streamed users carry the same fields as generate_test_user()."""
+        user = UserStream(batch_size=10, seed=1).next_user()
+
+        assert set(user) == set(generate_test_user()), \
+            f"Field mismatch: {sorted(set(user) ^ set(generate_test_user()))}"
+
+    def test_streams_sharing_a_seed_stay_distinct(self):
+        """Processes sharing TEST_DATA_SEED get distinct users, each reproducible from its stream id."""
+        first = [UserStream(batch_size=10, seed=5, stream_id=worker).next_user()["email"] for worker in ("gw0", "gw1")]
+        again = UserStream(batch_size=10, seed=5, stream_id="gw0").next_user()["email"]
+
+        assert first[0] != first[1], f"Expected distinct emails per stream, got {first}"
+        assert again == first[0], f"Expected gw0 to reproduce {first[0]}, got {again}"
@@ -30,7 +30,8 @@ class TestUsers:
         assert create_response.json()["message"] == "User created!", \
             f"Expected message 'User created!', got '{create_response.json().get('message', 'No message')}'."
     
-    def test_read_user(self, api_methods):
+    @pytest.mark.requires("existing_account")
+    def test_read_user(self, api_methods, prerequisites):
         """
         API 14: GET user account detail by email
         
@@ -40,11 +41,7 @@ class TestUsers:
         Response Code: 200
         Response JSON: User Detail
         """
-        user_data = TestData.get_dynamic_user()
-        create_response = api_methods.create_account(user_data)
-        
-        assert create_response.status_code == HTTPStatus.OK, \
-            f"Setup failed: Could not create test user. Status: {create_response.status_code}, Response: {create_response.text}"
+        user_data = prerequisites["existing_account"]
         
         get_response = api_methods.get_user_detail(user_data["email"])
         
@@ -64,7 +61,8 @@ class TestUsers:
                 assert str(retrieved_user[field]) == str(value), \
                     f"Field '{field}' mismatch: expected '{value}', got '{retrieved_user[field]}'"
     
-    def test_update_user(self, api_methods):
+    @pytest.mark.requires("existing_account", mutates=True)
+    def test_update_user(self, api_methods, prerequisites):
         """
         API 13: PUT METHOD To Update User Account
         
@@ -74,11 +72,7 @@ class TestUsers:
         Response Code: 200
         Response Message: User updated!
         """
-        original_user = TestData.get_dynamic_user()
-        create_response = api_methods.create_account(original_user)
-        
-        assert create_response.status_code == HTTPStatus.OK, \
-            f"Setup failed: Could not create test user. Status: {create_response.status_code}, Response: {create_response.text}"
+        original_user = prerequisites["existing_account"]
         
         updated_user = TestData.get_dynamic_user()
         updated_user["email"] = original_user["email"]
@@ -106,7 +100,8 @@ class TestUsers:
                 assert str(retrieved_user[field]) == str(value), \
                     f"Field '{field}' mismatch after update: expected '{value}', got '{retrieved_user[field]}'"
     
-    def test_delete_user(self, api_methods):
+    @pytest.mark.requires("existing_account", mutates=True)
+    def test_delete_user(self, api_methods, prerequisites):
         """
         API 12: DELETE METHOD To Delete User Account
         
@@ -116,11 +111,7 @@ class TestUsers:
         Response Code: 200
         Response Message: Account deleted!
         """
-        user_data = TestData.get_dynamic_user()
-        create_response = api_methods.create_account(user_data)
-        
-        assert create_response.status_code == HTTPStatus.OK, \
-            f"Setup failed: Could not create test user. Status: {create_response.status_code}, Response: {create_response.text}"
+        user_data = prerequisites["existing_account"]
         
         delete_response = api_methods.delete_account(user_data["email"], user_data["password"])
         
@@ -138,13 +129,10 @@ class TestUsers:
         assert get_response.response_code == HTTPStatus.NOT_FOUND, \
             f"Expected response code 404 NOT_FOUND, got {get_response.response_code}. Response: {get_response.json()}"
     
-    def test_create_user_with_existing_email(self, api_methods):
+    @pytest.mark.requires("existing_account")
+    def test_create_user_with_existing_email(self, api_methods, prerequisites):
         """Test creating a user with an email that already exists."""
-        user_data = TestData.get_dynamic_user()
-        create_response = api_methods.create_account(user_data)
-        
-        assert create_response.status_code == HTTPStatus.OK, \
-            f"Setup failed: Could not create test user. Status: {create_response.status_code}, Response: {create_response.text}"
+        user_data = prerequisites["existing_account"]
         
         second_user = TestData.get_dynamic_user()
         second_user["email"] = user_data["email"]
@@ -161,7 +149,8 @@ class TestUsers:
         assert "exist" in error_message.lower(), \
             f"Expected error message about existing email, got: '{error_message}'"
     
-    def test_verify_login_with_valid_credentials(self, api_methods):
+    @pytest.mark.requires("existing_account")
+    def test_verify_login_with_valid_credentials(self, api_methods, prerequisites):
         """
         API 7: POST To Verify Login with valid details
         
@@ -171,11 +160,7 @@ class TestUsers:
         Response Code: 200
         Response Message: User exists!
         """
-        user_data = TestData.get_dynamic_user()
-        create_response = api_methods.create_account(user_data)
-        
-        assert create_response.status_code == HTTPStatus.OK, \
-            f"Setup failed: Could not create test user. Status: {create_response.status_code}, Response: {create_response.text}"
+        user_data = prerequisites["existing_account"]
         
         login_response = api_methods.verify_login(user_data["email"], user_data["password"])
         
@@ -368,4 +353,32 @@ class TestUsers:
         
         error_message = delete_response.json().get("message", "").lower()
         assert "not found" in error_message or "doesn't exist" in error_message, \
-            f"Expected error message about user not found, got: '{delete_response.json()}'"
\ No newline at end of file
+            f"Expected error message about user not found, got: '{delete_response.json()}'"
+    
+    def test_bulk_account_lifecycle(self, api_methods):
+        """Bulk create, read, login and delete return one result per input, in order, with per-item errors."""
+        users = [TestData.get_dynamic_user() for _ in range(4)]
+        
+        created = api_methods.create_accounts(users)
+        # Sent after the batch, so the original is always the one that wins
+        duplicate = api_methods.create_accounts([users[0]])
+        
+        assert [result.item["email"] for result in created] == [user["email"] for user in users], \
+            "Expected results in input order"
+        assert all(result.ok for result in created), f"Expected every account to be created, got {created}"
+        assert not duplicate[0].ok and duplicate[0].response.json()["message"] == "Email already exists!", \
+            f"Expected the duplicate email to fail, got {duplicate}"
+        
+        details = api_methods.get_user_details([user["email"] for user in users])
+        assert [result.response.json()["user"]["email"] for result in details] == [user["email"] for user in users], \
+            f"Expected details in input order, got {details}"
+        
+        logins = api_methods.verify_logins([(user["email"], user["password"]) for user in users] + [None])
+        assert all(result.ok for result in logins[:-1]), f"Expected every login to succeed, got {logins}"
+        assert isinstance(logins[-1].error, TypeError) and logins[-1].response is None, \
+            f"Expected the malformed pair to carry its own error, got {logins[-1]}"
+        
+        deleted = api_methods.delete_accounts([(user["email"], user["password"]) for user in users])
+        assert all(result.ok for result in deleted), f"Expected every account to be deleted, got {deleted}"
+        assert not set(api_methods.tracked_accounts()) & {user["email"] for user in users}, \
+            "Deleted accounts are still tracked for cleanup"
@@ -0,0 +1,51 @@
+import asyncio
+import pytest
+from http import HTTPStatus
+from data.test_data import TestData
+
+class TestUsersAsync:
+    """Concurrent user account operations through the async client."""
+
+    @pytest.mark.asyncio
+    async def test_create_and_read_users_concurrently(self, async_api_methods):
+        """Create several accounts at once, then read them all back concurrently."""
+        users = [TestData.get_dynamic_user() for _ in range(5)]
+
+        create_responses = await asyncio.gather(
+            *(async_api_methods.create_account(user) for user in users)
+        )
+
+        for create_response in create_responses:
+            assert create_response.status_code == HTTPStatus.OK, \
+                f"Expected HTTP status code 200 OK, got {create_response.status_code}. Response: {create_response.text}"
+
+            assert create_response.response_code == HTTPStatus.CREATED, \
+                f"Expected response code 201 CREATED, got {create_response.response_code}. Response: {create_response.json()}"
+
+        assert {user["email"] for user in users} <= set(async_api_methods.tracked_accounts()), \
+            "Expected created accounts to be tracked for deletion after the test"
+
+        get_responses = await asyncio.gather(
+            *(async_api_methods.get_user_detail(user["email"]) for user in users)
+        )
+
+        for user_data, get_response in zip(users, get_responses):
+            assert get_response.response_code == HTTPStatus.OK, \
+                f"Expected response code 200 OK, got {get_response.response_code}. Response: {get_response.json()}"
+
+            retrieved_user = get_response.json()["user"]
+            assert retrieved_user["email"] == user_data["email"], \
+                f"Expected email '{user_data['email']}', got '{retrieved_user['email']}'"
+
+    @pytest.mark.asyncio
+    async def test_verify_login_with_invalid_credentials(self, async_api_methods):
+        """Verify login with unknown credentials returns 404 through the async client."""
+        email = f"nonexistent_{TestData.get_dynamic_user()['email']}"
+
+        login_response = await async_api_methods.verify_login(email, "invalidPassword123")
+
+        assert login_response.status_code == HTTPStatus.OK, \
+            f"Expected HTTP status code 200 OK, got {login_response.status_code}. Response: {login_response.text}"
+
+        assert login_response.response_code == HTTPStatus.NOT_FOUND, \
+            f"Expected response code 404 NOT_FOUND, got {login_response.response_code}. Response: {login_response.json()}"
@@ -1,16 +1,33 @@
 import datetime
-from typing import Dict, Any
-from faker import Faker
+from typing import Dict, Any, TYPE_CHECKING
 
-# Initialize Faker
-fake = Faker()
+if TYPE_CHECKING:
+    from faker import Faker
+
+_fake = None
+
+def get_faker() -> "Faker":
+    """Return the shared Faker instance, importing and creating it on first use."""
+    global _fake
+    if _fake is None:
+        from faker import Faker
+        _fake = Faker()
+    return _fake
+
+def __getattr__(name: str):
+    # Keeps `from utils.helpers import fake` working without an import-time Faker
+    if name == "fake":
+        return get_faker()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 def generate_random_string(length: int = 10) -> str:
     """Generate random string."""
+    fake = get_faker()
     return fake.pystr(min_chars=length, max_chars=length)
 
 def generate_random_email() -> str:
     """Generate random email."""
+    fake = get_faker()
     return fake.email()
 
 def get_current_date() -> str:
@@ -19,10 +36,12 @@ def get_current_date() -> str:
 
 def get_random_number(min_val: int, max_val: int) -> int:
     """Get random number between min and max."""
+    fake = get_faker()
     return fake.random_int(min=min_val, max=max_val)
 
 def generate_test_user() -> Dict[str, Any]:
     """Generate test user data with field names matching API response structure."""
+    fake = get_faker()
     first_name = fake.first_name()
     last_name = fake.last_name()
     
@@ -48,6 +67,7 @@ def generate_test_user() -> Dict[str, Any]:
 
 def generate_payment_details() -> Dict[str, Any]:
     """Generate payment details."""
+    fake = get_faker()
     return {
         "name_on_card": fake.name(),
         "card_number": fake.credit_card_number(card_type=None),
@@ -0,0 +1,89 @@
+"""Stream and filter JSONL API traffic logs written by ApiLogger.
+
+Reads plain and gzip-rotated files line by line, so arbitrarily large logs
+never have to fit in memory:
+
+    python -m utils.log_reader logs/api_traffic.jsonl* --endpoint createAccount --event response
+"""
+import re
+import sys
+import glob
+import gzip
+import json
+import argparse
+from typing import Dict, Any, Iterable, Iterator, List, Optional
+from urllib.parse import urlsplit
+from utils.logger import TITLES
+
+def _rotation_order(path: str) -> int:
+    """Oldest first: api_traffic.jsonl.5.gz ... api_traffic.jsonl.1.gz, api_traffic.jsonl."""
+    match = re.search(r"\.(\d+)(\.gz)?$", path)
+    return -int(match.group(1)) if match else 0
+
+def expand_paths(patterns: Iterable[str]) -> List[str]:
+    paths = []
+    for pattern in patterns:
+        matched = glob.glob(pattern)
+        paths.extend(sorted(matched, key=_rotation_order) if matched else [pattern])
+    return paths
+
+def iter_events(paths: Iterable[str]) -> Iterator[Dict[str, Any]]:
+    """Yield decoded events from each file in order, skipping malformed lines."""
+    for path in expand_paths(paths):
+        opener = gzip.open if path.endswith(".gz") else open
+        with opener(path, "rt", encoding="utf-8") as f:
+            for line in f:
+                try:
+                    yield json.loads(line)
+                except ValueError:
+                    continue
+
+def filter_events(events: Iterable[Dict[str, Any]], event: Optional[str] = None, endpoint: Optional[str] = None,
+                  status: Optional[int] = None, correlation_id: Optional[str] = None,
+                  since: Optional[float] = None, until: Optional[float] = None) -> Iterator[Dict[str, Any]]:
+    for record in events:
+        if event and record.get("event") != event:
+            continue
+        if endpoint and urlsplit(record.get("url", "")).path.rstrip("/").rsplit("/", 1)[-1] != endpoint:
+            continue
+        if status is not None and record.get("status_code") != status:
+            continue
+        if correlation_id and record.get("id") != correlation_id:
+            continue
+        if since is not None and record.get("ts", 0) < since:
+            continue
+        if until is not None and record.get("ts", 0) > until:
+            continue
+        yield record
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Stream and filter JSONL API traffic logs.")
+    parser.add_argument("paths", nargs="+", help="Log files or glob patterns (.gz supported)")
+    parser.add_argument("--event", choices=list(TITLES))
+    parser.add_argument("--endpoint", help="Endpoint name, e.g. createAccount")
+    parser.add_argument("--status", type=int, help="HTTP status code of responses")
+    parser.add_argument("--id", dest="correlation_id", help="Correlation id linking a request and its response")
+    parser.add_argument("--since", type=float, help="Unix timestamp lower bound")
+    parser.add_argument("--until", type=float, help="Unix timestamp upper bound")
+    parser.add_argument("--limit", type=int, help="Stop after this many matches")
+    args = parser.parse_args(argv)
+
+    matches = filter_events(
+        iter_events(args.paths),
+        event=args.event,
+        endpoint=args.endpoint,
+        status=args.status,
+        correlation_id=args.correlation_id,
+        since=args.since,
+        until=args.until
+    )
+    try:
+        for count, record in enumerate(matches, start=1):
+            sys.stdout.write(json.dumps(record, separators=(",", ":"), ensure_ascii=False) + "\n")
+            if args.limit and count >= args.limit:
+                break
+    except BrokenPipeError:
+        pass
+
+if __name__ == "__main__":
+    main()
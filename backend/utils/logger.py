@@ -1,26 +1,101 @@
 import os
+import gzip
 import json
+import time
+import queue
+import random
+import shutil
+import atexit
 import logging
 import datetime
-from typing import Dict, Any, Optional, Union
+import itertools
+import threading
+import logging.handlers
+from typing import Dict, Any, Mapping, Optional, Union
+from urllib.parse import urlsplit
+from config.config import Config
+
+SYNC = "sync"
+QUEUE = "queue"
+
+PRETTY = "pretty"
+JSONL = "jsonl"
+
+# Returned by log_request when the endpoint's sampling rate skipped it; passing
+# it on to log_response skips the matching response as well.
+SAMPLED_OUT = ""
+
+# Every event ApiLogger writes, with its title in pretty logs; log_reader filters on these names
+TITLES = {
+    "request": "API Request",
+    "response": "API Response",
+    "error": "API Error",
+    "retry": "API Retry",
+    "hedge": "API Hedge",
+    "cache_hit": "API Cache Hit"
+}
+
+def _gzip_rotator(source: str, dest: str) -> None:
+    with open(source, "rb") as f_in, gzip.open(dest, "wb") as f_out:
+        shutil.copyfileobj(f_in, f_out)
+    os.remove(source)
+
+def _endpoint(url: Optional[str]) -> str:
+    return urlsplit(url or "").path.rstrip("/").rsplit("/", 1)[-1]
 
 class ApiLogger:
-    """API Logger for requests and responses."""
+    """API Logger for requests and responses.
     
-    def __init__(self, log_dir: str = "logs", log_level: int = logging.INFO):
+    In ``queue`` mode the calling thread only enqueues the raw request/response
+    data; a background writer thread does the JSON serialization and handler
+    I/O. Once the queue passes its high-water mark only every
+    ``sample_every``-th record is kept, and records are dropped when it is full.
+    
+    The ``jsonl`` format writes one compact JSON object per event to a
+    size-rotated ``api_traffic.jsonl`` (rolled files are gzipped), with bodies
+    truncated to ``max_body_bytes`` and a correlation id linking each request
+    to its response. ``sample_rates`` maps endpoint names (or ``"*"``) to the
+    fraction of calls logged.
+    """
+    
+    def __init__(self, log_dir: str = "logs", log_level: int = logging.INFO, mode: str = SYNC,
+                 queue_size: int = 10000, sample_every: int = 10, log_format: str = PRETTY,
+                 max_body_bytes: int = 4096, sample_rates: Optional[Dict[str, float]] = None,
+                 max_file_bytes: int = 50 * 1024 * 1024, backup_count: int = 5):
         self.log_dir = log_dir
         self.log_level = log_level
+        self.mode = mode
+        self.log_format = log_format
+        self.max_body_bytes = max_body_bytes
+        self.sample_rates = sample_rates or {}
+        self._ids = itertools.count(1)
+        self._id_prefix = f"{os.getpid():x}"
+        self.sample_every = max(1, sample_every)
         self.logger = logging.getLogger("api_logger")
         self.logger.setLevel(log_level)
+        self.dropped = 0
+        self.sampled_out = 0
+        self._sample_counter = 0
+        self._queue: Optional[queue.Queue] = None
+        self._writer: Optional[threading.Thread] = None
         
         os.makedirs(log_dir, exist_ok=True)
         
-        requests_log_file = os.path.join(log_dir, f"api_requests_{datetime.datetime.now().strftime('%Y%m%d')}.log")
-        self.request_handler = logging.FileHandler(requests_log_file)
-        self.request_handler.setLevel(log_level)
-        
         formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
-        self.request_handler.setFormatter(formatter)
+        
+        if log_format == JSONL:
+            self.request_handler = logging.handlers.RotatingFileHandler(
+                os.path.join(log_dir, "api_traffic.jsonl"), maxBytes=max_file_bytes, backupCount=backup_count,
+                delay=True
+            )
+            self.request_handler.namer = lambda name: f"{name}.gz"
+            self.request_handler.rotator = _gzip_rotator
+            self.request_handler.setFormatter(logging.Formatter('%(message)s'))
+        else:
+            requests_log_file = os.path.join(log_dir, f"api_requests_{datetime.datetime.now().strftime('%Y%m%d')}.log")
+            self.request_handler = logging.FileHandler(requests_log_file, delay=True)
+            self.request_handler.setFormatter(formatter)
+        self.request_handler.setLevel(log_level)
         
         self.logger.addHandler(self.request_handler)
         
@@ -28,11 +103,120 @@ class ApiLogger:
         console_handler.setLevel(log_level)
         console_handler.setFormatter(formatter)
         self.logger.addHandler(console_handler)
+        
+        if mode == QUEUE:
+            self._queue = queue.Queue(maxsize=queue_size)
+            self._high_water = int(queue_size * 0.75)
+            self._writer = threading.Thread(target=self._drain, name="api-logger-writer", daemon=True)
+            self._writer.start()
+            atexit.register(self.close)
+    
+    def _drain(self) -> None:
+        while True:
+            item = self._queue.get()
+            try:
+                if item is None:
+                    return
+                self._write(*item)
+            finally:
+                self._queue.task_done()
+    
+    def _enqueue(self, item) -> None:
+        if self._queue.qsize() >= self._high_water:
+            self._sample_counter += 1
+            if self._sample_counter % self.sample_every:
+                self.sampled_out += 1
+                return
+        try:
+            self._queue.put_nowait(item)
+        except queue.Full:
+            self.dropped += 1
+    
+    def _sampled(self, url: str) -> bool:
+        rate = self.sample_rates.get(_endpoint(url), self.sample_rates.get("*", 1.0))
+        return rate >= 1.0 or random.random() < rate
+    
+    def _emit(self, level: int, event: str, info: Dict[str, Any]) -> None:
+        """Serialize and log now, or hand off to the writer thread."""
+        if not self.logger.isEnabledFor(level):
+            return
+        if self._queue is None:
+            self._write(level, event, info, None)
+        else:
+            # Serialized later on the writer thread; copy the caller's params/data/headers as they are now
+            info = {key: dict(value) if isinstance(value, Mapping) else value for key, value in info.items()}
+            self._enqueue((level, event, info, time.time()))
+    
+    def _truncate(self, info: Dict[str, Any], key: str) -> None:
+        """Replace an oversized body with a string preview of its first max_body_bytes."""
+        body = info[key]
+        body_str = body if isinstance(body, str) else json.dumps(body, separators=(",", ":"), ensure_ascii=False)
+        body_bytes = len(body_str.encode("utf-8"))
+        if self.max_body_bytes and body_bytes > self.max_body_bytes:
+            info[key] = body_str.encode("utf-8")[:self.max_body_bytes].decode("utf-8", errors="ignore")
+            info["truncated"] = True
+        info["body_bytes"] = body_bytes
+    
+    def _format_jsonl(self, event: str, info: Dict[str, Any], created: Optional[float]) -> str:
+        record = {"ts": round(created or time.time(), 6), "event": event}
+        record.update(info)
+        for key in ("json", "text", "data"):
+            if record.get(key) is not None:
+                self._truncate(record, key)
+        return json.dumps(record, separators=(",", ":"), ensure_ascii=False, default=str)
+    
+    def _write(self, level: int, event: str, info: Dict[str, Any], created: Optional[float]) -> None:
+        title = TITLES.get(event, event)
+        if info.get("headers") is not None:
+            info["headers"] = dict(info["headers"])
+        try:
+            if self.log_format == JSONL:
+                message = self._format_jsonl(event, info, created)
+            else:
+                info_str = json.dumps(info, indent=2, ensure_ascii=False)
+                message = f"{title}:\n{info_str}"
+        except Exception as e:
+            self.logger.error(f"Error logging {title.lower()}: {e}")
+            message = f"{title}: {info}"
+        
+        if created is None:
+            self.logger.log(level, message)
+            return
+        record = self.logger.makeRecord(self.logger.name, level, __file__, 0, message, None, None)
+        record.created = created
+        record.msecs = (created - int(created)) * 1000
+        self.logger.handle(record)
+    
+    def flush(self) -> None:
+        """Block until every queued record has been written."""
+        if self._queue is not None:
+            self._queue.join()
+    
+    def close(self) -> None:
+        """Stop the writer thread after draining the queue."""
+        if self._writer is None:
+            return
+        self._queue.put(None)
+        self._writer.join()
+        self._writer = None
+        self._queue = None
+        if self.dropped or self.sampled_out:
+            self.logger.warning(
+                f"API logger under back-pressure: {self.dropped} records dropped, {self.sampled_out} sampled out"
+            )
     
     def log_request(self, method: str, url: str, headers: Optional[Dict[str, str]] = None, 
                    params: Optional[Dict[str, Any]] = None, data: Optional[Dict[str, Any]] = None,
-                   json_data: Optional[Dict[str, Any]] = None) -> None:
+                   json_data: Optional[Dict[str, Any]] = None) -> Optional[str]:
+        """Log a request and return the correlation id to pass to log_response."""
+        if not self.logger.isEnabledFor(logging.INFO):
+            return SAMPLED_OUT
+        if self.sample_rates and not self._sampled(url):
+            return SAMPLED_OUT
+        
+        correlation_id = f"{self._id_prefix}-{next(self._ids)}"
         request_info = {
+            "id": correlation_id,
             "method": method,
             "url": url,
             "headers": headers,
@@ -43,17 +227,19 @@ class ApiLogger:
         
         request_info = {k: v for k, v in request_info.items() if v is not None}
         
-        try:
-            request_str = json.dumps(request_info, indent=2, ensure_ascii=False)
-            self.logger.info(f"API Request:\n{request_str}")
-        except Exception as e:
-            self.logger.error(f"Error logging request: {e}")
-            self.logger.info(f"API Request: {request_info}")
+        self._emit(logging.INFO, "request", request_info)
+        return correlation_id
     
     def log_response(self, status_code: int, url: str, headers: Optional[Dict[str, str]] = None, 
                     response_text: Optional[str] = None,
-                    response_json: Optional[Dict[str, Any]] = None) -> None:
+                    response_json: Optional[Dict[str, Any]] = None,
+                    correlation_id: Optional[str] = None,
+                    elapsed_ms: Optional[float] = None) -> None:
+        if correlation_id == SAMPLED_OUT or not self.logger.isEnabledFor(logging.INFO):
+            return
+        
         response_info = {
+            "id": correlation_id,
             "url": url,
             "status_code": status_code,
             "headers": headers
@@ -64,26 +250,60 @@ class ApiLogger:
         elif response_text is not None:
             response_info["text"] = response_text
         
-        try:
-            response_str = json.dumps(response_info, indent=2, ensure_ascii=False)
-            self.logger.info(f"API Response:\n{response_str}")
-        except Exception as e:
-            self.logger.error(f"Error logging response: {e}")
-            self.logger.info(f"API Response: {response_info}")
+        if elapsed_ms is not None:
+            response_info["elapsed_ms"] = round(elapsed_ms, 3)
+        
+        self._emit(logging.INFO, "response", {k: v for k, v in response_info.items() if v is not None})
     
-    def log_error(self, error: Exception, url: Optional[str] = None) -> None:
+    def log_event(self, event: str, url: str, correlation_id: Optional[str] = None, **fields) -> None:
+        """Log a client-side event, such as a retry or hedge, for the given request."""
+        if not self.logger.isEnabledFor(logging.INFO):
+            return
+        
+        event_info = {"id": correlation_id or None, "url": url}
+        event_info.update(fields)
+        
+        self._emit(logging.INFO, event, {k: v for k, v in event_info.items() if v is not None})
+    
+    def log_error(self, error: Exception, url: Optional[str] = None, correlation_id: Optional[str] = None) -> None:
         error_info = {
+            "id": correlation_id or None,
             "url": url,
             "error": str(error),
             "error_type": type(error).__name__
         }
         
-        try:
-            error_str = json.dumps(error_info, indent=2, ensure_ascii=False)
-            self.logger.error(f"API Error:\n{error_str}")
-        except Exception as e:
-            self.logger.error(f"Error logging error: {e}")
-            self.logger.error(f"API Error: {error_info}")
+        self._emit(logging.ERROR, "error", {k: v for k, v in error_info.items() if v is not None})
+
+class _LazyApiLogger:
+    """Stands in for the ApiLogger singleton until it is first used.
+    
+    Importing this module must not create the log directory, open files or
+    start the writer thread; that happens on the first attribute access.
+    """
+    
+    def __init__(self):
+        self._instance: Optional[ApiLogger] = None
+        self._lock = threading.Lock()
+    
+    def _get(self) -> ApiLogger:
+        if self._instance is None:
+            with self._lock:
+                if self._instance is None:
+                    self._instance = ApiLogger(
+                        mode=Config.API_LOG_MODE,
+                        queue_size=Config.API_LOG_QUEUE_SIZE,
+                        sample_every=Config.API_LOG_SAMPLE_EVERY,
+                        log_format=Config.API_LOG_FORMAT,
+                        max_body_bytes=Config.API_LOG_MAX_BODY_BYTES,
+                        sample_rates=Config.API_LOG_SAMPLE_RATES,
+                        max_file_bytes=Config.API_LOG_MAX_FILE_BYTES,
+                        backup_count=Config.API_LOG_BACKUP_COUNT
+                    )
+        return self._instance
+    
+    def __getattr__(self, name: str):
+        return getattr(self._get(), name)
 
 # Create a singleton instance
-api_logger = ApiLogger()
\ No newline at end of file
+api_logger = _LazyApiLogger()
\ No newline at end of file
@@ -0,0 +1,151 @@
+"""Session timeline tracing in Chrome trace event format.
+
+``tracer`` collects complete ("X") events: pytest phases from
+``plugins.trace_timeline`` and every ApiClient request. Timestamps are epoch
+microseconds (a perf_counter offset from one wall-clock anchor per process),
+so files from different xdist workers line up. Events are buffered in memory
+and appended to the worker's file in batches; the file is a JSON array that
+stays readable if the worker dies before closing it.
+
+``merge_traces`` combines the per-worker files into one timeline that
+chrome://tracing and ui.perfetto.dev open directly:
+
+    python -m utils.tracing traces/trace-*.json -o traces/session.json
+"""
+import os
+import json
+import time
+import argparse
+import threading
+from contextlib import contextmanager
+from typing import Dict, Any, Iterable, Iterator, List, Optional
+
+# Events held in memory before being appended to the file
+FLUSH_EVERY = 2000
+
+
+class Tracer:
+    """Buffered writer of Chrome trace events for one process; a no-op until ``start``."""
+
+    def __init__(self):
+        self.enabled = False
+        self.path: Optional[str] = None
+        # Fields added to every API span, e.g. the running test's nodeid
+        self.context: Dict[str, Any] = {}
+        self._events: List[Dict[str, Any]] = []
+        self._thread_names: Dict[int, str] = {}
+        self._lock = threading.Lock()
+        self._file = None
+        self._first = True
+        self._pid = os.getpid()
+        self._anchor_us = 0.0
+        self._anchor_perf = 0.0
+
+    def start(self, path: str, process_name: str) -> None:
+        """Open ``path`` and begin recording, naming this process ``process_name`` in the timeline."""
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self.path = path
+        self._file = open(path, "w", encoding="utf-8")
+        self._file.write("[")
+        self._first = True
+        self._pid = os.getpid()
+        self._anchor_us = time.time() * 1e6
+        self._anchor_perf = time.perf_counter()
+        self.enabled = True
+        self._events.append({"name": "process_name", "ph": "M", "pid": self._pid, "args": {"name": process_name}})
+
+    def timestamp(self, perf: float) -> float:
+        """Trace timestamp (epoch microseconds) of a ``time.perf_counter()`` reading."""
+        return self._anchor_us + (perf - self._anchor_perf) * 1e6
+
+    def complete(self, name: str, category: str, start: float, end: float, **args) -> None:
+        """Record a span between two ``time.perf_counter()`` readings."""
+        if not self.enabled:
+            return
+        tid = threading.get_native_id()
+        event = {
+            "name": name, "cat": category, "ph": "X",
+            "ts": round(self.timestamp(start), 3), "dur": round((end - start) * 1e6, 3),
+            "pid": self._pid, "tid": tid,
+            "args": {key: value for key, value in args.items() if value is not None}
+        }
+        with self._lock:
+            if tid not in self._thread_names:
+                self._thread_names[tid] = threading.current_thread().name
+                self._events.append({"name": "thread_name", "ph": "M", "pid": self._pid, "tid": tid,
+                                     "args": {"name": self._thread_names[tid]}})
+            self._events.append(event)
+            full = len(self._events) >= FLUSH_EVERY
+        if full:
+            self.flush()
+
+    @contextmanager
+    def span(self, name: str, category: str, **args) -> Iterator[None]:
+        if not self.enabled:
+            yield
+            return
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.complete(name, category, start, time.perf_counter(), **args)
+
+    def flush(self) -> None:
+        with self._lock:
+            events, self._events = self._events, []
+            if self._file is None or not events:
+                return
+            text = ",\n".join(json.dumps(event, separators=(",", ":"), default=str) for event in events)
+            self._file.write(text if self._first else ",\n" + text)
+            self._first = False
+            self._file.flush()
+
+    def close(self) -> None:
+        if self._file is None:
+            return
+        self.flush()
+        self.enabled = False
+        with self._lock:
+            self._file.write("]\n")
+            self._file.close()
+            self._file = None
+
+tracer = Tracer()
+
+
+def read_trace(path: str) -> List[Dict[str, Any]]:
+    """Events of one worker's file, including a file left unterminated by a crash."""
+    with open(path, encoding="utf-8") as f:
+        text = f.read().strip().rstrip(",")
+    if not text.endswith("]"):
+        text += "]"
+    data = json.loads(text)
+    return data["traceEvents"] if isinstance(data, dict) else data
+
+def merge_traces(paths: Iterable[str], output: str) -> int:
+    """Write the events of ``paths`` as one timeline to ``output``; return the event count."""
+    events: List[Dict[str, Any]] = []
+    seen_metadata = set()
+    for path in paths:
+        for event in read_trace(path):
+            if event.get("ph") == "M":
+                key = (event["name"], event.get("pid"), event.get("tid"))
+                if key in seen_metadata:
+                    continue
+                seen_metadata.add(key)
+            events.append(event)
+    events.sort(key=lambda event: (event.get("ph") != "M", event.get("ts", 0)))
+    with open(output, "w", encoding="utf-8") as f:
+        json.dump({"traceEvents": events, "displayTimeUnit": "ms"}, f, separators=(",", ":"))
+    return len(events)
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Merge per-worker trace files into one Chrome/Perfetto timeline.")
+    parser.add_argument("paths", nargs="+", help="Per-worker trace files")
+    parser.add_argument("-o", "--output", default="session_trace.json")
+    args = parser.parse_args(argv)
+    count = merge_traces(args.paths, args.output)
+    print(f"Wrote {count} events from {len(args.paths)} files to {args.output}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,178 @@
+"""Seeded batch generation of test users.
+
+``generate_test_user()`` makes ~17 Faker provider calls and builds a dict per
+user. ``UserBatch`` instead draws a small pool of Faker values per column once,
+then picks every user's values with a single seeded RNG pass into compact
+column arrays. Records are only materialized as dicts when indexed, and emails
+are unique by construction (batch tag + row index) rather than by a random
+suffix.
+"""
+import os
+import re
+import pickle
+import random
+import threading
+from array import array
+from typing import Dict, Any, Iterator, List, Optional, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from faker import Faker
+
+TITLES = ["Mr", "Mrs", "Miss"]
+
+# Columns drawn from per-batch pools of Faker values
+POOLED_COLUMNS = {
+    "firstname": "first_name",
+    "lastname": "last_name",
+    "company": "company",
+    "address1": "street_address",
+    "address2": "secondary_address",
+    "country": "country",
+    "state": "state",
+    "city": "city",
+    "zipcode": "zipcode",
+    "mobile_number": "phone_number",
+    "domain": "free_email_domain",
+}
+
+_EMAIL_UNSAFE = re.compile(r"[^a-z0-9]+")
+
+_faker: Optional["Faker"] = None
+
+def _seeded_faker(seed: int) -> "Faker":
+    """Return this module's Faker instance, reseeded.
+
+    Kept apart from the shared ``utils.helpers.get_faker()`` instance so that
+    reseeding here never makes other generated data deterministic.
+    """
+    global _faker
+    if _faker is None:
+        from faker import Faker
+        _faker = Faker()
+    _faker.seed_instance(seed)
+    return _faker
+
+
+class UserBatch:
+    """``size`` users generated from ``seed``, stored column-wise."""
+
+    def __init__(self, size: int, seed: int, pool_size: int = 128):
+        self.size = size
+        self.seed = seed
+        self.tag = f"{seed & 0xFFFFFFFFFF:010x}"
+        self.pools: Dict[str, List[str]] = {}
+        self.columns: Dict[str, array] = {}
+        self._generate(min(pool_size, max(size, 1)))
+
+    def _generate(self, pool_size: int) -> None:
+        fake = _seeded_faker(self.seed)
+        for column, provider in POOLED_COLUMNS.items():
+            method = getattr(fake, provider)
+            self.pools[column] = [method() for _ in range(pool_size)]
+        self.pools["password"] = [fake.password(length=12) for _ in range(pool_size)]
+
+        rng = random.Random(self.seed)
+        n = self.size
+        index_type = "H" if pool_size <= 0xFFFF else "I"
+        for column in self.pools:
+            self.columns[column] = array(index_type, rng.choices(range(pool_size), k=n))
+        self.columns["title"] = array("B", rng.choices(range(len(TITLES)), k=n))
+        self.columns["birth_date"] = array("B", rng.choices(range(1, 29), k=n))
+        self.columns["birth_month"] = array("B", rng.choices(range(1, 13), k=n))
+        self.columns["birth_year"] = array("H", rng.choices(range(1970, 2001), k=n))
+
+    def __len__(self) -> int:
+        return self.size
+
+    def __getitem__(self, index: int) -> Dict[str, Any]:
+        if index < 0:
+            index += self.size
+        if not 0 <= index < self.size:
+            raise IndexError(index)
+        columns, pools = self.columns, self.pools
+        first_name = pools["firstname"][columns["firstname"][index]]
+        last_name = pools["lastname"][columns["lastname"][index]]
+        local_part = f"{_EMAIL_UNSAFE.sub('', first_name.lower())}.{_EMAIL_UNSAFE.sub('', last_name.lower())}"
+        return {
+            "name": f"{first_name} {last_name}",
+            "email": f"{local_part}.{self.tag}{index:x}@{pools['domain'][columns['domain'][index]]}",
+            "password": pools["password"][columns["password"][index]],
+            "title": TITLES[columns["title"][index]],
+            "birth_date": str(columns["birth_date"][index]),
+            "birth_month": str(columns["birth_month"][index]),
+            "birth_year": str(columns["birth_year"][index]),
+            "firstname": first_name,
+            "lastname": last_name,
+            "company": pools["company"][columns["company"][index]],
+            "address1": pools["address1"][columns["address1"][index]],
+            "address2": pools["address2"][columns["address2"][index]],
+            "country": pools["country"][columns["country"][index]],
+            "state": pools["state"][columns["state"][index]],
+            "city": pools["city"][columns["city"][index]],
+            "zipcode": pools["zipcode"][columns["zipcode"][index]],
+            "mobile_number": pools["mobile_number"][columns["mobile_number"][index]],
+        }
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        for index in range(self.size):
+            yield self[index]
+
+    @classmethod
+    def load_or_generate(cls, size: int, seed: int, cache_dir: Optional[str] = None, pool_size: int = 128) -> "UserBatch":
+        """Return the batch for ``seed``, reading it from or writing it to ``cache_dir`` if given."""
+        if not cache_dir:
+            return cls(size, seed, pool_size)
+        path = os.path.join(cache_dir, f"users_{seed:x}_{size}_{pool_size}.pkl")
+        try:
+            with open(path, "rb") as f:
+                return pickle.load(f)
+        except (OSError, pickle.UnpicklingError, EOFError):
+            pass
+        batch = cls(size, seed, pool_size)
+        os.makedirs(cache_dir, exist_ok=True)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, "wb") as f:
+            pickle.dump(batch, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, path)
+        return batch
+
+
+class UserStream:
+    """Hands out users one at a time, generating a new batch whenever one runs out.
+
+    Each batch gets its own seed drawn from ``seed`` (or from os.urandom when no
+    seed is given), so emails stay unique across batches. ``stream_id`` is mixed
+    into a fixed seed, so processes sharing one (xdist workers, load generator
+    processes) each get their own reproducible sequence instead of all creating
+    the same accounts. Batches start small and double up to ``batch_size`` so a
+    session that only needs a handful of users does not pay for a thousand.
+    """
+
+    def __init__(self, batch_size: int = 1000, seed: Optional[int] = None, cache_dir: Optional[str] = None,
+                 stream_id: Optional[str] = None):
+        self.batch_size = batch_size
+        self.cache_dir = cache_dir
+        self._lock = threading.Lock()
+        self.reseed(seed, stream_id if stream_id is not None else os.getenv("PYTEST_XDIST_WORKER", ""))
+
+    def reseed(self, seed: Optional[int], stream_id: str = "") -> None:
+        """Start a new sequence from ``seed`` and ``stream_id``."""
+        with self._lock:
+            self._next_size = min(64, self.batch_size)
+            # str seeds are hashed with sha512, so this is stable across runs
+            self._seeds = random.Random(
+                f"{seed}:{stream_id}" if seed is not None else int.from_bytes(os.urandom(8), "big")
+            )
+            self._batch: Optional[UserBatch] = None
+            self._next = 0
+
+    def next_user(self) -> Dict[str, Any]:
+        with self._lock:
+            if self._batch is None or self._next >= len(self._batch):
+                seed = self._seeds.getrandbits(64)
+                self._batch = UserBatch.load_or_generate(self._next_size, seed, self.cache_dir)
+                self._next_size = min(self._next_size * 2, self.batch_size)
+                self._next = 0
+            index = self._next
+            self._next += 1
+        return self._batch[index]